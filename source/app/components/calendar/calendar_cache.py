@@ -0,0 +1,223 @@
+"""
+Shared month-window cache for calendar views.
+
+Calendar views ask the cache for the entries of the month they display instead
+of querying the database on every navigation click. Entries are cached per
+(source, year, month) with LRU eviction, and the months adjacent to the one
+being displayed are loaded on a background thread so that prev/next navigation
+is served from memory. The prefetch thread checks out its own connection from
+the database it is given; it never shares the UI thread's connection, and no
+prefetch runs for databases that keep one connection for every thread.
+
+Loaders raise on failure (see MonthLoadError); nothing is cached for a month
+that failed to load.
+
+Writers invalidate in the service layer (app.service), after a successful
+write, so every caller is covered, not only the calendar dialogs:
+
+    TRAINING_SESSIONS      srv_training_session save/delete/recurring series
+    SERVICE_APPOINTMENTS   srv_appointment save/delete, srv_import appointments
+    EMPLOYEE_CONTRACTS     srv_employee_contract save/delete, and srv_employee
+                           save/delete (contract pills show the employee name)
+"""
+
+import threading
+import time
+import traceback
+from collections import OrderedDict
+
+from librepy.pybrex.values import pybrex_logger
+
+logger = pybrex_logger(__name__)
+
+# Cache sources (one per calendar data set)
+TRAINING_SESSIONS = 'training_sessions'
+SERVICE_APPOINTMENTS = 'service_appointments'
+EMPLOYEE_CONTRACTS = 'employee_contracts'
+
+DEFAULT_MAX_MONTHS = 24          # Cached month windows across all sources
+DEFAULT_MAX_AGE = 300            # Seconds before a cached month is reloaded
+DEFAULT_WAIT_TIMEOUT = 30        # Seconds to wait for an in-flight prefetch
+
+
+class MonthLoadError(Exception):
+    """Raised by a month loader whose query failed, so the month is not cached."""
+
+
+def shift_month(year, month, delta):
+    """Return (year, month) moved by delta months."""
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
+
+
+class CalendarCache:
+    """Thread-safe LRU cache of calendar month data keyed by (source, year, month).
+
+    Values are whatever the loader returns for a month (the calendar views store
+    their 'YYYY-MM-DD' -> [entry, ...] dict). Each source carries a generation
+    counter; invalidate() bumps it so results of loads that were already running
+    when the data changed are discarded instead of being cached.
+    """
+
+    def __init__(self, max_months=DEFAULT_MAX_MONTHS, max_age=DEFAULT_MAX_AGE):
+        self.max_months = max_months
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()    # key -> (loaded_at, data)
+        self._inflight = {}              # key -> threading.Event
+        self._generations = {}           # source -> int
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source, year, month, loader):
+        """Return the data for a month, loading it synchronously on a miss.
+
+        If a background prefetch for the same month is running, wait for it
+        rather than issuing a second query.
+        """
+        key = (source, year, month)
+        with self._lock:
+            data = self._lookup(key)
+            if data is not None:
+                self.hits += 1
+                return data
+            event = self._inflight.get(key)
+
+        if event is not None:
+            event.wait(DEFAULT_WAIT_TIMEOUT)
+            with self._lock:
+                data = self._lookup(key)
+                if data is not None:
+                    self.hits += 1
+                    return data
+
+        with self._lock:
+            self.misses += 1
+            generation = self._generations.get(source, 0)
+        data = loader(year, month)
+        self._store(key, generation, data)
+        return data
+
+    def prefetch(self, source, year, month, loader, database, radius=1):
+        """Load the months around (year, month) on a background thread.
+
+        The loads run inside database.connection_context() on the worker, so
+        the database must keep connection state per thread (peewee
+        thread_safe, e.g. PooledSDBCPostgresqlDatabase); otherwise nothing is
+        prefetched and the months load on demand. Months already cached or
+        being loaded are skipped.
+
+        Returns:
+            bool: True if a prefetch was started
+        """
+        if database is None or not getattr(database, 'thread_safe', False):
+            return False
+        keys = []
+        with self._lock:
+            for delta in range(-radius, radius + 1):
+                if delta == 0:
+                    continue
+                y, m = shift_month(year, month, delta)
+                key = (source, y, m)
+                if self._lookup(key) is not None or key in self._inflight:
+                    continue
+                self._inflight[key] = threading.Event()
+                keys.append(key)
+            generation = self._generations.get(source, 0)
+        if not keys:
+            return False
+
+        thread = threading.Thread(
+            target=self._run_prefetch,
+            args=(keys, generation, loader, database),
+            name=f"calendar-prefetch-{source}",
+            daemon=True,
+        )
+        thread.start()
+        return True
+
+    def invalidate(self, source=None):
+        """Drop cached months for a source (or for every source when None)."""
+        with self._lock:
+            if source is None:
+                sources = set(self._generations) | {key[0] for key in self._entries}
+                self._entries.clear()
+            else:
+                sources = {source}
+                for key in [k for k in self._entries if k[0] == source]:
+                    del self._entries[key]
+            for src in sources:
+                self._generations[src] = self._generations.get(src, 0) + 1
+        logger.debug(f"Calendar cache invalidated: {source or 'all sources'}")
+
+    def stats(self):
+        """Return cache counters for diagnostics."""
+        with self._lock:
+            return {
+                'months': len(self._entries),
+                'max_months': self.max_months,
+                'inflight': len(self._inflight),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        loaded_at, data = entry
+        if self.max_age is not None and time.time() - loaded_at > self.max_age:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return data
+
+    def _store(self, key, generation, data):
+        with self._lock:
+            if self._generations.get(key[0], 0) != generation:
+                # Data changed while this month was loading
+                return False
+            self._entries[key] = (time.time(), data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_months:
+                self._entries.popitem(last=False)
+            return True
+
+    def _run_prefetch(self, keys, generation, loader, database):
+        try:
+            # This thread's own (pooled) connection, returned when done
+            with database.connection_context():
+                for key in keys:
+                    try:
+                        _, year, month = key
+                        data = loader(year, month)
+                        self._store(key, generation, data)
+                    except Exception as e:
+                        logger.error(f"Calendar prefetch failed for {key}: {e}")
+                        logger.error(traceback.format_exc())
+                    finally:
+                        self._finish(key)
+        except Exception as e:
+            logger.error(f"Calendar prefetch could not connect: {e}")
+        finally:
+            for key in keys:
+                self._finish(key)
+
+    def _finish(self, key):
+        with self._lock:
+            event = self._inflight.pop(key, None)
+        if event is not None:
+            event.set()
+
+
+_calendar_cache = CalendarCache()
+
+
+def get_calendar_cache():
+    """Return the process-wide calendar cache."""
+    return _calendar_cache
+
+
+def invalidate(source=None):
+    """Invalidate cached months for a source on the shared cache."""
+    _calendar_cache.invalidate(source)
@@ -6,6 +6,8 @@ from com.sun.star.awt.ScrollBarOrientation import VERTICAL as SB_VERT
 import traceback
 import calendar
 from datetime import datetime, timedelta
+from librepy.app.components.calendar.calendar_cache import get_calendar_cache
+from librepy.peewee.db_model.base_model import database_proxy
 #Import DAOs here
 
 # Calendar configuration constants
@@ -13,6 +15,8 @@ DEFAULT_WEEK_ROW_HEIGHT = 130  # Fixed height per week row (will become dynamic)
 
 class Calendar(ctr_container.Container):
     component_name = 'calendar'
+    # Shared month-cache source; subclasses that implement fetch_month_data set this
+    cache_source = None
 
     def __init__(self, parent, ctx, smgr, frame, ps, title="Calendar"):
         self.parent = parent          
@@ -80,6 +84,10 @@ class Calendar(ctr_container.Container):
         self.day_headers = {}    # Store day header labels (Sun, Mon, etc.)
         self.day_labels = {}     # Store day label controls
         self.entry_labels = {}  # Store rendered entry label controls
+        self._spare_entries = []  # Pooled (control name, button) pairs not used by the current render
+        self._entry_slots = {}    # Rendered entry name → pooled control name
+        self._entry_targets = {}  # Pooled control name → entry id dispatched on click
+        self._entry_seq = 0       # Counter for unique pooled control names
         
         # Scrollbar-related properties
         self.scroll_offset = 0
@@ -282,21 +290,18 @@ class Calendar(ctr_container.Container):
         cell_width = self.calendar_config['cell_width']
         day_label_height = self.calendar_config['day_label_height']
         
-        # Clear existing day headers
-        for header_name, header in self.day_headers.items():
-            try:
-                header.dispose()
-            except:
-                pass
-        self.day_headers.clear()
-        
-        # Day headers - store them for resizing
+        # Day headers - reuse existing controls, only reposition them
         days = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
         for i, day in enumerate(days):
             header_name = f"lblDayHeader{i}"
+            header_x = grid_start_x + (i * cell_width)
+            day_header = self.day_headers.get(header_name)
+            if day_header is not None:
+                day_header.setPosSize(header_x, grid_start_y - 32, cell_width, 28, POSSIZE)
+                continue
             day_header = self.add_label(
                 header_name,
-                grid_start_x + (i * cell_width), grid_start_y - 32,
+                header_x, grid_start_y - 32,
                 cell_width, 28,
                 Label=day,
                 FontHeight=12,
@@ -307,14 +312,8 @@ class Calendar(ctr_container.Container):
             )
             self.day_headers[header_name] = day_header
         
-        # Clear existing day labels
-        for lbl_name, lbl in self.day_labels.items():
-            try:
-                lbl.dispose()
-            except:
-                pass
-        self.day_labels.clear()
-        self._clear_entries()
+        # Return rendered entries to the pool; they are reused by _render_single_entry
+        self._recycle_entries()
 
         # Generate calendar data
         cal = calendar.Calendar(6)  # Start week on Sunday
@@ -364,29 +363,20 @@ class Calendar(ctr_container.Container):
                     is_current_month = date.month == self.current_date.month
                     text_color = 0x000000 if is_current_month else 0x999999
                     
-                    # Create day label
-                    day_label_name = f"dayLabel_{date.day}_{date.month}_{date.year}"
-                    day_label = self.add_label(
-                        day_label_name,
-                        x, day_label_y, cell_width, day_label_height,
-                        Label=str(date.day),
-                        FontHeight=11,
-                        FontWeight=150,
-                        TextColor=text_color,
-                        BackgroundColor=self.calendar_config['colors']['day_label_bg'],
-                        Border=1
-                    )
-                    
-                    self.day_labels[day_label_name] = day_label
-                    
-                    # Cache day label position with row index
+                    # Reuse the day label slot for this grid position
                     row_index = len(self.calendar_rows) - 1
-                    self._base_positions[day_label_name] = (x, day_label_y, cell_width, day_label_height, row_index)
+                    self._place_day_label(
+                        day_index, date, x, day_label_y, cell_width, day_label_height, text_color, row_index
+                    )
 
                     self._render_entries_for_day(date, x, day_label_y, cell_width, row_index)
             
             row_heights[week_num] = max(day_label_height, DEFAULT_WEEK_ROW_HEIGHT)
         
+        # Dispose only the controls this month did not need
+        self._dispose_surplus_day_labels(len(month_days))
+        self._dispose_spare_entries()
+
         # Store final row data
         self.row_heights = row_heights
         
@@ -522,17 +512,53 @@ class Calendar(ctr_container.Container):
         self._create_calendar_grid()
 
     def load_calendar_data(self):
-        """Hook: Load calendar data for the currently visible month.
+        """Load calendar data for the currently visible month.
+        
+        Subclasses that set cache_source and implement fetch_month_data are served
+        from the shared month cache; the adjacent months are prefetched in the
+        background (on the worker's own pooled connection) so prev/next
+        navigation does not wait on the database.
+        Subclasses may still override this hook entirely.
+        
+        Base implementation without a cache_source: no-op, leaves self.calendar_data
+        unchanged (or empty).
+        """
+        if self.cache_source is None:
+            return
+        year, month = self.current_date.year, self.current_date.month
+        cache = get_calendar_cache()
+        try:
+            self.calendar_data = cache.get(self.cache_source, year, month, self.fetch_month_data)
+        except Exception as e:
+            self.logger.error(f"Error loading calendar data ({self.cache_source} {year}-{month:02d}): {e}")
+            self.logger.error(traceback.format_exc())
+            self.calendar_data = {}
+            return
+        try:
+            cache.prefetch(self.cache_source, year, month, self.fetch_month_data, database_proxy.obj)
+        except Exception as e:
+            self.logger.debug(f"Calendar prefetch not started: {e}")
+
+    def fetch_month_data(self, year, month):
+        """Hook: Query and normalize the entries displayed for a month grid.
         
         Responsibility (for subclasses):
-        - Determine the visible month date range based on self.current_date.
-        - Populate self.calendar_data as a dict keyed by 'YYYY-MM-DD' → list of entry dicts.
+        - Query the full grid range of (year, month), see get_month_date_range.
+        - Return a dict keyed by 'YYYY-MM-DD' → list of entry dicts.
           Example: {'2025-10-31': [{'id': 1, 'title': 'Example', 'date': '2025-10-31'}]}.
-        - Do not perform any rendering here; just load/normalize data.
-        
-        Base implementation: no-op, leaves self.calendar_data unchanged (or empty).
+        - Do not touch UI state here; it may run on a background prefetch thread.
+        - Raise on failure (calendar_cache.MonthLoadError when a DAO call returns
+          its error value) so an error result is not cached.
         """
-        return
+        return {}
+
+    @staticmethod
+    def get_month_date_range(year, month):
+        """Return the first and last date of the Sunday-first grid for a month."""
+        month_days = list(calendar.Calendar(6).itermonthdates(year, month))
+        if not month_days:
+            return None, None
+        return month_days[0], month_days[-1]
     
     def get_display_date_range(self):
         """Return the inclusive date range currently displayed in the month grid.
@@ -570,49 +596,122 @@ class Calendar(ctr_container.Container):
         self.logger.info(f"Calendar entry double-clicked: id={entry_id}")
 
     def _clear_entries(self):
-        """Dispose and clear all rendered entry controls and their cached positions.
+        """Dispose and clear all entry controls, rendered and pooled.
         
         Default implementation works for any subclass that registers controls in
         self.entry_labels and caches their base positions in self._base_positions
         as (x, y, w, h, row_index).
         """
         try:
-            for name, ctrl in list(self.entry_labels.items()):
+            self._recycle_entries()
+        finally:
+            self._dispose_spare_entries()
+
+    def _recycle_entries(self):
+        """Move rendered entry controls back to the pool without disposing them."""
+        for name, ctrl in list(self.entry_labels.items()):
+            self._base_positions.pop(name, None)
+            self._spare_entries.append((self._entry_slots.pop(name, None), ctrl))
+        self.entry_labels.clear()
+
+    def _dispose_spare_entries(self):
+        """Dispose pooled entry controls left unused by the current render."""
+        while self._spare_entries:
+            ctrl_name, ctrl = self._spare_entries.pop()
+            self._entry_targets.pop(ctrl_name, None)
+            self._controls.pop(ctrl_name, None)
+            try:
+                ctrl.dispose()
+            except Exception:
+                pass
+
+    def _place_day_label(self, day_index, date, x, y, w, h, text_color, row_index):
+        """Show the day label for grid position day_index, reusing its control.
+        
+        Day labels are pooled per grid slot, so a month change only relabels,
+        recolors and repositions them.
+        """
+        day_label_name = f"dayLabel_{day_index}"
+        day_label = self.day_labels.get(day_label_name)
+        if day_label is None:
+            day_label = self.add_label(
+                day_label_name,
+                x, y, w, h,
+                Label=str(date.day),
+                FontHeight=11,
+                FontWeight=150,
+                TextColor=text_color,
+                BackgroundColor=self.calendar_config['colors']['day_label_bg'],
+                Border=1
+            )
+            self.day_labels[day_label_name] = day_label
+        else:
+            model = day_label.Model
+            model.Label = str(date.day)
+            model.TextColor = text_color
+            day_label.setPosSize(x, y, w, h, POSSIZE)
+            day_label.setVisible(True)
+
+        # Cache day label position with row index
+        self._base_positions[day_label_name] = (x, y, w, h, row_index)
+        return day_label_name
+
+    def _dispose_surplus_day_labels(self, used_count):
+        """Dispose day label slots beyond the number of days in the current grid."""
+        for day_index in range(used_count, len(self.day_labels)):
+            day_label_name = f"dayLabel_{day_index}"
+            day_label = self.day_labels.pop(day_label_name, None)
+            self._base_positions.pop(day_label_name, None)
+            self._controls.pop(day_label_name, None)
+            if day_label is not None:
                 try:
-                    ctrl.dispose()
+                    day_label.dispose()
                 except Exception:
                     pass
-                if name in self._base_positions:
-                    try:
-                        del self._base_positions[name]
-                    except Exception:
-                        pass
-        finally:
-            self.entry_labels.clear()
 
     def _render_single_entry(self, entry_name, text, x, y, w, h, row_index, background_color=None, entry_id=None, text_color=None):
         """Render a single entry control (button) and cache its base position.
         
-        Creates a pill-like button control, registers it in self.entry_labels,
-        and caches the base position in self._base_positions for scrolling.
-        Binds click/double-click to self._on_entry_click(ev, entry_id).
-        Subclasses can override to customize control creation; _render_entries_for_day
-        will call this method for each entry.
+        Takes a pill-like button from the entry pool (creating one only when the
+        pool is empty), registers it in self.entry_labels under entry_name, and
+        caches the base position in self._base_positions for scrolling.
+        Clicks on the control dispatch to self.on_entry_click(ev, entry_id) with
+        the id of the entry it currently shows. Subclasses can override to
+        customize control creation; _render_entries_for_day will call this
+        method for each entry.
         """
         if background_color is None:
             background_color = 0xD6EAF8
-        btn = self.add_button(
-            entry_name,
-            x, y, w, h,
-            Label=str(text or ''),
-            FontHeight=self.calendar_config.get('job_font_size', 10),
-            FontWeight=150,
-            TextColor=text_color,
-            BackgroundColor=background_color,
-            Border=0
-        )
-        # Bind double-click listener if available; fallback to action listener
-        self.listeners.add_mouse_listener(btn, pressed=lambda ev, eid=entry_id: self.on_entry_click(ev, eid))
+        props = {
+            'Label': str(text or ''),
+            'FontHeight': self.calendar_config.get('job_font_size', 10),
+            'FontWeight': 150,
+            'TextColor': text_color,
+            'BackgroundColor': background_color,
+        }
+        ctrl_name = None
+        while self._spare_entries and ctrl_name is None:
+            ctrl_name, btn = self._spare_entries.pop()
+            if ctrl_name is None:
+                # Not created by the pool (no click dispatch); drop it
+                try:
+                    btn.dispose()
+                except Exception:
+                    pass
+        if ctrl_name is not None:
+            btn.Model.setPropertyValues(tuple(props.keys()), tuple(props.values()))
+            btn.setPosSize(x, y, w, h, POSSIZE)
+            btn.setVisible(True)
+        else:
+            self._entry_seq += 1
+            ctrl_name = f"pillbtn_{self._entry_seq}"
+            btn = self.add_button(ctrl_name, x, y, w, h, Border=0, **props)
+            # One listener per control; it looks up the entry the control shows now
+            self.listeners.add_mouse_listener(
+                btn, pressed=lambda ev, n=ctrl_name: self.on_entry_click(ev, self._entry_targets.get(n))
+            )
+        self._entry_targets[ctrl_name] = entry_id
+        self._entry_slots[entry_name] = ctrl_name
 
         self.entry_labels[entry_name] = btn
         self._base_positions[entry_name] = (x, y, w, h, row_index)
@@ -4,7 +4,7 @@ from librepy.app.components.service_appointment.service_appt_dlg import ServiceA
 from librepy.app.components.service_appointment.print_list_date_range_dlg import (
     PrintListDateRangeDialog,
 )
-import calendar as py_calendar
+from librepy.app.components.calendar import calendar_cache
 import traceback
 
 
@@ -18,6 +18,7 @@ class AppointmentCalendar(Calendar):
 
     # Unique component name used for routing/navigation
     component_name = 'appointment_calendar'
+    cache_source = calendar_cache.SERVICE_APPOINTMENTS
 
     def __init__(self, parent, ctx, smgr, frame, ps):
         super().__init__(parent, ctx, smgr, frame, ps, title="Service Appointments")
@@ -60,7 +61,7 @@ class AppointmentCalendar(Calendar):
             query_text = SERVICE_APPOINTMENTS_QUERY
             self.logger.info(f"Printing Service Appointments calendar: {start_date} - {end_date}")
             save_calendar_range_as_pdf(start_date, end_date, query_text)
-            self.logger.info("Service Appointments calendar PDF export invoked")
+            self.logger.info("Service Appointments calendar PDF export queued")
         except Exception as e:
             self.logger.error(f"Failed to print Service Appointments calendar: {e}")
             self.logger.error(traceback.format_exc())
@@ -82,7 +83,7 @@ class AppointmentCalendar(Calendar):
                     f"Printing Service Appointments list for date range: start={start_date}, end={end_date}"
                 )
                 print_service_appointments_list(start_date, end_date)
-                self.logger.info("Service Appointments list report invoked")
+                self.logger.info("Service Appointments list report queued")
         except Exception as e:
             self.logger.error(f"Failed opening Print List dialog: {e}")
             self.logger.error(traceback.format_exc())
@@ -116,45 +117,37 @@ class AppointmentCalendar(Calendar):
             self.logger.error(f"Failed to open Service Appointment for edit (id={entry_id}): {e}")
             self.logger.error(traceback.format_exc())
 
-    def load_calendar_data(self):
-        """Load service appointments for the visible month into self.calendar_data.
+    def fetch_month_data(self, year, month):
+        """Load service appointments for a month grid.
 
-        Populates: self.calendar_data = { 'YYYY-MM-DD': [ {id, date, title, status}, ... ] }
+        Returns: { 'YYYY-MM-DD': [ {id, date, title, status, color}, ... ] }
         """
-        try:
-            cal = py_calendar.Calendar(6)  # Sunday-first
-            dates_iter = list(cal.itermonthdates(self.current_date.year, self.current_date.month))
-            if not dates_iter:
-                self.calendar_data = {}
-                return
-
-            start_day = dates_iter[0]
-            end_day = dates_iter[-1]
-
-            dao = ServiceAppointmentDAO(self.logger)
-            appts = dao.get_appointments_between(start_day, end_day)
-
-            grouped = {}
-            for a in appts or []:
-                dt = a.get('date')
-                if hasattr(dt, 'strftime'):
-                    date_key = dt.strftime('%Y-%m-%d')
-                elif isinstance(dt, str):
-                    date_key = dt
-                else:
-                    # Skip invalid
-                    continue
-                a_norm = {
-                    'id': a.get('id'),
-                    'date': date_key,
-                    'title': a.get('title'),
-                    'status': a.get('status'),
-                    'color': 0xebb056,
-                }
-                grouped.setdefault(date_key, []).append(a_norm)
-
-            self.calendar_data = grouped
-        except Exception as e:
-            self.logger.error(f"Error loading service appointments: {e}")
-            self.logger.error(traceback.format_exc())
-            self.calendar_data = {}
+        start_day, end_day = self.get_month_date_range(year, month)
+        if not start_day:
+            return {}
+
+        dao = ServiceAppointmentDAO(self.logger)
+        appts = dao.get_appointments_between(start_day, end_day, none_on_error=True)
+        if appts is None:
+            raise calendar_cache.MonthLoadError(f"Could not load {year}-{month:02d}")
+
+        grouped = {}
+        for a in appts or []:
+            dt = a.get('date')
+            if hasattr(dt, 'strftime'):
+                date_key = dt.strftime('%Y-%m-%d')
+            elif isinstance(dt, str):
+                date_key = dt
+            else:
+                # Skip invalid
+                continue
+            a_norm = {
+                'id': a.get('id'),
+                'date': date_key,
+                'title': a.get('title'),
+                'status': a.get('status'),
+                'color': 0xebb056,
+            }
+            grouped.setdefault(date_key, []).append(a_norm)
+
+        return grouped
@@ -53,8 +53,9 @@ class AttendanceTab(BaseTab):
             return
         dao = SessionAttendeeDAO(self.logger)
         rows = dao.get_attendance_for_grid(self.session_id) or []
-        # Set heading to 'id' so active_row_heading returns attendee id
-        self.grid_base.set_data(rows, heading='id')
+        # Key rows on 'id' so active_row_heading returns attendee id; only
+        # changed rows are touched so selection/scroll survive a toggle
+        self.grid_base.sync(rows, key='id')
 
     def on_row_double_click(self, ev=None):
         if not (ev and ev.Buttons == 1 and ev.ClickCount == 2):
@@ -137,7 +137,8 @@ class PeopleTab(BaseTab):
             return
         dao = SessionAttendeeDAO(self.logger)
         rows = dao.get_all_for_grid(self.session_id) or []
-        self.grid_base.set_data(rows, heading='id')
+        # Apply only the rows that changed so selection/scroll survive a save
+        self.grid_base.sync(rows, key='id')
 
     def commit(self) -> dict:
         # People grid does not contribute to session save payload currently
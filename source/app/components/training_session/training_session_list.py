@@ -1,11 +1,14 @@
 import traceback
-import time as _time
 from librepy.pybrex import ctr_container
+from librepy.pybrex.debounce import Debouncer
 from librepy.pybrex.values import pybrex_logger
 from com.sun.star.awt.PosSize import POSSIZE
 from librepy.pybrex.values import GRID_HEADER_BG_COLOR
 from librepy.app.data.dao.training_session_dao import TrainingSessionDAO
 
+# Rows fetched per grid page while scrolling
+GRID_PAGE_SIZE = 100
+
 class TrainingSessionList(ctr_container.Container):
     component_name = 'training_session_list'
 
@@ -18,11 +21,9 @@ class TrainingSessionList(ctr_container.Container):
         self.ps = ps
 
         # UI state
-        self._all_rows = []
         self._search_text = ''
-        self._debounce_handle = None
-        self._debounce_last = 0
         self._debounce_ms = 300
+        self._search_debouncer = Debouncer(ctx, smgr, self.load_data, delay_ms=self._debounce_ms)
 
         # Toolbar offset (if parent adds one)
         self.toolbar_offset = 0
@@ -112,66 +113,45 @@ class TrainingSessionList(ctr_container.Container):
 
     def load_data(self, search_query=None):
         try:
+            # Server-side filter; the grid pages matching rows in as it scrolls
+            sq = (search_query if search_query is not None else self._search_text or '').strip()
             dao = TrainingSessionDAO(self.logger)
-            data = dao.get_training_sessions() or []
-
-            # Client-side filter
-            sq = (search_query if search_query is not None else self._search_text or '').strip().lower()
-            if sq:
-                def contains(s):
-                    return sq in (str(s or '')).lower()
-                filtered = []
-                for r in data:
-                    if contains(r.get('name')) or contains(r.get('teacher_name')) or contains(r.get('session_date')) or contains(r.get('session_time')):
-                        filtered.append(r)
-                data = filtered
-
-            # Guarantee id/heading
-            for r in data:
-                if not r.get('id'):
-                    # Build composite heading
-                    r['id'] = f"{r.get('name','')}|{r.get('session_date','')}|{r.get('session_time','')}"
-                p = r.get('price', None)
-                if p is None or p == '':
-                    r['price'] = ''
-                else:
-                    # Convert to float then format with 2 decimals
-                    r['price'] = f"${float(p):.2f}"
-            self._all_rows = data
-
-            # Set to grid
-            self.grid_base.set_data(data, heading='id')
+            source = dao.search_source(sq, formatter=self._format_row)
+            self.grid_base.set_source(source, heading='id', page_size=GRID_PAGE_SIZE)
         except Exception as e:
             self.logger.error(f"Failed loading sessions: {e}")
             self.logger.error(traceback.format_exc())
 
+    @staticmethod
+    def _format_row(r):
+        # Guarantee id/heading
+        if not r.get('id'):
+            # Build composite heading
+            r['id'] = f"{r.get('name','')}|{r.get('session_date','')}|{r.get('session_time','')}"
+        p = r.get('price', None)
+        if p is None or p == '':
+            r['price'] = ''
+        else:
+            # Convert to float then format with 2 decimals
+            r['price'] = f"${float(p):.2f}"
+        return r
+
     def refresh_entries(self, event=None):
         self.load_data()
 
     def search_data(self, event=None):
-        # Use current text field, trigger load
+        # Use current text field, trigger load now (drops any pending debounced search)
         try:
             self._search_text = self.txt_search.getText()
         except Exception:
             pass
+        self._search_debouncer.cancel()
         self.load_data()
 
     def _on_search_text_changed(self, ev=None):
-        # Debounced handler
-        now = _time.time()
+        # Debounced handler: query once typing pauses for _debounce_ms
         self._search_text = self.txt_search.getText()
-        self._debounce_last = now
-
-        def do_after_delay():
-            try:
-                # Only act if no newer input occurred within debounce window
-                if (now == self._debounce_last) or ((_time.time() - now) * 1000 >= self._debounce_ms and self._debounce_last == now):
-                    self.load_data()
-            except Exception:
-                pass
-        # There is no built-in timer here; rely on user pressing Enter or Search.
-        # Still call immediate filter for responsiveness
-        self.load_data()
+        self._search_debouncer.trigger()
 
     def _on_search_key_pressed(self, ev):
         try:
@@ -325,6 +305,7 @@ class TrainingSessionList(ctr_container.Container):
     def dispose(self):
         try:
             self.logger.info("Disposing TrainingSessionList")
+            self._search_debouncer.cancel()
             if hasattr(self, 'container') and self.container is not None:
                 try:
                     try:
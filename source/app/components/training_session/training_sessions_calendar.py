@@ -4,7 +4,7 @@ from librepy.app.components.training_session.training_session_entry_dlg import T
 from librepy.app.components.service_appointment.print_list_date_range_dlg import (
     PrintListDateRangeDialog,
 )
-import calendar as py_calendar
+from librepy.app.components.calendar import calendar_cache
 import traceback
 
 
@@ -18,6 +18,7 @@ class TrainingSessionsCalendar(Calendar):
 
     # Keep the same component name so route/screen stays unchanged
     component_name = 'calendar'
+    cache_source = calendar_cache.TRAINING_SESSIONS
 
     def __init__(self, parent, ctx, smgr, frame, ps):
         super().__init__(parent, ctx, smgr, frame, ps, title="Training Sessions")
@@ -63,7 +64,7 @@ class TrainingSessionsCalendar(Calendar):
             query_text = CALENDAR_EVENTS_QUERY
             self.logger.info(f"Invoking PDF export for range {start_date} - {end_date}")
             save_calendar_range_as_pdf(start_date, end_date, query_text)
-            self.logger.info("Calendar PDF export invoked successfully")
+            self.logger.info("Calendar PDF export queued")
         except Exception as e:
             self.logger.error(f"Error printing calendar: {e}")
             self.logger.error(traceback.format_exc())
@@ -104,7 +105,7 @@ class TrainingSessionsCalendar(Calendar):
                     f"Printing Training Sessions list for date range: start={start_date}, end={end_date}"
                 )
                 print_training_sessions_list(start_date, end_date)
-                self.logger.info("Training Sessions list report invoked")
+                self.logger.info("Training Sessions list report queued")
         except Exception as e:
             self.logger.error(f"Failed opening Print List dialog: {e}")
             self.logger.error(traceback.format_exc())
@@ -123,45 +124,36 @@ class TrainingSessionsCalendar(Calendar):
             self.logger.error(f"Failed to open Training Session for edit (id={entry_id}): {e}")
             self.logger.error(traceback.format_exc())
 
-    def load_calendar_data(self):
-        """Load training sessions for the visible month into self.calendar_data.
+    def fetch_month_data(self, year, month):
+        """Load training sessions for a month grid.
 
-        Populates: self.calendar_data = { 'YYYY-MM-DD': [ {id, date, title, color}, ... ] }
+        Returns: { 'YYYY-MM-DD': [ {id, date, title, color}, ... ] }
         """
-        try:
-            cal = py_calendar.Calendar(6)  # Sunday-first
-            dates_iter = list(cal.itermonthdates(self.current_date.year, self.current_date.month))
-            if not dates_iter:
-                self.calendar_data = {}
-                return
-
-            start_day = dates_iter[0]
-            end_day = dates_iter[-1]
-
-            dao = TrainingSessionDAO(self.logger)
-            sessions = dao.get_sessions_between(start_day, end_day)
-
-            grouped = {}
-            for s in sessions or []:
-                dt = s.get('date')
-                if hasattr(dt, 'strftime'):
-                    date_key = dt.strftime('%Y-%m-%d')
-                elif isinstance(dt, str):
-                    date_key = dt
-                else:
-                    # Skip invalid
-                    continue
-                s_norm = {
-                    'id': s.get('id'),
-                    'date': date_key,
-                    'title': s.get('title'),
-                    'color': 0x72ab8a,
-                }
-                grouped.setdefault(date_key, []).append(s_norm)
-
-            self.calendar_data = grouped
-        except Exception as e:
-            self.logger.error(f"Error loading training sessions: {e}")
-            self.logger.error(traceback.format_exc())
-            self.calendar_data = {}
-
+        start_day, end_day = self.get_month_date_range(year, month)
+        if not start_day:
+            return {}
+
+        dao = TrainingSessionDAO(self.logger)
+        sessions = dao.get_sessions_between(start_day, end_day, none_on_error=True)
+        if sessions is None:
+            raise calendar_cache.MonthLoadError(f"Could not load {year}-{month:02d}")
+
+        grouped = {}
+        for s in sessions or []:
+            dt = s.get('date')
+            if hasattr(dt, 'strftime'):
+                date_key = dt.strftime('%Y-%m-%d')
+            elif isinstance(dt, str):
+                date_key = dt
+            else:
+                # Skip invalid
+                continue
+            s_norm = {
+                'id': s.get('id'),
+                'date': date_key,
+                'title': s.get('title'),
+                'color': 0x72ab8a,
+            }
+            grouped.setdefault(date_key, []).append(s_norm)
+
+        return grouped
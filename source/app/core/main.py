@@ -15,6 +15,7 @@ For example, to import a file named config, use the following:
 from librepy import config
 '''
 import traceback
+from contextlib import nullcontext
 from librepy.utils.window_geometry_config_manager import WindowGeometryConfigManager
 
 from librepy.pybrex.values import pybrex_logger
@@ -23,7 +24,7 @@ logger = pybrex_logger(__name__)
 class App(object):
     """App application"""
     
-    def __init__(self, ctx, smgr):
+    def __init__(self, ctx, smgr, profiler=None):
         self.logger = logger
         self.logger.info("APP: Initializing App application")
         
@@ -56,17 +57,18 @@ class App(object):
         self.create_sidebar_manager(hidden=False)
         
         try:
-            from librepy.app.core.component_manager import ComponentManager
-            self.component_manager = ComponentManager(
-                self,
-                self.ctx,
-                self.smgr,
-                self.frame_manager,
-                self.ps
-            )
-            
-            self.active_screen = 'training_session_list'
-            self.component_manager.switch_component(self.active_screen)
+            with profiler.stage("COMPONENT_LOAD") if profiler else nullcontext():
+                from librepy.app.core.component_manager import ComponentManager
+                self.component_manager = ComponentManager(
+                    self,
+                    self.ctx,
+                    self.smgr,
+                    self.frame_manager,
+                    self.ps
+                )
+                
+                self.active_screen = 'training_session_list'
+                self.component_manager.switch_component(self.active_screen)
         except Exception:
             self.logger.error("Error creating component manager:")
             self.logger.error(traceback.format_exc())
@@ -176,6 +178,14 @@ class App(object):
         except Exception:
             self.logger.error("Error disposing frame manager:")
             self.logger.error(traceback.format_exc())
+        
+        try:
+            from librepy.peewee.connection.db_connection import close_database_pool
+            close_database_pool()
+            self.logger.info("Database pool closed")
+        except Exception:
+            self.logger.error("Error closing database pool:")
+            self.logger.error(traceback.format_exc())
             
         self._is_disposing = False
 
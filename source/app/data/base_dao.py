@@ -5,7 +5,13 @@ This module provides a base class with common functionality for database operati
 It ensures proper handling of database connections by using Peewee's model-database binding.
 '''
 from contextlib import contextmanager
-from librepy.peewee.peewee import DoesNotExist, IntegrityError
+from librepy.peewee.peewee import DataError, DoesNotExist, IntegrityError
+from librepy.app.data.page_source import QueryPageSource
+from librepy.app.data.projection import project_rows
+from librepy.peewee.sdbc_peewee import InsertTemplate, QueryParam, QueryParams, compile_query_template
+
+# (DAO class, query name) -> query built from the class's PREPARED_QUERIES
+_prepared_queries = {}
 
 
 class BaseDAO:
@@ -13,8 +19,15 @@ class BaseDAO:
 
     Provides connection management, safe execution, common read helpers
     (get_by_id, first, count, exists, paginate) and simple mutations.
+
+    Subclasses can declare named prepared queries in PREPARED_QUERIES, a
+    mapping of name -> builder(P) returning a select whose values are slots
+    (P.start, P.end, ...). Each query is built and compiled to SQL once and
+    then run by execute_prepared() with new bind values.
     """
 
+    PREPARED_QUERIES = {}
+
     def __init__(self, model_class, logger):
         """Initialize the DAO.
 
@@ -224,6 +237,66 @@ class BaseDAO:
 
         return self.safe_execute(op, _q, default_return=[])
 
+    def project(self, fields, formatters=None, key=None, where_clause=None, order_by=None,
+                joins=None, operation_name=None):
+        """Return rows as dicts from a .tuples() query, without building model instances.
+
+        Args:
+            fields: Iterable of field names, Field instances or (name, expression)
+                pairs; the name is the output dict key.
+            formatters: Optional {name: callable} applied to each column in one
+                pass (see app.data.projection for date/time/money formatters).
+            key: Optional output name for the model primary key, selected first
+                (e.g. 'id' for grids).
+            where_clause: Optional Peewee expression to filter rows.
+            order_by: Optional order clause(s).
+            joins: Optional iterable of models joined from this DAO's model.
+            operation_name: Optional label for logging.
+
+        Returns:
+            List[dict]: One dict per row keyed by the output names.
+        """
+        Model = self.model_class
+        op = operation_name or f"projecting {Model.__name__}"
+        names, cols = self.projection_columns(fields, key)
+
+        def _q():
+            q = Model.select(*cols)
+            for join_model in joins or ():
+                q = q.join(join_model).switch(Model)
+            if where_clause is not None:
+                q = q.where(where_clause)
+            if order_by is not None:
+                q = q.order_by(*order_by) if isinstance(order_by, (list, tuple)) else q.order_by(order_by)
+            return project_rows(names, q.tuples(), formatters)
+
+        return self.safe_execute(op, _q, default_return=[])
+
+    def projection_columns(self, fields, key=None):
+        """Resolve project()-style fields into output names and select columns.
+
+        Args:
+            fields: Iterable of field names, Field instances or (name, expression) pairs.
+            key: Optional output name for the model primary key, placed first.
+
+        Returns:
+            Tuple (names, columns) of equal length.
+        """
+        Model = self.model_class
+        names, cols = [], []
+        if key:
+            names.append(key)
+            cols.append(Model._meta.primary_key)
+        for f in fields:
+            if isinstance(f, tuple):
+                name, expr = f
+            else:
+                expr = getattr(Model, f) if isinstance(f, str) else f
+                name = expr.name
+            names.append(name)
+            cols.append(expr)
+        return names, cols
+
     def to_dict(self, instance, fields=None):
         """Convert a model instance managed by this DAO to a dict.
 
@@ -300,8 +373,7 @@ class BaseDAO:
         per_page = max(int(per_page or 1), 1)
         offset = (page - 1) * per_page
 
-        rows = self.get_all(order_by=order_by, where_clause=where_clause)
-        total = len(rows) if where_clause is not None and order_by is None else self.count(where_clause)
+        total = self.count(where_clause)
         # DB-level pagination:
         def _q():
             q = self.model_class.select()
@@ -317,6 +389,77 @@ class BaseDAO:
         )
         return page_rows, total
 
+    def page_source(self, query_factory=None, row_mapper=None, sort_fields=None,
+                    default_sort=None, key_field=None, columns=None, formatters=None):
+        """Return a QueryPageSource for a lazily populated grid.
+
+        Args:
+            query_factory: Zero-arg callable returning the select query; defaults
+                to selecting all rows of the model.
+            row_mapper: Callable mapping a fetched row to the grid dict; defaults
+                to to_dict() (to the projected dict when columns is given).
+            sort_fields: Mapping of grid column keys to fields/expressions that
+                can be ordered in SQL.
+            default_sort: Column key ordering the rows when the grid is unsorted.
+            key_field: Unique tie-breaker field; defaults to the primary key.
+            columns: Optional output names of the columns query_factory selects
+                (see projection_columns()); rows are then read as tuples and
+                projected into dicts instead of model instances.
+            formatters: Optional {name: callable} applied to projected columns.
+
+        Returns:
+            QueryPageSource serving count() and fetch(offset, limit, ...).
+        """
+        if row_mapper is None and columns is None:
+            row_mapper = self.to_dict
+        return QueryPageSource(
+            self,
+            query_factory or (lambda: self.model_class.select()),
+            row_mapper=row_mapper,
+            sort_fields=sort_fields,
+            default_sort=default_sort,
+            key_field=key_field,
+            columns=columns,
+            formatters=formatters,
+        )
+
+    # ---------- Prepared queries ----------
+
+    def prepared_query(self, name):
+        """Return the (built once) select declared as PREPARED_QUERIES[name]."""
+        key = (type(self), name)
+        query = _prepared_queries.get(key)
+        if query is None:
+            query = self.PREPARED_QUERIES[name](QueryParams())
+            _prepared_queries[key] = query
+        return query
+
+    def execute_prepared(self, name, operation_name=None, default_return=None, **params):
+        """Run a named prepared query with params bound to its slots.
+
+        The SQL is compiled once per database (SDBCPostgresqlDatabase keeps the
+        template cache); other databases compile on every call.
+
+        Returns:
+            list: Rows in the form the declared query produces (models, dicts,
+            tuples), or default_return on handled errors.
+        """
+        op = operation_name or f"prepared query {name} on {self.model_class.__name__}"
+
+        def _q():
+            template_query = self.prepared_query(name)
+            db = self.database
+            if hasattr(db, 'execute_template'):
+                cursor = db.execute_template((type(self), name), template_query, params)
+            else:
+                template = compile_query_template(db, template_query)
+                cursor = db.execute_sql(template.sql, template.bind(params))
+            query = template_query.clone()
+            query._cursor_wrapper = query._get_cursor_wrapper(cursor)
+            return list(query)
+
+        return self.safe_execute(op, _q, default_return=default_return)
+
     # ---------- Mutations ----------
 
     def create(self, operation_name=None, **data):
@@ -332,6 +475,84 @@ class BaseDAO:
         op = operation_name or f"create {self.model_class.__name__}"
         return self.safe_execute(op, lambda: self.model_class.create(**data), default_return=None)
 
+    def bulk_insert(self, rows, ignore_conflicts=False, conflict_target=None, batch_size=None,
+                    operation_name=None):
+        """Insert many rows with multi-row INSERTs, one transaction per chunk.
+
+        The INSERT is compiled once per call (see InsertTemplate) and primary
+        keys are not read back. If a chunk is rejected (constraint or
+        data error) it is rolled back and retried row by row inside savepoints,
+        so one bad row only costs its own insert.
+
+        Args:
+            rows: List of dicts with the same keys (model field names);
+                fields left out get their model defaults.
+            ignore_conflicts: Skip rows violating a unique constraint
+                (ON CONFLICT DO NOTHING) instead of failing them. Servers
+                without ON CONFLICT report those rows as failed.
+            conflict_target: Optional fields of the unique index to ignore
+                conflicts on, e.g. (SessionAttendee.session, SessionAttendee.email).
+            batch_size: Rows per INSERT; defaults to db.insert_batch_size().
+            operation_name: Optional label for logging.
+
+        Returns:
+            dict: {'inserted': n, 'skipped': n, 'failed': [(index, message), ...]}
+            where index is the position in rows; 'error' is set if the import
+            stopped on a connection-level error.
+        """
+        Model = self.model_class
+        op = operation_name or f"bulk insert {Model.__name__}"
+        rows = list(rows)
+        result = {'inserted': 0, 'skipped': 0, 'failed': []}
+        if not rows:
+            return result
+        db = self.database
+        # Compile the single-row INSERT once; chunks only repeat its VALUES group
+        keys = list(rows[0])
+        q = Model.insert_many([{k: QueryParam(k) for k in keys}])
+        if ignore_conflicts and getattr(db, 'supports_upsert', True):
+            if conflict_target:
+                q = q.on_conflict(conflict_target=conflict_target, action='IGNORE')
+            else:
+                q = q.on_conflict_ignore()
+        template = InsertTemplate(db, q.returning(), {k: Model._meta.fields[k].db_value for k in keys})
+        if batch_size is None:
+            sizer = getattr(db, 'insert_batch_size', None)
+            batch_size = sizer(template.row_params) if callable(sizer) else 100
+
+        def _insert(chunk):
+            cursor = db.execute_sql(template.sql(len(chunk)), template.bind_rows(chunk))
+            n = db.rows_affected(cursor)
+            return n if n is not None and n >= 0 else len(chunk)
+
+        def _run():
+            for start in range(0, len(rows), batch_size):
+                chunk = rows[start:start + batch_size]
+                failed_before = len(result['failed'])
+                try:
+                    with db.atomic():
+                        inserted = _insert(chunk)
+                except (IntegrityError, DataError) as e:
+                    self.logger.info(f"{op}: chunk at row {start} rejected ({e}); retrying row by row")
+                    inserted = 0
+                    with db.atomic():
+                        for offset, row in enumerate(chunk):
+                            try:
+                                with db.atomic():
+                                    inserted += _insert([row])
+                            except (IntegrityError, DataError) as row_error:
+                                result['failed'].append((start + offset, str(row_error)))
+                failed = len(result['failed']) - failed_before
+                result['inserted'] += inserted
+                result['skipped'] += len(chunk) - inserted - failed
+
+        try:
+            self.execute_query(_run)
+        except Exception as e:
+            self.logger.error(f"{op}: error: {e}")
+            result['error'] = str(e)
+        return result
+
     def update_fields(self, where_clause, updates: dict, operation_name=None):
         """Update fields for rows matching the filter.
 
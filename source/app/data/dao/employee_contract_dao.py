@@ -1,9 +1,28 @@
 from librepy.app.data.base_dao import BaseDAO
 from librepy.app.data.model import EmployeeContract, Employee
+from librepy.app.data.projection import format_text, full_name_expr
+from librepy.peewee.peewee import fn, Cast, Expression, SQL
+
+
+def _contracts_between_query(P):
+    # The bounds literal must be inlined for the planner to match the index expression
+    inclusive = SQL("'[]'")
+    contract_period = fn.daterange(EmployeeContract.start_date, EmployeeContract.end_date, inclusive)
+    requested = fn.daterange(Cast(P.start_date, 'date'), Cast(P.end_date, 'date'), inclusive)
+    # Join employee to get names (optional)
+    return (EmployeeContract
+            .select(EmployeeContract, Employee)
+            .join(Employee)
+            .where(Expression(contract_period, '&&', requested))
+            .order_by(EmployeeContract.start_date))
 
 
 class EmployeeContractDAO(BaseDAO):
 
+    PREPARED_QUERIES = {
+        'contracts_between': _contracts_between_query,
+    }
+
     def __init__(self, logger):
         super().__init__(EmployeeContract, logger)
 
@@ -64,20 +83,48 @@ class EmployeeContractDAO(BaseDAO):
             'status': 'active',
         }
 
-    def get_contracts_between(self, start_date, end_date):
+    def get_contracts_between(self, start_date, end_date, none_on_error=False):
         """Query EmployeeContract rows that overlap the [start_date, end_date] range.
 
-        Overlap condition: end_date >= start_date AND start_date <= end_date
-        Returns: List[dict]
+        Overlap condition: the inclusive contract period && the inclusive range,
+        written as a daterange expression so the employeecontract_period_gist
+        index can serve it.
+        Returns: List[dict]; on a query error [] (or None with none_on_error)
+        """
+        rows = self.execute_prepared('contracts_between', 'get_contracts_between', default_return=None,
+                                     start_date=start_date, end_date=end_date)
+        if rows is None:
+            return None if none_on_error else []
+        return [self._row_to_dict(row) for row in rows]
+
+    def get_schedule(self, start_date, end_date, employee=None, exclude_id=None):
+        """Return contracts overlapping [start_date, end_date] as dicts for conflict checks.
+
+        Uses the employeecontract employee index when employee is given.
+
+        Returns: List[dict] with keys: id, employee_id, employee_name, start_date,
+        end_date, time_in, time_out, working_days
         """
-        def _query():
-            # Join employee to get names (optional)
-            query = (EmployeeContract
-                     .select(EmployeeContract, Employee)
-                     .join(Employee)
-                     .where((EmployeeContract.end_date >= start_date) &
-                            (EmployeeContract.start_date <= end_date))
-                     .order_by(EmployeeContract.start_date))
-            return [self._row_to_dict(row) for row in query]
-
-        return self.safe_execute('get_contracts_between', _query, default_return=[])
+        where = ((EmployeeContract.start_date <= end_date) &
+                 (EmployeeContract.end_date >= start_date))
+        if employee is not None:
+            where &= (EmployeeContract.employee == employee)
+        if exclude_id is not None:
+            where &= (EmployeeContract.contract_id != exclude_id)
+        return self.project(
+            fields=[
+                ('employee_id', EmployeeContract.employee),
+                ('employee_name', full_name_expr(Employee)),
+                'start_date',
+                'end_date',
+                'time_in',
+                'time_out',
+                'working_days',
+            ],
+            formatters={'employee_name': format_text},
+            key='id',
+            where_clause=where,
+            joins=[Employee],
+            order_by=EmployeeContract.start_date,
+            operation_name='get EmployeeContract schedule',
+        )
@@ -1,5 +1,6 @@
 from librepy.app.data.base_dao import BaseDAO
 from librepy.app.data.model import Employee
+from librepy.app.data.projection import format_text, full_name_expr
 
 
 class EmployeeDAO(BaseDAO):
@@ -54,15 +55,10 @@ class EmployeeDAO(BaseDAO):
 
         Keys: id, name, email
         """
-        rows = self.get_all_employees() or []
-        results = []
-        for r in rows:
-            fn = (r.get('first_name') or '').strip()
-            ln = (r.get('last_name') or '').strip()
-            full = f"{fn} {ln}".strip() if (fn or ln) else ''
-            results.append({
-                'id': r.get('employee_id'),
-                'name': full,
-                'email': r.get('email') or '',
-            })
-        return results
+        return self.project(
+            fields=[('name', full_name_expr(Employee)), 'email'],
+            formatters={'name': format_text, 'email': format_text},
+            key='id',
+            order_by=Employee.last_name,
+            operation_name='get_all_for_grid',
+        )
@@ -4,6 +4,18 @@ from librepy.app.data.model import ServiceAppointment
 
 class ServiceAppointmentDAO(BaseDAO):
 
+    PREPARED_QUERIES = {
+        'appointments_between': lambda P: (ServiceAppointment
+                                           .select()
+                                           .where((ServiceAppointment.appointment_date >= P.start_date) &
+                                                  (ServiceAppointment.appointment_date <= P.end_date))
+                                           .order_by(ServiceAppointment.appointment_date)),
+        'appointment_by_id': lambda P: (ServiceAppointment
+                                        .select()
+                                        .where(ServiceAppointment.service_apt_id == P.appointment_id)
+                                        .limit(1)),
+    }
+
     def __init__(self, logger):
         super().__init__(ServiceAppointment, logger)
 
@@ -68,28 +80,40 @@ class ServiceAppointmentDAO(BaseDAO):
                 'status': 'scheduled',
             }
 
-    def get_appointments_between(self, start_date, end_date):
+    def get_appointments_between(self, start_date, end_date, none_on_error=False):
         """Query ServiceAppointment rows within [start_date, end_date].
 
         Returns: List[dict] with keys: id, date (date or 'YYYY-MM-DD'), title, status
+        On a query error returns [] (or None with none_on_error).
         """
-        def _query():
-            query = (ServiceAppointment
-                     .select()
-                     .where((ServiceAppointment.appointment_date >= start_date) &
-                            (ServiceAppointment.appointment_date <= end_date))
-                     .order_by(ServiceAppointment.appointment_date))
-            return [self._row_to_dict(row) for row in query]
-
-        return self.safe_execute('get_appointments_between', _query, default_return=[])
+        rows = self.execute_prepared('appointments_between', 'get_appointments_between', default_return=None,
+                                     start_date=start_date, end_date=end_date)
+        if rows is None:
+            return None if none_on_error else []
+        return [self._row_to_dict(row) for row in rows]
 
     def get_appointment_by_id(self, appointment_id):
         """Fetch one ServiceAppointment by id.
 
         Returns: dict with keys: id, date, title, status or None if not found
         """
-        def _query():
-            row = ServiceAppointment.get(ServiceAppointment.service_apt_id == appointment_id)
-            return self._row_to_dict(row)
+        rows = self.execute_prepared('appointment_by_id', 'get_appointment_by_id', default_return=[],
+                                     appointment_id=appointment_id)
+        return self._row_to_dict(rows[0]) if rows else None
+
+    def get_schedule(self, start_date, end_date, exclude_id=None):
+        """Return appointments in [start_date, end_date] as tuples for conflict checks.
 
-        return self.safe_execute('get_appointment_by_id', _query, default_return=None)
+        Returns: List[(service_apt_id, appointment_date, appointment_time, name)]
+        """
+        def _q():
+            where = ((ServiceAppointment.appointment_date >= start_date) &
+                     (ServiceAppointment.appointment_date <= end_date))
+            if exclude_id is not None:
+                where &= (ServiceAppointment.service_apt_id != exclude_id)
+            q = (ServiceAppointment
+                 .select(ServiceAppointment.service_apt_id, ServiceAppointment.appointment_date,
+                         ServiceAppointment.appointment_time, ServiceAppointment.name)
+                 .where(where))
+            return list(q.tuples())
+        return self.safe_execute('get ServiceAppointment schedule', _q, default_return=[])
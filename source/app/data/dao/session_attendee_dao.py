@@ -1,5 +1,6 @@
 from librepy.app.data.base_dao import BaseDAO
 from librepy.app.data.model import SessionAttendee, TrainingSession
+from librepy.app.data.projection import format_text, format_yes_no
 
 
 class SessionAttendeeDAO(BaseDAO):
@@ -47,22 +48,19 @@ class SessionAttendeeDAO(BaseDAO):
 
         Keys: id, name, email, phone, paid, notes
         """
-        def _query():
-            q = (SessionAttendee
-                 .select()
-                 .where(SessionAttendee.session == int(session_id))
-                 .order_by(SessionAttendee.attendee_id))
-            rows = []
-            for a in q:
-                rows.append({
-                    'id': getattr(a, 'attendee_id', None),
-                    'name': getattr(a, 'name', '') or '',
-                    'email': getattr(a, 'email', '') or '',
-                    'phone': getattr(a, 'phone', '') or '',
-                    'paid': 'Yes' if bool(getattr(a, 'paid', False)) else 'No',
-                })
-            return rows
-        return self.safe_execute('get attendees for session (grid)', _query, default_return=[])
+        return self.project(
+            fields=['name', 'email', 'phone', 'paid'],
+            formatters={
+                'name': format_text,
+                'email': format_text,
+                'phone': format_text,
+                'paid': format_yes_no,
+            },
+            key='id',
+            where_clause=(SessionAttendee.session == int(session_id)),
+            order_by=SessionAttendee.attendee_id,
+            operation_name='get attendees for session (grid)',
+        )
 
     def get_attendance_for_grid(self, session_id):
         """Return list of dicts for Attendance tab grid.
@@ -70,23 +68,20 @@ class SessionAttendeeDAO(BaseDAO):
         Only includes attendees with paid == True, because attendance only counts if payment.
         Keys per row: id, name, attendance (attendance maps to model.attended)
         """
-        def _query():
-            q = (SessionAttendee
-                 .select(SessionAttendee.attendee_id, SessionAttendee.name, SessionAttendee.attended)
-                 .where(
-                     (SessionAttendee.session == int(session_id)) &
-                     (SessionAttendee.paid == True)
-                 )
-                 .order_by(SessionAttendee.attendee_id))
-            rows = []
-            for a in q:
-                rows.append({
-                    'id': getattr(a, 'attendee_id', None),
-                    'name': getattr(a, 'name', '') or '',
-                    'attendance': 'Yes' if bool(getattr(a, 'attended', False)) else 'No',
-                })
-            return rows
-        return self.safe_execute('get attendance for session (paid only)', _query, default_return=[])
+        return self.project(
+            fields=['name', ('attendance', SessionAttendee.attended)],
+            formatters={
+                'name': format_text,
+                'attendance': format_yes_no,
+            },
+            key='id',
+            where_clause=(
+                (SessionAttendee.session == int(session_id)) &
+                (SessionAttendee.paid == True)
+            ),
+            order_by=SessionAttendee.attendee_id,
+            operation_name='get attendance for session (paid only)',
+        )
 
     def get_by_id(self, attendee_id):
         def _q():
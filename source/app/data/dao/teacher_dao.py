@@ -1,5 +1,6 @@
 from librepy.app.data.base_dao import BaseDAO
 from librepy.app.data.model import Teacher
+from librepy.app.data.projection import format_text, full_name_expr
 
 
 class TeacherDAO(BaseDAO):
@@ -56,15 +57,10 @@ class TeacherDAO(BaseDAO):
 
         Keys: id, name, email
         """
-        rows = self.get_all_teachers() or []
-        results = []
-        for r in rows:
-            fn = (r.get('first_name') or '').strip()
-            ln = (r.get('last_name') or '').strip()
-            full = f"{fn} {ln}".strip() if (fn or ln) else ''
-            results.append({
-                'id': r.get('teacher_id'),
-                'name': full,
-                'email': r.get('email') or '',
-            })
-        return results
+        return self.project(
+            fields=[('name', full_name_expr(Teacher)), 'email'],
+            formatters={'name': format_text, 'email': format_text},
+            key='id',
+            order_by=Teacher.last_name,
+            operation_name='get_all_for_grid',
+        )
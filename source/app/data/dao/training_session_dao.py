@@ -1,9 +1,38 @@
 from librepy.app.data.base_dao import BaseDAO
 from librepy.app.data.model import TrainingSession, Teacher
-from datetime import time, date
+from librepy.app.data.projection import format_date, format_time, format_text, full_name_expr, to_float
+from datetime import date, datetime
+import calendar
 
 class TrainingSessionDAO(BaseDAO):
 
+    PREPARED_QUERIES = {
+        'sessions_between': lambda P: (TrainingSession
+                                       .select()
+                                       .where((TrainingSession.session_date >= P.start_date) &
+                                              (TrainingSession.session_date <= P.end_date))
+                                       .order_by(TrainingSession.session_date)),
+        'session_by_id': lambda P: (TrainingSession
+                                    .select()
+                                    .where(TrainingSession.session_id == P.session_id)
+                                    .limit(1)),
+    }
+
+    # Session grid columns (key 'id' first) and their formatters
+    GRID_FIELDS = [
+        'name',
+        ('teacher_name', full_name_expr(Teacher)),
+        'session_date',
+        'session_time',
+        'price',
+    ]
+    GRID_FORMATTERS = {
+        'teacher_name': format_text,
+        'session_date': format_date,
+        'session_time': format_time,
+        'price': to_float,
+    }
+
     def __init__(self, logger):
         super().__init__(TrainingSession, logger)
 
@@ -29,6 +58,60 @@ class TrainingSessionDAO(BaseDAO):
             )
         return self.safe_execute('create TrainingSession', _q, default_return=None)
 
+    def create_series(self, name, teacher, session_time, price, dates):
+        """Insert one TrainingSession per date in a single transaction.
+
+        Returns: List of new session ids (empty if the server cannot return
+        them), or None on error.
+        """
+        rows = [{
+            'name': name,
+            'teacher': teacher,
+            'session_date': d,
+            'session_time': session_time,
+            'price': price,
+        } for d in dates]
+        if not rows:
+            return []
+
+        def _q():
+            db = self.database
+            sizer = getattr(db, 'insert_batch_size', None)
+            batch = sizer(len(rows[0])) if callable(sizer) else 100
+            returning = getattr(db, 'returning_clause', False)
+            ids = []
+            with db.atomic():
+                for start in range(0, len(rows), batch):
+                    q = TrainingSession.insert_many(rows[start:start + batch])
+                    if returning:
+                        ids.extend(pk for pk, in q.returning(TrainingSession.session_id).tuples().execute())
+                    else:
+                        q.returning().execute()
+            return ids
+        return self.safe_execute('create TrainingSession series', _q, default_return=None)
+
+    def get_schedule(self, start_date, end_date, teacher=None, exclude_id=None):
+        """Return sessions in [start_date, end_date] as tuples for conflict checks.
+
+        Uses the (teacher, session_date) index when teacher is given.
+
+        Returns: List[(session_id, teacher_id, session_date, session_time, name)]
+        """
+        def _q():
+            where = ((TrainingSession.session_date >= start_date) &
+                     (TrainingSession.session_date <= end_date))
+            if teacher is not None:
+                where &= (TrainingSession.teacher == teacher)
+            if exclude_id is not None:
+                where &= (TrainingSession.session_id != exclude_id)
+            q = (TrainingSession
+                 .select(TrainingSession.session_id, TrainingSession.teacher,
+                         TrainingSession.session_date, TrainingSession.session_time,
+                         TrainingSession.name)
+                 .where(where))
+            return list(q.tuples())
+        return self.safe_execute('get TrainingSession schedule', _q, default_return=[])
+
     def update(self, session_id, name=None, teacher=None, session_date=None, 
                session_time=None, price=None):
         """Update fields on TrainingSession and return the model instance."""
@@ -48,31 +131,26 @@ class TrainingSessionDAO(BaseDAO):
             return TrainingSession.get(TrainingSession.session_id == session_id)
         return self.safe_execute('get TrainingSession after update', _fetch, default_return=None)
 
-    def get_sessions_between(self, start_date, end_date):
+    def get_sessions_between(self, start_date, end_date, none_on_error=False):
         """Query TrainingSession rows within [start_date, end_date].
 
         Returns: List[dict] with keys: id, date (date or 'YYYY-MM-DD'), title
+        On a query error returns [] (or None with none_on_error).
         """
-        def _query():
-            query = (TrainingSession
-                     .select()
-                     .where((TrainingSession.session_date >= start_date) &
-                            (TrainingSession.session_date <= end_date))
-                     .order_by(TrainingSession.session_date))
-            return [self._row_to_dict(row) for row in query]
-
-        return self.safe_execute('get_sessions_between', _query, default_return=[])
+        rows = self.execute_prepared('sessions_between', 'get_sessions_between', default_return=None,
+                                     start_date=start_date, end_date=end_date)
+        if rows is None:
+            return None if none_on_error else []
+        return [self._row_to_dict(row) for row in rows]
 
     def get_session_by_id(self, session_id):
         """Fetch one TrainingSession by id.
 
         Returns: dict with keys: id, date, title or None if not found
         """
-        def _query():
-            row = TrainingSession.get(TrainingSession.session_id == session_id)
-            return self._row_to_dict(row)
-
-        return self.safe_execute('get_session_by_id', _query, default_return=None)
+        rows = self.execute_prepared('session_by_id', 'get_session_by_id', default_return=[],
+                                     session_id=session_id)
+        return self._row_to_dict(rows[0]) if rows else None
 
     def get_training_sessions(self):
         """Return list of sessions joined to teachers for grid display.
@@ -80,48 +158,109 @@ class TrainingSessionDAO(BaseDAO):
         Each dict contains: id, name, teacher_name, session_date, session_time, price
         session_date is formatted as 'YYYY-MM-DD'; session_time as 'HH:MM'.
         """
-        def _norm_time(v):
-            try:
-                if isinstance(v, time):
-                    return v.strftime('%H:%M')
-                s = str(v) if v is not None else ''
-                if len(s) >= 5 and ':' in s:
-                    return s[:5]
-                return s
-            except Exception:
-                return str(v) if v is not None else ''
-
-        def _norm_date(v):
-            try:
-                if isinstance(v, date):
-                    return v.strftime('%Y-%m-%d')
-                return str(v) if v is not None else ''
-            except Exception:
-                return str(v) if v is not None else ''
+        return self.project(
+            fields=self.GRID_FIELDS,
+            formatters=self.GRID_FORMATTERS,
+            key='id',
+            joins=[Teacher],
+            order_by=[TrainingSession.session_date, TrainingSession.session_time],
+            operation_name='get_training_sessions',
+        )
+
+    def _search_clause(self, search_text):
+        """Build the WHERE clause for a free-text session search.
+
+        Matches the session name or teacher name with ILIKE '%text%' (backed by
+        the trigram indexes of migration 003). Teacher matches are resolved as a
+        teacher_id IN (...) subquery so both branches filter trainingsession
+        columns and can be combined with a bitmap OR. Text shaped like a date
+        prefix (YYYY, YYYY-MM, YYYY-MM-DD) or a time (HH:MM) also matches the
+        session_date range / session_time.
+        """
+        text = (search_text or '').strip()
+        if not text:
+            return None
+        escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        pattern = f"%{escaped}%"
+
+        full_name = Teacher.first_name.concat(' ').concat(Teacher.last_name)
+        teacher_ids = (Teacher
+                       .select(Teacher.teacher_id)
+                       .where((Teacher.first_name ** pattern) |
+                              (Teacher.last_name ** pattern) |
+                              (full_name ** pattern)))
+        clause = (TrainingSession.name ** pattern) | (TrainingSession.teacher.in_(teacher_ids))
+
+        date_range = _date_prefix_range(text)
+        if date_range is not None:
+            clause |= TrainingSession.session_date.between(*date_range)
+        session_time = _parse_time(text)
+        if session_time is not None:
+            clause |= (TrainingSession.session_time == session_time)
+        return clause
+
+    def search_source(self, search_text=None, formatter=None):
+        """Return a paged source of search results for a lazily populated grid.
+
+        Args:
+            search_text: Free text matched against session name, teacher name,
+                date prefix or time (see _search_clause). Empty text returns
+                all sessions.
+            formatter: Optional callable applied to each grid dict (e.g. display
+                formatting done by the view).
+
+        Returns:
+            QueryPageSource over the matching sessions, read as tuples and
+            projected to the grid dicts of get_training_sessions(); grid columns
+            name, teacher_name, session_date, session_time and price sort in SQL.
+        """
+        where_clause = self._search_clause(search_text)
+        names, columns = self.projection_columns(self.GRID_FIELDS, key='id')
 
         def _query():
-            # Build ORM query using Peewee models, no raw SQL
-            query = (
-                TrainingSession
-                .select(TrainingSession, Teacher)
-                .join(Teacher)
-                .order_by(TrainingSession.session_date, TrainingSession.session_time)
-            )
-            results = []
-            for ts in query:
-                teacher = getattr(ts, 'teacher', None)
-                t_first = getattr(teacher, 'first_name', '') or ''
-                t_last = getattr(teacher, 'last_name', '') or ''
-                teacher_name = f"{t_first} {t_last}".strip()
-                rec = {
-                    'id': getattr(ts, 'session_id', None),
-                    'name': getattr(ts, 'name', ''),
-                    'teacher_name': teacher_name,
-                    'session_date': _norm_date(getattr(ts, 'session_date', None)),
-                    'session_time': _norm_time(getattr(ts, 'session_time', None)),
-                    'price': float(getattr(ts, 'price', 0)) if getattr(ts, 'price', None) is not None else None,
-                }
-                results.append(rec)
-            return results
-
-        return self.safe_execute('get_training_sessions', _query, default_return=[]) 
\ No newline at end of file
+            query = TrainingSession.select(*columns).join(Teacher)
+            if where_clause is not None:
+                query = query.where(where_clause)
+            return query
+
+        return self.page_source(
+            query_factory=_query,
+            row_mapper=formatter,
+            columns=names,
+            formatters=self.GRID_FORMATTERS,
+            sort_fields={
+                'name': TrainingSession.name,
+                'teacher_name': full_name_expr(Teacher),
+                'session_date': TrainingSession.session_date,
+                'session_time': TrainingSession.session_time,
+                'price': TrainingSession.price,
+            },
+            default_sort='session_date',
+        )
+
+
+def _date_prefix_range(text):
+    """Return the (first, last) dates covered by a 'YYYY', 'YYYY-MM' or 'YYYY-MM-DD' prefix."""
+    parts = text.split('-')
+    if not 1 <= len(parts) <= 3 or not all(p.isdigit() for p in parts) or len(parts[0]) != 4:
+        return None
+    try:
+        year = int(parts[0])
+        if len(parts) == 1:
+            return date(year, 1, 1), date(year, 12, 31)
+        month = int(parts[1])
+        if len(parts) == 2:
+            last_day = calendar.monthrange(year, month)[1]
+            return date(year, month, 1), date(year, month, last_day)
+        day = date(year, month, int(parts[2]))
+        return day, day
+    except ValueError:
+        return None
+
+
+def _parse_time(text):
+    """Return a time for 'HH:MM' text, else None."""
+    try:
+        return datetime.strptime(text, '%H:%M').time()
+    except ValueError:
+        return None
@@ -0,0 +1,159 @@
+'''
+Streaming row readers for CSV and ODS import files.
+
+Each reader yields (row_number, dict) pairs keyed by the normalized header
+of the first non-empty row (lower case, spaces/hyphens -> '_'). row_number
+is the 1-based line or sheet row, so errors can point at the source cell.
+Empty cells come back as None and fully empty rows are skipped.
+
+ODS files are read from content.xml with iterparse, one table row at a
+time, so memory stays flat regardless of the sheet size. Only the first
+sheet is read.
+'''
+import csv
+import re
+import zipfile
+from datetime import datetime, time
+from xml.etree.ElementTree import iterparse
+
+_TABLE_NS = 'urn:oasis:names:tc:opendocument:xmlns:table:1.0'
+_OFFICE_NS = 'urn:oasis:names:tc:opendocument:xmlns:office:1.0'
+_TEXT_NS = 'urn:oasis:names:tc:opendocument:xmlns:text:1.0'
+
+_TABLE = f'{{{_TABLE_NS}}}table'
+_ROW = f'{{{_TABLE_NS}}}table-row'
+_CELL = f'{{{_TABLE_NS}}}table-cell'
+_COVERED_CELL = f'{{{_TABLE_NS}}}covered-table-cell'
+_ROWS_REPEATED = f'{{{_TABLE_NS}}}number-rows-repeated'
+_COLS_REPEATED = f'{{{_TABLE_NS}}}number-columns-repeated'
+_VALUE_TYPE = f'{{{_OFFICE_NS}}}value-type'
+_VALUE = f'{{{_OFFICE_NS}}}value'
+_DATE_VALUE = f'{{{_OFFICE_NS}}}date-value'
+_TIME_VALUE = f'{{{_OFFICE_NS}}}time-value'
+_BOOLEAN_VALUE = f'{{{_OFFICE_NS}}}boolean-value'
+_PARAGRAPH = f'{{{_TEXT_NS}}}p'
+
+_ODS_DURATION = re.compile(r'PT(\d+)H(\d+)M(\d+)(?:\.\d+)?S')
+
+SUPPORTED_EXTENSIONS = ('.csv', '.ods')
+
+
+def normalize_header(name):
+    """' First Name ' -> 'first_name'."""
+    return re.sub(r'[\s\-]+', '_', str(name or '').strip().lower())
+
+
+def _rows_to_dicts(rows):
+    """Turn (row_number, [values]) into (row_number, dict) using the first non-empty row as header."""
+    header = None
+    for row_number, values in rows:
+        if not any(v not in (None, '') for v in values):
+            continue
+        if header is None:
+            header = [normalize_header(v) for v in values]
+            while header and not header[-1]:
+                header.pop()
+            continue
+        record = {}
+        for name, value in zip(header, values):
+            if name:
+                record[name] = None if value == '' else value
+        yield row_number, record
+
+
+def iter_csv_rows(path, encoding='utf-8-sig', delimiter=None):
+    """Yield (row_number, dict) from a CSV file.
+
+    The delimiter is sniffed from the first few KB when not given
+    (comma, semicolon, tab or pipe); values stay strings.
+    """
+    with open(path, newline='', encoding=encoding) as fh:
+        if delimiter is None:
+            sample = fh.read(8192)
+            fh.seek(0)
+            try:
+                delimiter = csv.Sniffer().sniff(sample, delimiters=',;\t|').delimiter
+            except csv.Error:
+                delimiter = ','
+        reader = csv.reader(fh, delimiter=delimiter)
+        # line_num counts physical lines, so quoted newlines keep the numbering honest
+        yield from _rows_to_dicts((reader.line_num, [v.strip() for v in values]) for values in reader)
+
+
+def _ods_cell_value(cell):
+    value_type = cell.get(_VALUE_TYPE)
+    try:
+        if value_type in ('float', 'percentage', 'currency'):
+            number = float(cell.get(_VALUE))
+            return int(number) if number.is_integer() else number
+        if value_type == 'date':
+            value = datetime.fromisoformat(cell.get(_DATE_VALUE))
+            return value.date() if value.time() == time(0) else value
+        if value_type == 'time':
+            match = _ODS_DURATION.fullmatch(cell.get(_TIME_VALUE) or '')
+            if match:
+                hours, minutes, seconds = (int(g) for g in match.groups())
+                return time(hours % 24, minutes, seconds)
+        if value_type == 'boolean':
+            return cell.get(_BOOLEAN_VALUE) == 'true'
+    except (TypeError, ValueError):
+        pass
+    text = '\n'.join(''.join(p.itertext()) for p in cell.iter(_PARAGRAPH))
+    return text.strip()
+
+
+def _iter_ods_values(path):
+    with zipfile.ZipFile(path) as zf, zf.open('content.xml') as content:
+        tables = 0
+        for event, elem in iterparse(content, events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == _TABLE:
+                    tables += 1
+                    if tables > 1:
+                        return
+                    row_number = 0
+                continue
+            if elem.tag != _ROW:
+                continue
+            values = []
+            blanks = 0
+            for cell in elem:
+                if cell.tag not in (_CELL, _COVERED_CELL):
+                    continue
+                value = _ods_cell_value(cell) if cell.tag == _CELL else ''
+                repeat = int(cell.get(_COLS_REPEATED, 1))
+                if value == '':
+                    # Blank cells are often repeated to the sheet edge; only
+                    # expand them when a value follows
+                    blanks += repeat
+                    continue
+                values.extend([''] * blanks)
+                values.extend([value] * repeat)
+                blanks = 0
+            row_repeat = int(elem.get(_ROWS_REPEATED, 1))
+            if values:
+                for _ in range(row_repeat):
+                    row_number += 1
+                    yield row_number, values
+            else:
+                row_number += row_repeat
+            elem.clear()
+
+
+def iter_ods_rows(path):
+    """Yield (row_number, dict) from the first sheet of an ODS spreadsheet.
+
+    Numbers come back as int/float, dates as date/datetime, times as time
+    and booleans as bool; everything else as stripped text.
+    """
+    yield from _rows_to_dicts(_iter_ods_values(path))
+
+
+def iter_rows(path):
+    """Yield (row_number, dict) from a .csv or .ods file, picked by extension."""
+    lower = str(path).lower()
+    if lower.endswith('.csv'):
+        return iter_csv_rows(path)
+    if lower.endswith('.ods'):
+        return iter_ods_rows(path)
+    raise ValueError(f"Unsupported import file type: {path} (expected {', '.join(SUPPORTED_EXTENSIONS)})")
@@ -25,11 +25,17 @@ class Teacher(BaseModel):
 class TrainingSession(BaseModel):
     session_id = AutoField(primary_key=True)
     name = CharField(max_length=45)
-    session_date = DateField()
+    session_date = DateField(index=True)
     session_time = TimeField()
     price = DecimalField(max_digits=10, decimal_places=2)
     teacher = ForeignKeyField(Teacher, backref='training_sessions')
 
+    class Meta:
+        # double-booking checks look up one teacher's sessions by date
+        indexes = (
+            (('teacher', 'session_date'), False),
+        )
+
 class SessionAttendee(BaseModel):
     attendee_id = AutoField(primary_key=True)
     session = ForeignKeyField(TrainingSession, backref='attendees')
@@ -51,7 +57,7 @@ class ServiceAppointment(BaseModel):
     name = CharField(max_length=45)
     phone_number = CharField(max_length=15)
     email = CharField(max_length=45)
-    appointment_date = DateField()
+    appointment_date = DateField(index=True)
     appointment_time = TimeField()
     notes = CharField(max_length=255)
 
@@ -69,3 +75,9 @@ class EmployeeContract(BaseModel):
     time_in = TimeField()
     time_out = TimeField()
     working_days = SmallIntegerField(default=31)
+
+    class Meta:
+        # calendar range queries filter on both ends of the contract period
+        indexes = (
+            (('start_date', 'end_date'), False),
+        )
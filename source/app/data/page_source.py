@@ -0,0 +1,147 @@
+'''
+Paged row sources for lazily populated grids.
+
+A QueryPageSource wraps a Peewee select and serves it one window at a time:
+count() for the grid's row count and fetch(offset, limit, sort_key, ascending)
+for the rows of a page. Sorting is pushed into the ORDER BY; the primary key
+is always appended as a tie-breaker so pages are stable.
+
+When a page directly follows one that was already fetched in the same order,
+the next page is read with a keyset predicate ((sort, pk) > (last_sort, last_pk))
+instead of OFFSET, so scrolling down a large table does not rescan the rows
+above the viewport. Sort columns are ordered NULLS LAST in both directions so
+the keyset predicate can add the NULL tail explicitly (a row comparison with
+NULL is never true).
+
+A source built with columns reads its query with .tuples() and turns each
+page into dicts with projection.project_rows, so grid pages are formatted
+column by column without constructing model instances.
+'''
+from collections import OrderedDict
+
+from librepy.app.data.projection import project_rows
+from librepy.peewee.peewee import Tuple
+
+SORT_KEY_ALIAS = '_page_sort_key'
+PAGE_KEY_ALIAS = '_page_row_key'
+MAX_KEYSET_BOUNDARIES = 256
+
+
+class QueryPageSource:
+    """Serve a Peewee select query in pages for a lazy grid.
+
+    Args:
+        dao: BaseDAO used for connection handling and error logging.
+        query_factory: Zero-arg callable returning the (filtered) select query.
+        row_mapper: Callable mapping a fetched row to the grid dict.
+        sort_fields: Mapping of grid column keys to Peewee fields/expressions
+            that can be pushed into ORDER BY.
+        default_sort: Column key used when the grid has no sort selected.
+        key_field: Unique tie-breaker field; defaults to the model primary key.
+        columns: Optional output names of the query's selected columns. When
+            given, rows are fetched as tuples and each page is projected into
+            dicts (with formatters) before row_mapper is applied.
+        formatters: Optional {name: callable} applied column by column to
+            projected pages (see app.data.projection).
+    """
+
+    def __init__(self, dao, query_factory, row_mapper=None, sort_fields=None,
+                 default_sort=None, key_field=None, columns=None, formatters=None):
+        self.dao = dao
+        self.query_factory = query_factory
+        self.row_mapper = row_mapper
+        self.columns = list(columns) if columns is not None else None
+        self.formatters = formatters
+        self.sort_fields = dict(sort_fields or {})
+        self.default_sort = default_sort
+        self.key_field = key_field or dao.model_class._meta.primary_key
+        self._count = None
+        # (sort_key, ascending, offset) -> (sort value, key value) of the row before offset
+        self._boundaries = OrderedDict()
+
+    def can_sort(self, sort_key):
+        """Return True if the column key can be ordered in SQL."""
+        return sort_key in self.sort_fields
+
+    def count(self):
+        """Return the number of rows in the source (cached until refresh)."""
+        if self._count is None:
+            op = f"count page source {self.dao.model_class.__name__}"
+            self._count = self.dao.safe_execute(op, lambda: self.query_factory().count(), default_return=0)
+        return self._count
+
+    def refresh(self):
+        """Forget the cached count and keyset boundaries (after data changes)."""
+        self._count = None
+        self._boundaries.clear()
+
+    def fetch(self, offset, limit, sort_key=None, ascending=True):
+        """Return up to limit mapped rows starting at offset in the given order."""
+        if sort_key not in self.sort_fields:
+            sort_key = self.default_sort
+            ascending = True
+        sort_field = self.sort_fields.get(sort_key)
+        boundary = self._boundaries.get((sort_key, ascending, offset)) if offset else None
+
+        def _q():
+            query = self.query_factory()
+            key_order = self.key_field.asc() if ascending else self.key_field.desc()
+            if sort_field is not None:
+                query = query.select_extend(sort_field.alias(SORT_KEY_ALIAS))
+                sort_order = sort_field.asc(nulls='LAST') if ascending else sort_field.desc(nulls='LAST')
+                query = query.order_by(sort_order, key_order)
+            else:
+                query = query.order_by(key_order)
+            query = query.select_extend(self.key_field.alias(PAGE_KEY_ALIAS))
+
+            if boundary is not None:
+                query = query.where(self._after(sort_field, boundary, ascending))
+                query = query.limit(limit)
+            else:
+                query = query.limit(limit).offset(offset)
+            if self.columns is not None:
+                query = query.tuples()
+            return list(query)
+
+        op = f"fetch page source {self.dao.model_class.__name__} [{offset}:{offset + limit}]"
+        rows = self.dao.safe_execute(op, _q, default_return=[])
+        if not rows:
+            return []
+        self._remember_boundary(sort_key, ascending, offset + len(rows), self._row_keys(rows[-1], sort_field))
+        if self.columns is not None:
+            width = len(self.columns)
+            rows = project_rows(self.columns, [row[:width] for row in rows], self.formatters)
+        if self.row_mapper is None:
+            return rows
+        return [self.row_mapper(row) for row in rows]
+
+    def _after(self, sort_field, boundary, ascending):
+        """WHERE clause for the rows that follow boundary (sort value, key) in NULLS LAST order."""
+        last_sort, last_key = boundary
+        key_after = self.key_field > last_key if ascending else self.key_field < last_key
+        if sort_field is None:
+            return key_after
+        if last_sort is None:
+            # Inside the NULL tail: only the key orders the remaining rows
+            return sort_field.is_null() & key_after
+        current, last = Tuple(sort_field, self.key_field), Tuple(last_sort, last_key)
+        after = current > last if ascending else current < last
+        if getattr(sort_field, 'null', True) is False:
+            # NOT NULL column: keep the plain row comparison (index friendly)
+            return after
+        return after | sort_field.is_null()
+
+    def _row_keys(self, row, sort_field):
+        """Return the (sort value, key value) selected into a fetched row."""
+        if self.columns is not None:
+            # Tuples end with the sort value (when sorted) and the key
+            return (row[-2] if sort_field is not None else None), row[-1]
+        sort_value = getattr(row, SORT_KEY_ALIAS, None) if sort_field is not None else None
+        return sort_value, getattr(row, PAGE_KEY_ALIAS, None)
+
+    def _remember_boundary(self, sort_key, ascending, next_offset, boundary):
+        key = (sort_key, ascending, next_offset)
+        self._boundaries[key] = boundary
+        self._boundaries.move_to_end(key)
+        while len(self._boundaries) > MAX_KEYSET_BOUNDARIES:
+            self._boundaries.popitem(last=False)
@@ -0,0 +1,79 @@
+'''
+Column formatters and row projection for grid queries.
+
+BaseDAO.project() selects plain tuples and hands them to project_rows(),
+which applies one formatter per column and zips the result into dicts, so
+grid loads never construct model instances.
+'''
+from datetime import date, time
+
+from librepy.peewee.peewee import fn
+
+
+def format_date(value):
+    """date/datetime -> 'YYYY-MM-DD'; None -> ''."""
+    if value is None:
+        return ''
+    if isinstance(value, date):
+        return value.strftime('%Y-%m-%d')
+    return str(value)
+
+
+def format_time(value):
+    """time -> 'HH:MM'; strings are cut to 'HH:MM'; None -> ''."""
+    if value is None:
+        return ''
+    if isinstance(value, time):
+        return value.strftime('%H:%M')
+    s = str(value)
+    return s[:5] if len(s) >= 5 and ':' in s else s
+
+
+def format_money(value):
+    """Decimal/number -> '$1,234.50'; None -> ''."""
+    if value is None:
+        return ''
+    return f"${float(value):,.2f}"
+
+
+def to_float(value):
+    """Decimal/number -> float; None stays None."""
+    return float(value) if value is not None else None
+
+
+def format_text(value):
+    """None -> ''; strings are stripped."""
+    return '' if value is None else str(value).strip()
+
+
+def format_yes_no(value):
+    """Truthy -> 'Yes', falsy -> 'No'."""
+    return 'Yes' if value else 'No'
+
+
+def full_name_expr(model):
+    """SQL for 'first_name last_name' of a model with those columns (NULL parts as '')."""
+    return fn.COALESCE(model.first_name, '').concat(' ').concat(fn.COALESCE(model.last_name, ''))
+
+
+def project_rows(names, rows, formatters=None):
+    """Turn tuples into dicts keyed by names, formatting column by column.
+
+    Args:
+        names: Output key for each tuple position.
+        rows: Iterable of tuples.
+        formatters: Optional {name: callable}; columns without one pass through.
+
+    Returns:
+        List[dict]
+    """
+    rows = list(rows)
+    if not rows:
+        return []
+    formatters = formatters or {}
+    columns = list(zip(*rows))
+    for index, name in enumerate(names):
+        formatter = formatters.get(name)
+        if formatter is not None:
+            columns[index] = list(map(formatter, columns[index]))
+    return [dict(zip(names, values)) for values in zip(*columns)]
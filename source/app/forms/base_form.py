@@ -64,6 +64,21 @@ class BaseForm:
         self.clean()
         return not self._errors
 
+    @classmethod
+    def validate_many(cls, rows, context: Any = None):
+        """
+        Validate many input dicts with one form instance (bulk imports).
+        Yields (cleaned_data, errors) per row in order; cleaned_data is a
+        fresh dict, or None when the row has errors.
+        """
+        form = cls(data={}, context=context)
+        for data in rows:
+            form.data = data or {}
+            if form.is_valid():
+                yield dict(form.cleaned_data), []
+            else:
+                yield None, form.errors
+
     def save(self) -> dict:
         """
         Uses Meta to pick DAO + method:
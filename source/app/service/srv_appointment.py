@@ -1,4 +1,5 @@
 
+from librepy.app.components.calendar import calendar_cache
 from librepy.app.forms.service_appointment_form import ServiceAppointmentForm
 from librepy.app.data.dao.service_appointment_dao import ServiceAppointmentDAO
 
@@ -18,7 +19,10 @@ def save_service_appointment(data: dict, context=None) -> dict:
     form = ServiceAppointmentForm(data=data, context=context)
     if not form.is_valid():
         return {"ok": False, "errors": form.errors}
-    return form.save()
+    result = form.save()
+    if result.get("ok"):
+        calendar_cache.invalidate(calendar_cache.SERVICE_APPOINTMENTS)
+    return result
 
 
 def delete_service_appointment(service_apt_id: int, context=None) -> dict:
@@ -28,4 +32,6 @@ def delete_service_appointment(service_apt_id: int, context=None) -> dict:
     """
     dao = ServiceAppointmentDAO(getattr(context, "logger", context))
     n = dao.delete_where(dao.model_class.service_apt_id == service_apt_id, operation_name='delete ServiceAppointment by id')
+    if n:
+        calendar_cache.invalidate(calendar_cache.SERVICE_APPOINTMENTS)
     return {"ok": bool(n and n > 0), "deleted": n or 0}
@@ -0,0 +1,187 @@
+from datetime import date, datetime, time, timedelta
+from typing import List
+
+from librepy.app.data.dao.employee_contract_dao import EmployeeContractDAO
+from librepy.app.data.dao.service_appointment_dao import ServiceAppointmentDAO
+from librepy.app.data.dao.training_session_dao import TrainingSessionDAO
+from librepy.app.utils.conflicts import Booking, find_conflicts, find_overlapping, timed_slot
+from librepy.app.utils.utils import is_allowed
+
+SESSION_MINUTES = 60             # Sessions store only a start time
+APPOINTMENT_MINUTES = 60         # Appointments store only a start time
+ONE_DAY = timedelta(days=1)
+
+
+def _as_time(value):
+    if isinstance(value, time):
+        return value
+    if isinstance(value, datetime):
+        return value.time()
+    if isinstance(value, str) and value.strip():
+        for fmt in ("%H:%M:%S", "%H:%M"):
+            try:
+                return datetime.strptime(value.strip()[:8], fmt).time()
+            except ValueError:
+                continue
+    return None
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str) and value.strip():
+        try:
+            return datetime.strptime(value.strip()[:10], "%Y-%m-%d").date()
+        except ValueError:
+            return None
+    return None
+
+
+def _timed_bookings(rows, minutes):
+    """rows: (key, owner, date, time, name) -> Bookings; rows without date/time are skipped."""
+    bookings = []
+    for key, owner, day, start_time, name in rows:
+        day, start_time = _as_date(day), _as_time(start_time)
+        if day is None or start_time is None:
+            continue
+        start, end = timed_slot(day, start_time, minutes)
+        bookings.append(Booking(key, owner, start, end, f"{name or ''} {start:%Y-%m-%d %H:%M}".strip()))
+    return bookings
+
+
+def _pairs_to_dicts(pairs) -> List[dict]:
+    return [{"owner": a.owner, "first": a.to_dict(), "second": b.to_dict()} for a, b in pairs]
+
+
+# ---- Training sessions (owner: teacher) ----
+
+def find_session_conflicts(teacher, session_date, session_time, exclude_session_id=None,
+                           minutes=SESSION_MINUTES, context=None) -> List[dict]:
+    """
+    Return the teacher's sessions overlapping a proposed slot.
+
+    Reads the teacher's sessions from the day before to the day after
+    (teacher, session_date index) and compares them with the slot.
+
+    Returns: [{"id", "owner", "start", "end", "label"}, ...] (empty when free)
+    """
+    return [existing.to_dict() for _, existing in
+            find_session_conflicts_many(teacher, [session_date], session_time,
+                                        exclude_session_id, minutes, context)]
+
+
+def find_session_conflicts_many(teacher, dates, session_time, exclude_session_id=None,
+                                minutes=SESSION_MINUTES, context=None):
+    """
+    Check one time slot on many dates (e.g. a recurring series) with one query.
+
+    Returns: List of (proposed Booking, existing Booking) pairs; proposed.start.date()
+    is the conflicting date.
+    """
+    dates = sorted(d for d in (_as_date(d) for d in dates) if d is not None)
+    start_time = _as_time(session_time)
+    if not dates or start_time is None:
+        return []
+    dao = TrainingSessionDAO(getattr(context, "logger", context))
+    rows = dao.get_schedule(dates[0] - ONE_DAY, dates[-1] + ONE_DAY, teacher=teacher, exclude_id=exclude_session_id)
+    proposed = _timed_bookings([(None, teacher, d, start_time, "") for d in dates], minutes)
+    return find_overlapping(proposed, _timed_bookings(rows, minutes))
+
+
+def scan_session_conflicts(start_date, end_date, teacher=None, minutes=SESSION_MINUTES, context=None) -> List[dict]:
+    """
+    Return every pair of overlapping sessions of the same teacher in [start_date, end_date].
+
+    Returns: [{"owner": teacher_id, "first": {...}, "second": {...}}, ...]
+    """
+    dao = TrainingSessionDAO(getattr(context, "logger", context))
+    rows = dao.get_schedule(start_date, end_date, teacher=teacher)
+    return _pairs_to_dicts(find_conflicts(_timed_bookings(rows, minutes)))
+
+
+# ---- Service appointments (one shared desk, owner None) ----
+
+def find_appointment_conflicts(appointment_date, appointment_time, exclude_appointment_id=None,
+                               minutes=APPOINTMENT_MINUTES, context=None) -> List[dict]:
+    """
+    Return appointments overlapping a proposed slot.
+
+    Appointments have no staff column, so every appointment books the same desk.
+
+    Returns: [{"id", "owner", "start", "end", "label"}, ...]
+    """
+    day, start_time = _as_date(appointment_date), _as_time(appointment_time)
+    if day is None or start_time is None:
+        return []
+    dao = ServiceAppointmentDAO(getattr(context, "logger", context))
+    rows = dao.get_schedule(day - ONE_DAY, day + ONE_DAY, exclude_id=exclude_appointment_id)
+    existing = _timed_bookings([(k, None, d, t, n) for k, d, t, n in rows], minutes)
+    proposed = _timed_bookings([(None, None, day, start_time, "")], minutes)
+    return [b.to_dict() for _, b in find_overlapping(proposed, existing)]
+
+
+def scan_appointment_conflicts(start_date, end_date, minutes=APPOINTMENT_MINUTES, context=None) -> List[dict]:
+    """Return every pair of overlapping appointments in [start_date, end_date]."""
+    dao = ServiceAppointmentDAO(getattr(context, "logger", context))
+    rows = dao.get_schedule(start_date, end_date)
+    return _pairs_to_dicts(find_conflicts(_timed_bookings([(k, None, d, t, n) for k, d, t, n in rows], minutes)))
+
+
+# ---- Employee contracts (owner: employee) ----
+
+def _contract_booking(row):
+    start, end = _as_date(row.get("start_date")), _as_date(row.get("end_date"))
+    if start is None or end is None or end < start:
+        return None
+    label = f"{row.get('employee_name') or ''} {start:%Y-%m-%d}..{end:%Y-%m-%d}".strip()
+    return Booking(row.get("id"), row.get("employee_id"), start, end + ONE_DAY, label, data=row)
+
+
+def _contracts_clash(a, b):
+    """Overlapping periods only clash on a shared working day with overlapping hours."""
+    first, last = max(a.start, b.start), min(a.end, b.end)
+    mask_a = a.data.get("working_days")
+    mask_b = b.data.get("working_days")
+    mask_a = 127 if mask_a is None else mask_a
+    mask_b = 127 if mask_b is None else mask_b
+    days = min((last - first).days, 7)
+    if not any(is_allowed((first + timedelta(days=i)).weekday(), mask_a & mask_b) for i in range(days)):
+        return False
+    in_a, out_a = _as_time(a.data.get("time_in")), _as_time(a.data.get("time_out"))
+    in_b, out_b = _as_time(b.data.get("time_in")), _as_time(b.data.get("time_out"))
+    if None in (in_a, out_a, in_b, out_b):
+        return True
+    return in_a < out_b and in_b < out_a
+
+
+def find_contract_conflicts(employee, start_date, end_date, time_in=None, time_out=None, working_days=None,
+                            exclude_contract_id=None, context=None) -> List[dict]:
+    """
+    Return the employee's contracts that overlap a proposed contract.
+
+    Periods must overlap on a shared working day with overlapping hours.
+    Reads only the employee's contracts in the period (employee index).
+
+    Returns: [{"id", "owner", "start", "end", "label"}, ...]
+    """
+    start_date, end_date = _as_date(start_date), _as_date(end_date)
+    if start_date is None or end_date is None:
+        return []
+    dao = EmployeeContractDAO(getattr(context, "logger", context))
+    rows = dao.get_schedule(start_date, end_date, employee=employee, exclude_id=exclude_contract_id)
+    proposed = _contract_booking({"id": None, "employee_id": employee, "start_date": start_date,
+                                  "end_date": end_date, "time_in": time_in, "time_out": time_out,
+                                  "working_days": working_days})
+    if proposed is None:
+        return []
+    existing = [b for b in map(_contract_booking, rows) if b is not None]
+    return [b.to_dict() for _, b in find_overlapping([proposed], existing, clash=_contracts_clash)]
+
+
+def scan_contract_conflicts(start_date, end_date, context=None) -> List[dict]:
+    """Return every pair of clashing contracts of the same employee that touch [start_date, end_date]."""
+    dao = EmployeeContractDAO(getattr(context, "logger", context))
+    bookings = [b for b in map(_contract_booking, dao.get_schedule(start_date, end_date)) if b is not None]
+    return _pairs_to_dicts(find_conflicts(bookings, clash=_contracts_clash))
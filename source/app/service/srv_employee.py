@@ -1,3 +1,4 @@
+from librepy.app.components.calendar import calendar_cache
 from librepy.app.forms.employee_form import EmployeeForm
 from librepy.app.data.dao.employee_dao import EmployeeDAO
 
@@ -13,11 +14,16 @@ def save_employee(data: dict, context=None) -> dict:
     Returns:
         - {"ok": False, "errors": [{"field", "message"}, ...]} when validation fails
         - {"ok": True, "result": <model instance>} on success (create/update)
+        The contracts calendar shows employee names, so its cached months are
+        invalidated on success.
     """
     form = EmployeeForm(data=data, context=context)
     if not form.is_valid():
         return {"ok": False, "errors": form.errors}
-    return form.save()
+    result = form.save()
+    if result.get("ok"):
+        calendar_cache.invalidate(calendar_cache.EMPLOYEE_CONTRACTS)
+    return result
 
 
 def delete_employee(employee_id: int, context=None) -> dict:
@@ -27,4 +33,6 @@ def delete_employee(employee_id: int, context=None) -> dict:
     """
     dao = EmployeeDAO(getattr(context, "logger", context))
     n = dao.delete_where(dao.model_class.employee_id == employee_id, operation_name='delete Employee by id')
+    if n:
+        calendar_cache.invalidate(calendar_cache.EMPLOYEE_CONTRACTS)
     return {"ok": bool(n and n > 0), "deleted": n or 0}
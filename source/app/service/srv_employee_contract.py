@@ -1,5 +1,6 @@
 from typing import List, Tuple
 
+from librepy.app.components.calendar import calendar_cache
 from librepy.app.forms.employee_contract_form import EmployeeContractForm
 from librepy.app.data.dao.employee_contract_dao import EmployeeContractDAO
 from librepy.app.data.model import Employee
@@ -21,7 +22,10 @@ def save_employee_contract(data: dict, context=None) -> dict:
     form = EmployeeContractForm(data=data, context=context)
     if not form.is_valid():
         return {"ok": False, "errors": form.errors}
-    return form.save()
+    result = form.save()
+    if result.get("ok"):
+        calendar_cache.invalidate(calendar_cache.EMPLOYEE_CONTRACTS)
+    return result
 
 
 def delete_employee_contract(contract_id: int, context=None) -> dict:
@@ -31,6 +35,8 @@ def delete_employee_contract(contract_id: int, context=None) -> dict:
     """
     dao = EmployeeContractDAO(getattr(context, "logger", context))
     n = dao.delete_where(dao.model_class.contract_id == contract_id, operation_name='delete EmployeeContract by id')
+    if n:
+        calendar_cache.invalidate(calendar_cache.EMPLOYEE_CONTRACTS)
     return {"ok": bool(n and n > 0), "deleted": n or 0}
 
 
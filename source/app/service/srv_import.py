@@ -0,0 +1,203 @@
+from itertools import islice
+
+from librepy.app.components.calendar import calendar_cache
+from librepy.app.data.import_readers import iter_rows
+from librepy.app.data.dao.employee_dao import EmployeeDAO
+from librepy.app.data.dao.service_appointment_dao import ServiceAppointmentDAO
+from librepy.app.data.dao.session_attendee_dao import SessionAttendeeDAO
+from librepy.app.data.dao.teacher_dao import TeacherDAO
+from librepy.app.forms.employee_form import EmployeeForm
+from librepy.app.forms.service_appointment_form import ServiceAppointmentForm
+from librepy.app.forms.session_attendee_form import SessionAttendeeForm
+from librepy.app.forms.teacher_form import TeacherForm
+
+IMPORT_BATCH_ROWS = 5000         # Rows validated and inserted per round
+MAX_REPORTED_ERRORS = 1000       # Row errors kept in the report; the rest are only counted
+
+_TRUE_VALUES = ('1', 'y', 'yes', 'true', 'x', 'paid')
+_FALSE_VALUES = ('0', 'n', 'no', 'false')
+
+
+class ImportTarget:
+    """How rows for one model are validated and inserted.
+
+    Args:
+        form_class: BaseForm subclass validating one row.
+        dao_class: DAO used for the bulk insert.
+        fields: Model fields taken from the form's cleaned_data.
+        conflict_fields: Unique index whose duplicates are skipped, not failed.
+        aliases: Extra header names -> form input names.
+        booleans: Form inputs parsed as yes/no before validation.
+        calendar_source: calendar_cache source showing these rows, invalidated
+            when the import inserted any.
+    """
+
+    def __init__(self, form_class, dao_class, fields, conflict_fields=(), aliases=None, booleans=(),
+                 calendar_source=None):
+        self.form_class = form_class
+        self.dao_class = dao_class
+        self.fields = tuple(fields)
+        self.conflict_fields = tuple(conflict_fields)
+        self.aliases = dict(aliases or {})
+        self.booleans = tuple(booleans)
+        self.calendar_source = calendar_source
+
+
+IMPORT_TARGETS = {
+    "attendees": ImportTarget(
+        SessionAttendeeForm, SessionAttendeeDAO,
+        fields=("session", "name", "email", "phone", "paid", "notes"),
+        conflict_fields=("session", "email"),
+        aliases={"session_id": "session", "phone_number": "phone"},
+        booleans=("paid",),
+    ),
+    "teachers": ImportTarget(
+        TeacherForm, TeacherDAO,
+        fields=("first_name", "last_name", "email"),
+    ),
+    "employees": ImportTarget(
+        EmployeeForm, EmployeeDAO,
+        fields=("first_name", "last_name", "email"),
+    ),
+    "appointments": ImportTarget(
+        ServiceAppointmentForm, ServiceAppointmentDAO,
+        fields=("name", "phone_number", "email", "appointment_date", "appointment_time", "notes"),
+        aliases={"phone_number": "phone", "appointment_date": "date", "appointment_time": "time"},
+        calendar_source=calendar_cache.SERVICE_APPOINTMENTS,
+    ),
+}
+
+
+def _parse_bool(value):
+    if value is None or isinstance(value, bool):
+        return bool(value), True
+    s = str(value).strip().lower()
+    if s in _TRUE_VALUES:
+        return True, True
+    if s in _FALSE_VALUES or s == "":
+        return False, True
+    return value, False
+
+
+def _add_errors(report, row, errors):
+    report["failed"] += 1
+    for error in errors:
+        if len(report["errors"]) >= MAX_REPORTED_ERRORS:
+            break
+        report["errors"].append({"row": row, "field": error["field"], "message": error["message"]})
+
+
+def import_file(target: str, path: str, context=None, on_progress=None) -> dict:
+    """
+    Import a .csv or .ods file into the given target (see IMPORT_TARGETS).
+
+    The first non-empty row is the header; see import_rows for the rest.
+    """
+    try:
+        rows = iter_rows(path)
+    except ValueError as e:
+        return {"ok": False, "total": 0, "inserted": 0, "skipped": 0, "failed": 0,
+                "errors": [{"row": None, "field": "__all__", "message": str(e)}]}
+    return import_rows(target, rows, context=context, on_progress=on_progress)
+
+
+def import_rows(target: str, rows, context=None, on_progress=None) -> dict:
+    """
+    Validate and bulk insert (row_number, dict) pairs.
+
+    Rows are read lazily and handled IMPORT_BATCH_ROWS at a time: each batch
+    is validated with the target's form, then inserted through
+    BaseDAO.bulk_insert (multi-row INSERTs, one transaction per chunk).
+    Duplicates on the target's unique index are skipped. The whole import
+    runs on one connection and blocks; call it through
+    pybrex.background.run_in_background from dialogs. When rows were inserted,
+    the target's cached calendar months are invalidated.
+
+    Args:
+        target: Key of IMPORT_TARGETS ("attendees", "teachers", "employees", "appointments").
+        rows: Iterable of (row_number, dict), e.g. from import_readers.iter_rows().
+        context: Optional context object for DAO construction/logging.
+        on_progress: Optional callable(report) called after every batch.
+
+    Returns:
+        {"ok": bool, "total", "inserted", "skipped", "failed",
+         "errors": [{"row", "field", "message"}, ...]}
+        ok is False only when the import stopped early (bad file, lost connection);
+        each rejected row counts once in failed and lists all its field errors
+        (first MAX_REPORTED_ERRORS entries only).
+    """
+    report = {"ok": True, "total": 0, "inserted": 0, "skipped": 0, "failed": 0, "errors": []}
+    spec = IMPORT_TARGETS.get(target)
+    if spec is None:
+        report["ok"] = False
+        report["errors"].append({"row": None, "field": "__all__", "message": f"Unknown import target '{target}'"})
+        return report
+
+    dao = spec.dao_class(getattr(context, "logger", context))
+    Model = dao.model_class
+    conflict_target = [getattr(Model, f) for f in spec.conflict_fields] or None
+
+    def _prepare(raw):
+        data = {spec.aliases.get(key, key): value for key, value in raw.items()}
+        bad = []
+        for name in spec.booleans:
+            data[name], ok = _parse_bool(data.get(name))
+            if not ok:
+                bad.append(name)
+        return data, bad
+
+    def _import_batch(batch):
+        numbers, inputs, bad_booleans = [], [], []
+        for number, raw in batch:
+            data, bad = _prepare(raw)
+            numbers.append(number)
+            inputs.append(data)
+            bad_booleans.append(bad)
+
+        valid, valid_numbers = [], []
+        validated = spec.form_class.validate_many(inputs, context=context)
+        for number, bad, (cleaned, errors) in zip(numbers, bad_booleans, validated):
+            if bad or errors:
+                _add_errors(report, number, [{"field": name, "message": "Expected yes/no"} for name in bad] + errors)
+            else:
+                valid.append({f: cleaned.get(f) for f in spec.fields})
+                valid_numbers.append(number)
+
+        result = dao.bulk_insert(
+            valid,
+            ignore_conflicts=bool(conflict_target),
+            conflict_target=conflict_target,
+            operation_name=f"import {Model.__name__}",
+        )
+        report["inserted"] += result["inserted"]
+        report["skipped"] += result["skipped"]
+        for index, message in result["failed"]:
+            _add_errors(report, valid_numbers[index], [{"field": "__all__", "message": message}])
+        if "error" in result:
+            report["ok"] = False
+            report["errors"].append({"row": None, "field": "__all__", "message": result["error"]})
+            return False
+        return True
+
+    def _run():
+        it = iter(rows)
+        while True:
+            batch = list(islice(it, IMPORT_BATCH_ROWS))
+            if not batch:
+                break
+            report["total"] += len(batch)
+            if not _import_batch(batch):
+                break
+            if on_progress is not None:
+                on_progress(report)
+
+    try:
+        dao.execute_query(_run)
+    except Exception as e:
+        dao.logger.error(f"import {Model.__name__}: error: {e}")
+        report["ok"] = False
+        report["errors"].append({"row": None, "field": "__all__", "message": str(e)})
+    # Chunks commit on their own, so a partial import still changed the calendar
+    if report["inserted"] and spec.calendar_source is not None:
+        calendar_cache.invalidate(spec.calendar_source)
+    return report
@@ -1,6 +1,9 @@
+from librepy.app.components.calendar import calendar_cache
 from librepy.app.forms.training_session_form import TrainingSessionForm
 from librepy.app.data.dao.teacher_dao import TeacherDAO
 from librepy.app.data.dao.training_session_dao import TrainingSessionDAO
+from librepy.app.service.srv_conflicts import find_session_conflicts, find_session_conflicts_many
+from librepy.app.utils.recurrence import RecurrenceRule
 
 
 def save_training_session(data: dict, context=None) -> dict:
@@ -15,11 +18,79 @@ def save_training_session(data: dict, context=None) -> dict:
     Returns:
         - {"ok": False, "errors": [{"field", "message"}, ...]} on validation failure
         - {"ok": True, "result": <model instance>} on success
+        A session overlapping another one of the same teacher fails with an
+        error on session_time.
     """
     form = TrainingSessionForm(data=data, context=context)
     if not form.is_valid():
         return {"ok": False, "errors": form.errors}
-    return form.save()
+    cleaned = form.cleaned_data
+    conflicts = find_session_conflicts(cleaned["teacher"], cleaned["session_date"], cleaned["session_time"],
+                                       exclude_session_id=cleaned.get("session_id"), context=context)
+    if conflicts:
+        return {"ok": False, "errors": [{"field": "session_time",
+                                         "message": f"The teacher is already booked: {conflicts[0]['label']}"}]}
+    result = form.save()
+    if result.get("ok"):
+        calendar_cache.invalidate(calendar_cache.TRAINING_SESSIONS)
+    return result
+
+
+def save_recurring_training_sessions(data: dict, recurrence, context=None) -> dict:
+    """
+    Validate a Training Session and create it on every date of a recurrence.
+
+    The session fields are validated once with TrainingSessionForm
+    (session_date is the first date of the series). Dates where the slot
+    overlaps another session of the teacher are skipped; the rest are
+    inserted in one transaction and the cached training calendar months are
+    invalidated.
+
+    Args:
+        data: Dict with keys: name, teacher, session_date, session_time, price.
+        recurrence: RecurrenceRule, an RRULE string ("FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10")
+                    or a dict of RecurrenceRule keyword args (freq, interval,
+                    weekdays, until, count, exdates).
+        context: Optional context object for DAO construction/logging.
+
+    Returns:
+        - {"ok": False, "errors": [{"field", "message"}, ...]} on validation failure
+        - {"ok": True, "created": n, "session_ids": [...], "skipped": [date, ...]} on success
+    """
+    form = TrainingSessionForm(data=data, context=context)
+    if not form.is_valid():
+        return {"ok": False, "errors": form.errors}
+    cleaned = form.cleaned_data
+    start = cleaned["session_date"]
+
+    try:
+        if isinstance(recurrence, RecurrenceRule):
+            rule = recurrence
+        elif isinstance(recurrence, str):
+            rule = RecurrenceRule.from_rrule(recurrence, start)
+        else:
+            rule = RecurrenceRule(start, **(recurrence or {}))
+    except (TypeError, ValueError) as e:
+        return {"ok": False, "errors": [{"field": "recurrence", "message": str(e)}]}
+
+    dates = rule.occurrences()
+    if not dates:
+        return {"ok": False, "errors": [{"field": "recurrence", "message": "The recurrence has no dates"}]}
+
+    conflicts = find_session_conflicts_many(cleaned["teacher"], dates, cleaned["session_time"], context=context)
+    booked = {proposed.start.date() for proposed, _ in conflicts}
+    free = [d for d in dates if d not in booked]
+    skipped = [d for d in dates if d in booked]
+    if not free:
+        return {"ok": False, "errors": [{"field": "recurrence", "message": "The teacher is already booked on every date"}],
+                "skipped": skipped}
+
+    dao = TrainingSessionDAO(getattr(context, "logger", context))
+    ids = dao.create_series(cleaned["name"], cleaned["teacher"], cleaned["session_time"], cleaned["price"], free)
+    if ids is None:
+        return {"ok": False, "errors": [{"field": "__all__", "message": "Could not save the training sessions"}]}
+    calendar_cache.invalidate(calendar_cache.TRAINING_SESSIONS)
+    return {"ok": True, "created": len(free), "session_ids": ids, "skipped": skipped}
 
 
 def delete_training_session(session_id: int, context=None) -> dict:
@@ -29,6 +100,8 @@ def delete_training_session(session_id: int, context=None) -> dict:
     """
     dao = TrainingSessionDAO(getattr(context, "logger", context))
     n = dao.delete_where(dao.model_class.session_id == session_id, operation_name='delete TrainingSession by id')
+    if n:
+        calendar_cache.invalidate(calendar_cache.TRAINING_SESSIONS)
     return {"ok": bool(n and n > 0), "deleted": n or 0}
 
 
@@ -0,0 +1,87 @@
+'''
+Interval overlap detection for schedules.
+
+A Booking is a half-open interval [start, end) held by an owner (teacher,
+employee, room...). find_conflicts() sorts the bookings once and sweeps
+them per owner with a heap of active end points, so a whole month of
+sessions is checked in O(n log n + conflicts) rather than by comparing
+every pair. Starts and ends only need to be comparable (datetimes for
+timed slots, dates for contract periods).
+'''
+import heapq
+from datetime import datetime, timedelta
+
+
+class Booking:
+    """One interval on an owner's schedule.
+
+    Args:
+        key: Identifier of the row (e.g. session_id); None for a proposed slot.
+        owner: What cannot be double booked (teacher id, employee id...).
+        start: Inclusive start.
+        end: Exclusive end; must be after start.
+        label: Short text for messages.
+        data: Optional extra payload for conflict predicates.
+    """
+
+    __slots__ = ('key', 'owner', 'start', 'end', 'label', 'data')
+
+    def __init__(self, key, owner, start, end, label='', data=None):
+        self.key = key
+        self.owner = owner
+        self.start = start
+        self.end = end
+        self.label = label
+        self.data = data
+
+    def to_dict(self):
+        return {'id': self.key, 'owner': self.owner, 'start': self.start, 'end': self.end, 'label': self.label}
+
+    def __repr__(self):
+        return f"<Booking {self.key} {self.owner} {self.start}..{self.end}>"
+
+
+def timed_slot(day, start_time, minutes):
+    """Return (start, end) datetimes for a slot of minutes beginning at day/start_time."""
+    start = datetime.combine(day, start_time)
+    return start, start + timedelta(minutes=minutes)
+
+
+def find_conflicts(bookings, clash=None):
+    """Return every pair of bookings of the same owner whose intervals overlap.
+
+    Args:
+        bookings: Iterable of Booking.
+        clash: Optional predicate(a, b) run on overlapping pairs to drop
+            ones that do not really collide (e.g. disjoint working days).
+
+    Returns:
+        List of (earlier, later) Booking pairs ordered by the later start.
+    """
+    ordered = sorted(bookings, key=lambda b: (str(b.owner), b.start, b.end))
+    pairs = []
+    active = []                      # heap of (end, seq, booking) for the current owner
+    owner = object()
+    for seq, booking in enumerate(ordered):
+        if booking.owner != owner:
+            owner = booking.owner
+            active = []
+        while active and active[0][0] <= booking.start:
+            heapq.heappop(active)
+        for _, _, other in active:
+            if clash is None or clash(other, booking):
+                pairs.append((other, booking))
+        heapq.heappush(active, (booking.end, seq, booking))
+    return pairs
+
+
+def find_overlapping(proposed, existing, clash=None):
+    """Return (proposed, existing) pairs that overlap; proposed slots are not compared with each other."""
+    proposed = list(proposed)
+    proposed_ids = {id(b) for b in proposed}
+    result = []
+    for a, b in find_conflicts(proposed + list(existing), clash):
+        a_new, b_new = id(a) in proposed_ids, id(b) in proposed_ids
+        if a_new != b_new:
+            result.append((a, b) if a_new else (b, a))
+    return result
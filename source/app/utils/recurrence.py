@@ -0,0 +1,155 @@
+'''
+Recurrence rules for repeating calendar entries.
+
+A RecurrenceRule is a small subset of RFC 5545 RRULE: DAILY or WEEKLY with
+an INTERVAL, a weekday set (weekly only) and an end given by UNTIL (date,
+inclusive) or COUNT. Occurrences are expanded in memory as dates; times are
+left to the caller.
+
+Weekdays use the same Mon..Sun numbering as app.utils.utils (Monday = 0)
+and may be given as a bit mask (see array_to_mask) or as a list of ints.
+
+    rule = RecurrenceRule(date(2026, 1, 5), weekdays=[0, 2], count=10)
+    rule = RecurrenceRule.from_rrule("FREQ=WEEKLY;BYDAY=MO,WE;UNTIL=20260331", date(2026, 1, 5))
+'''
+from datetime import date, datetime, timedelta
+
+from librepy.app.utils.utils import is_allowed
+
+DAILY = 'DAILY'
+WEEKLY = 'WEEKLY'
+FREQUENCIES = (DAILY, WEEKLY)
+
+MAX_OCCURRENCES = 1000           # Hard cap on one expansion
+
+WEEKDAY_CODES = ('MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU')
+
+
+def _weekday_mask(weekdays):
+    if isinstance(weekdays, int):
+        return weekdays & 0x7F
+    mask = 0
+    for day in weekdays:
+        if not 0 <= int(day) <= 6:
+            raise ValueError(f"Weekday out of range (0=Mon..6=Sun): {day}")
+        mask |= 1 << int(day)
+    return mask
+
+
+def _parse_rrule_date(text):
+    text = text.strip()
+    for fmt in ('%Y%m%d', '%Y-%m-%d', '%Y%m%dT%H%M%S', '%Y%m%dT%H%M%SZ'):
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid UNTIL date: {text}")
+
+
+class RecurrenceRule:
+    """DAILY/WEEKLY recurrence starting on a date.
+
+    Args:
+        start: First candidate date (DTSTART); it is an occurrence only if it
+            matches the weekday set.
+        freq: DAILY or WEEKLY.
+        interval: Every N days/weeks.
+        weekdays: WEEKLY only; mask or list of weekdays (Mon=0). Defaults to
+            the start date's weekday.
+        until: Last possible date (inclusive).
+        count: Number of occurrences; excluded dates still count (as in RFC 5545).
+        exdates: Dates to leave out (holidays, cancellations).
+    """
+
+    def __init__(self, start, freq=WEEKLY, interval=1, weekdays=None, until=None, count=None, exdates=()):
+        if isinstance(start, datetime):
+            start = start.date()
+        if not isinstance(start, date):
+            raise ValueError("Recurrence start must be a date")
+        freq = str(freq or WEEKLY).upper()
+        if freq not in FREQUENCIES:
+            raise ValueError(f"Unsupported frequency: {freq}")
+        interval = int(interval or 1)
+        if interval < 1:
+            raise ValueError("Interval must be at least 1")
+        if until is None and count is None:
+            raise ValueError("Recurrence needs an end date or an occurrence count")
+        if count is not None and not 1 <= int(count) <= MAX_OCCURRENCES:
+            raise ValueError(f"Occurrence count must be between 1 and {MAX_OCCURRENCES}")
+        if until is not None and until < start:
+            raise ValueError("Recurrence end date is before the start date")
+
+        self.start = start
+        self.freq = freq
+        self.interval = interval
+        self.weekday_mask = _weekday_mask(weekdays) if weekdays is not None else 1 << start.weekday()
+        if freq == WEEKLY and not self.weekday_mask:
+            raise ValueError("Weekly recurrence needs at least one weekday")
+        self.until = until
+        self.count = int(count) if count is not None else None
+        self.exdates = frozenset(exdates or ())
+
+    @classmethod
+    def from_rrule(cls, text, start, exdates=()):
+        """Build a rule from 'FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE;UNTIL=20261231' or ';COUNT=10'."""
+        parts = {}
+        text = str(text or '').strip()
+        if text.startswith('RRULE:'):
+            text = text[6:]
+        for item in text.split(';'):
+            if not item.strip():
+                continue
+            key, sep, value = item.partition('=')
+            if not sep:
+                raise ValueError(f"Invalid RRULE part: {item}")
+            parts[key.strip().upper()] = value.strip()
+        weekdays = None
+        if parts.get('BYDAY'):
+            try:
+                weekdays = [WEEKDAY_CODES.index(code.strip().upper()) for code in parts['BYDAY'].split(',')]
+            except ValueError:
+                raise ValueError(f"Invalid BYDAY: {parts['BYDAY']}")
+        return cls(
+            start,
+            freq=parts.get('FREQ', WEEKLY),
+            interval=int(parts.get('INTERVAL', 1)),
+            weekdays=weekdays,
+            until=_parse_rrule_date(parts['UNTIL']) if parts.get('UNTIL') else None,
+            count=int(parts['COUNT']) if parts.get('COUNT') else None,
+            exdates=exdates,
+        )
+
+    def _candidates(self):
+        if self.freq == DAILY:
+            step = timedelta(days=self.interval)
+            day = self.start
+            while True:
+                yield day
+                day += step
+        else:
+            # Weeks are Monday-aligned and counted from the start date's week
+            week = self.start - timedelta(days=self.start.weekday())
+            step = timedelta(weeks=self.interval)
+            days = [d for d in range(7) if is_allowed(d, self.weekday_mask)]
+            while True:
+                for d in days:
+                    day = week + timedelta(days=d)
+                    if day >= self.start:
+                        yield day
+                week += step
+
+    def occurrences(self):
+        """Return the occurrence dates in order, without exdates (at most MAX_OCCURRENCES)."""
+        result = []
+        generated = 0
+        for day in self._candidates():
+            if self.until is not None and day > self.until:
+                break
+            if self.count is not None and generated >= self.count:
+                break
+            generated += 1
+            if day not in self.exdates:
+                result.append(day)
+            if generated >= MAX_OCCURRENCES:
+                break
+        return result
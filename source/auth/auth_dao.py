@@ -285,4 +285,54 @@ class AuditLogDAO(BaseDAO):
                 AuditLog.select().order_by(AuditLog.timestamp.desc()).limit(limit)
             ),
             default_return=[],
-        ) 
\ No newline at end of file
+        ) 
+
+    def count_failures_since(self, username, since):
+        """
+        Count failed login attempts for a user at or after a point in time.
+
+        Served by the (username, timestamp) index on audit_logs.
+
+        Args:
+            username: Username to count failures for
+            since: Timezone-aware UTC datetime where the window starts
+
+        Returns:
+            int: Number of failed attempts, 0 on error
+        """
+        return self.safe_execute(
+            "count failed login attempts",
+            lambda: AuditLog.select().where(
+                (AuditLog.username == username) &
+                (AuditLog.timestamp >= since) &
+                (AuditLog.success == False)
+            ).count(),
+            default_return=0,
+        )
+
+    def purge_older_than(self, cutoff, batch_size=5000):
+        """
+        Delete audit rows older than cutoff in batches.
+
+        Each batch is its own short statement so a large backlog does not hold
+        one long transaction or lock on the table.
+
+        Args:
+            cutoff: Timezone-aware UTC datetime; rows with timestamp < cutoff are removed
+            batch_size: Rows deleted per statement
+
+        Returns:
+            int: Total number of rows deleted
+        """
+        def op():
+            total = 0
+            while True:
+                batch = (AuditLog
+                         .select(AuditLog.id)
+                         .where(AuditLog.timestamp < cutoff)
+                         .limit(batch_size))
+                deleted = AuditLog.delete().where(AuditLog.id.in_(batch)).execute()
+                total += deleted
+                if deleted < batch_size:
+                    return total
+        return self.safe_execute("purge audit logs", op, default_return=0)
@@ -64,4 +64,7 @@ class AuditLog(BaseModel):
     timestamp = DateTimeField(default=lambda: datetime.now(timezone.utc))
 
     class Meta:
-        table_name = "audit_logs" 
\ No newline at end of file
+        table_name = "audit_logs"
+        indexes = (
+            (("username", "timestamp"), False),
+        ) 
\ No newline at end of file
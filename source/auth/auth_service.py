@@ -3,6 +3,7 @@ import hmac
 import hashlib
 import base64
 import os
+import time
 from datetime import datetime, timedelta, timezone
 
 from librepy.utils.config_manager import ConfigManager
@@ -11,8 +12,13 @@ from librepy.auth.session import login as session_login, logout as session_logou
 from librepy.auth import session
 from librepy.auth.auth_exceptions import UserLockedError, UserNotFoundError, IncorrectPasswordError, UserInactiveError
 from librepy.pybrex.values import pybrex_logger
+from librepy.pybrex.background import run_in_background
+from librepy.peewee.peewee import JOIN
 
 _PBKDF2_ROUNDS_DEFAULT = 260000
+_PBKDF2_TARGET_MS_DEFAULT = 250
+_PBKDF2_PROBE_ROUNDS = 20000
+_AUDIT_RETENTION_DAYS_DEFAULT = 180
 
 
 class AuthService:
@@ -39,7 +45,12 @@ class AuthService:
     def _pbkdf2_hash(self, password: str, salt: bytes, rounds: int) -> bytes:
         return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, rounds, dklen=32)
 
-    def hash_password(self, plain: str, rounds: int = _PBKDF2_ROUNDS_DEFAULT) -> str:
+    def _hash_rounds(self) -> int:
+        """Round count for new hashes: the calibrated value, never below the default."""
+        return max(self._get_int("security", "pbkdf2_rounds", _PBKDF2_ROUNDS_DEFAULT), _PBKDF2_ROUNDS_DEFAULT)
+
+    def hash_password(self, plain: str, rounds: int = None) -> str:
+        rounds = rounds or self._hash_rounds()
         salt = os.urandom(16)
         dk = self._pbkdf2_hash(plain, salt, rounds)
         return f"{rounds}${base64.b64encode(salt).decode()}${base64.b64encode(dk).decode()}"
@@ -55,41 +66,70 @@ class AuthService:
         calculated = self._pbkdf2_hash(plain, salt, rounds)
         return hmac.compare_digest(calculated, expected)
 
-    def _normalize_ts(self, dt):
-        """Ensure the datetime is timezone-aware (UTC). Accepts datetime or ISO string."""
-        if dt is None:
+    def _stored_rounds(self, stored):
+        try:
+            return int(stored.split("$", 1)[0])
+        except (AttributeError, ValueError):
             return None
 
-        # Convert string timestamps that might have come from the DB default.
-        if isinstance(dt, str):
-            try:
-                dt = datetime.fromisoformat(dt)
-            except ValueError:
-                try:
-                    dt = datetime.strptime(dt, '%Y-%m-%d %H:%M:%S')
-                except ValueError:
-                    return None
+    def calibrate_rounds(self, target_ms=None, save=True):
+        """Pick the PBKDF2 round count that takes about target_ms on this host.
 
-        if isinstance(dt, datetime):
-            if dt.tzinfo is None:
-                return dt.replace(tzinfo=timezone.utc)
-            return dt
+        Times a short probe, scales it to the target and rounds to the nearest
+        10,000, never going below _PBKDF2_ROUNDS_DEFAULT. The result is stored
+        as security.pbkdf2_rounds in auth.conf; passwords hashed with fewer
+        rounds are rehashed on their next successful login.
+
+        Args:
+            target_ms: Target hashing time in milliseconds
+                (default security.pbkdf2_target_ms, 250)
+            save: Persist the result to auth.conf
+
+        Returns:
+            int: Calibrated round count
+        """
+        if target_ms is None:
+            target_ms = self._get_int("security", "pbkdf2_target_ms", _PBKDF2_TARGET_MS_DEFAULT)
+        salt = os.urandom(16)
+        start = time.perf_counter()
+        self._pbkdf2_hash("calibration", salt, _PBKDF2_PROBE_ROUNDS)
+        elapsed_ms = max((time.perf_counter() - start) * 1000.0, 0.001)
+        rounds = int(_PBKDF2_PROBE_ROUNDS * target_ms / elapsed_ms)
+        rounds = max(_PBKDF2_ROUNDS_DEFAULT, round(rounds, -4))
+        self.logger.info(f"AUTH: Calibrated PBKDF2 to {rounds} rounds for ~{target_ms} ms")
+        if save:
+            self._cfg.set_value("security", "pbkdf2_rounds", str(rounds))
+            self._cfg.save_config()
+        return rounds
+
+    def ensure_hash_calibration(self):
+        """Calibrate the PBKDF2 round count once, if auth.conf has none yet."""
+        if self._cfg.get_value("security", "pbkdf2_rounds", None) is None:
+            self.calibrate_rounds()
+
+    def _rehash_for(self, user, plain_password):
+        """Return a stronger hash for a verified password stored with fewer rounds than the current setting, else None."""
+        rounds = self._hash_rounds()
+        stored = self._stored_rounds(user.password_hash)
+        if stored is not None and stored >= rounds:
+            return None
+        return self.hash_password(plain_password, rounds)
 
-        # If it's neither str nor datetime, we cannot normalize – skip it.
-        return None
+    def _store_rehash(self, user, hashed):
+        self.logger.info(f"AUTH: Rehashing password for user '{user.username}' with {self._stored_rounds(hashed)} rounds")
+        updated = self._user_dao.safe_execute(
+            "rehash password",
+            lambda: self._user_dao.model_class.update(
+                password_hash=hashed,
+                updated_at=datetime.now(timezone.utc)
+            ).where(self._user_dao.model_class.id == user.id).execute(),
+            default_return=0,
+        )
+        if updated:
+            user.password_hash = hashed
 
     def _failed_attempts(self, username, since):
-        logs = self._audit_dao.list_recent(1000)
-        count = 0
-        for l in logs:
-            if l.username != username or l.success:
-                continue
-            ts = self._normalize_ts(l.timestamp)
-            if ts is None:
-                continue
-            if ts >= since:
-                count += 1
-        return count
+        return self._audit_dao.count_failures_since(username, since)
 
     def is_locked(self, username):
         max_attempts, lock_minutes = self._get_lock_settings()
@@ -99,36 +139,135 @@ class AuthService:
     def _record_attempt(self, username, success, msg=""):
         self._audit_dao.record(username, success, msg)
 
-    def authenticate(self, username, plain_password, remember=False):
-        self.logger.info(f"AUTH: Starting authentication for user '{username}', remember={remember}")
+    def purge_audit_log(self):
+        """Delete audit log rows older than the configured retention period.
+
+        security.audit_retention_days in auth.conf sets the period (default 180);
+        0 or a negative value keeps every row. The retention period never drops
+        below the lockout window, so purging cannot clear an active lock.
+
+        Returns:
+            int: Number of rows deleted
+        """
+        retention_days = self._get_int("security", "audit_retention_days", _AUDIT_RETENTION_DAYS_DEFAULT)
+        if retention_days <= 0:
+            return 0
+        _, lock_minutes = self._get_lock_settings()
+        retention = max(timedelta(days=retention_days), timedelta(minutes=lock_minutes))
+        cutoff = datetime.now(timezone.utc) - retention
+        deleted = self._audit_dao.purge_older_than(cutoff)
+        if deleted:
+            self.logger.info(f"AUTH: Purged {deleted} audit log row(s) older than {cutoff.isoformat()}")
+        return deleted
+
+    def _begin_login(self, username):
+        """Lockout check and user lookup; raises the auth error that ends the attempt."""
         if self.is_locked(username):
             self.logger.warning(f"AUTH: User '{username}' is locked")
             raise UserLockedError()
+        user = self._user_dao.get_by_username(username)
+        if not user:
+            self.logger.warning(f"AUTH: User '{username}' not found")
+            self._record_attempt(username, False, "user not found")
+            raise UserNotFoundError()
+        return user
+
+    def _finish_login(self, user, username, password_ok, rehashed, remember):
+        """Record the attempt and log in after the password check ran."""
+        if not password_ok:
+            self.logger.warning(f"AUTH: Incorrect password for user '{username}'")
+            self._record_attempt(username, False, "bad password")
+            if self.is_locked(username):
+                raise UserLockedError()
+            raise IncorrectPasswordError()
+        if not user.is_active:
+            self.logger.warning(f"AUTH: User '{username}' is inactive")
+            self._record_attempt(username, False, "inactive")
+            raise UserInactiveError()
+        self.logger.info(f"AUTH: Authentication successful for user '{username}' (ID: {user.id})")
+        self._record_attempt(username, True, "login ok")
+        if rehashed:
+            self._store_rehash(user, rehashed)
+        session_login(user)
+        self.load_access(user.id)
+        if remember:
+            self.logger.info(f"AUTH: Storing remember-me token for user '{username}'")
+            self._store_token(username)
+        else:
+            self.logger.info(f"AUTH: Remember-me token NOT stored for user '{username}'")
+        return user
+
+    def _check_password(self, user, plain_password):
+        """PBKDF2 work of a login: (password_ok, new hash or None). Touches no database or session state."""
+        if not self.verify_password(plain_password, user.password_hash):
+            return False, None
+        return True, self._rehash_for(user, plain_password)
+
+    def authenticate(self, username, plain_password, remember=False):
+        self.logger.info(f"AUTH: Starting authentication for user '{username}', remember={remember}")
         with self._user_dao.database.connection_context():
-            user = self._user_dao.get_by_username(username)
-            if not user:
-                self.logger.warning(f"AUTH: User '{username}' not found")
-                self._record_attempt(username, False, "user not found")
-                raise UserNotFoundError()
-            if not self.verify_password(plain_password, user.password_hash):
-                self.logger.warning(f"AUTH: Incorrect password for user '{username}'")
-                self._record_attempt(username, False, "bad password")
-                if self.is_locked(username):
-                    raise UserLockedError()
-                raise IncorrectPasswordError()
-            if not user.is_active:
-                self.logger.warning(f"AUTH: User '{username}' is inactive")
-                self._record_attempt(username, False, "inactive")
-                raise UserInactiveError()
-            self.logger.info(f"AUTH: Authentication successful for user '{username}' (ID: {user.id})")
-            self._record_attempt(username, True, "login ok")
-            session_login(user)
-            if remember:
-                self.logger.info(f"AUTH: Storing remember-me token for user '{username}'")
-                self._store_token(username)
+            user = self._begin_login(username)
+            password_ok, rehashed = self._check_password(user, plain_password)
+            return self._finish_login(user, username, password_ok, rehashed, remember)
+
+    def authenticate_async(self, ctx, smgr, username, plain_password, on_done, remember=False):
+        """
+        authenticate() with the password hashing on a worker thread so it
+        does not block the office UI.
+        
+        The lookup, audit records and session login run on the calling
+        (main) thread; only verify/rehash runs in the background, so the
+        worker never touches the database connection.
+        
+        Args:
+            ctx, smgr: Office context and service manager
+            username, plain_password, remember: As for authenticate()
+            on_done: Called on the main thread as on_done(user, error), where
+                error is the raised auth exception or None
+        """
+        self.logger.info(f"AUTH: Starting authentication for user '{username}', remember={remember}")
+        try:
+            user = self._begin_login(username)
+        except Exception as e:
+            on_done(None, e)
+            return
+
+        def finish(result, error):
+            if error is None:
+                try:
+                    password_ok, rehashed = result
+                    user_ = self._finish_login(user, username, password_ok, rehashed, remember)
+                except Exception as e:
+                    user_, error = None, e
             else:
-                self.logger.info(f"AUTH: Remember-me token NOT stored for user '{username}'")
-        return user
+                user_ = None
+            on_done(user_, error)
+
+        run_in_background(
+            ctx, smgr,
+            lambda: self._check_password(user, plain_password),
+            finish, name="auth-authenticate",
+        )
+
+    def register_async(self, ctx, smgr, username, plain_password, on_done, roles=None):
+        """
+        register() with the password hashed on a worker thread; the user is
+        created on the main thread and on_done(user, error) is called there.
+        """
+        def finish(hashed, error):
+            user = None
+            if error is None:
+                try:
+                    user = self._user_dao.create(username, hashed, roles)
+                except Exception as e:
+                    error = e
+            on_done(user, error)
+
+        run_in_background(
+            ctx, smgr,
+            lambda: self.hash_password(plain_password),
+            finish, name="auth-register",
+        )
 
     def _store_token(self, username):
         secret = self._cfg.get_value("remember", "secret", str(uuid.uuid4()))
@@ -168,6 +307,7 @@ class AuthService:
         if user:
             self.logger.info(f"AUTH: Auto-login successful for user '{username}' (ID: {user.id})")
             session_login(user)
+            self.load_access(user.id)
         else:
             self.logger.warning(f"AUTH: Token valid but user '{username}' not found in database")
         return user
@@ -298,7 +438,9 @@ class AuthService:
             self.logger.error(f"Error checking role before deletion: {str(e)}")
             return False, "Error occurred while validating role"
         
-        return self._role_dao.safe_delete(role_id)
+        result = self._role_dao.safe_delete(role_id)
+        session.invalidate_access()
+        return result
 
     def list_roles(self):
         """
@@ -320,7 +462,9 @@ class AuthService:
         Returns:
             bool: True if successful, False otherwise
         """
-        return self._user_dao.assign_role(user_id, role_name)
+        result = self._user_dao.assign_role(user_id, role_name)
+        session.invalidate_access()
+        return result
 
     def remove_role(self, user_id, role_name):
         """
@@ -342,7 +486,9 @@ class AuthService:
                 self.logger.warning(f"Cannot remove admin role from user {user_id}: would leave no active admins")
                 return False
         
-        return self._user_dao.remove_role(user_id, role_name)
+        result = self._user_dao.remove_role(user_id, role_name)
+        session.invalidate_access()
+        return result
 
     def role_required(self, required_roles):
         """
@@ -359,8 +505,7 @@ class AuthService:
                 if session.current_user is None:
                     raise PermissionError("Authentication required")
                 
-                user_roles = self.get_user_roles(session.current_user.id)
-                user_role_names = [role.name for role in user_roles]
+                user_role_names, _ = self.get_access(session.current_user.id)
                 
                 if not any(role in user_role_names for role in required_roles):
                     raise PermissionError(f"Requires one of: {', '.join(required_roles)}")
@@ -519,7 +664,9 @@ class AuthService:
             RolePermission.get_or_create(role=role_id, permission=permission.id)
             return True
             
-        return self._permission_dao.safe_execute("assign permission", op, default_return=False)
+        result = self._permission_dao.safe_execute("assign permission", op, default_return=False)
+        session.invalidate_access()
+        return result
 
     def remove_permission(self, role_id, perm_code):
         """
@@ -544,7 +691,9 @@ class AuthService:
             ).execute()
             return True
             
-        return self._permission_dao.safe_execute("remove permission", op, default_return=False)
+        result = self._permission_dao.safe_execute("remove permission", op, default_return=False)
+        session.invalidate_access()
+        return result
 
     def get_role_permissions(self, role_id):
         """
@@ -577,24 +726,61 @@ class AuthService:
         Returns:
             bool: True if user has permission, False otherwise
         """
-        def op():
-            from librepy.auth.auth_model import UserRole, RolePermission, Permission
-            
-            permission = self._permission_dao.get_by_code(perm_code)
-            if not permission:
-                return False
+        _, permissions = self.get_access(user_id)
+        return perm_code in permissions
+
+    def load_access(self, user_id):
+        """
+        Resolve a user's role names and permission codes in one query.
+        
+        When user_id is the logged-in user the result is cached on
+        auth.session for session.ACCESS_TTL seconds.
+        
+        Args:
+            user_id: ID of user
             
-            user_roles = UserRole.select().where(UserRole.user == user_id)
-            for user_role in user_roles:
-                role_perms = RolePermission.select().where(
-                    RolePermission.role == user_role.role,
-                    RolePermission.permission == permission.id
-                )
-                if role_perms.exists():
-                    return True
-            return False
+        Returns:
+            tuple: (frozenset of role names, frozenset of permission codes)
+        """
+        def op():
+            from librepy.auth.auth_model import UserRole, Role, RolePermission, Permission
+            rows = (UserRole
+                    .select(Role.name, Permission.code)
+                    .join(Role)
+                    .join(RolePermission, JOIN.LEFT_OUTER, on=(RolePermission.role == Role.id))
+                    .join(Permission, JOIN.LEFT_OUTER)
+                    .where(UserRole.user == user_id)
+                    .tuples())
+            roles, permissions = set(), set()
+            for role_name, perm_code in rows:
+                roles.add(role_name)
+                if perm_code is not None:
+                    permissions.add(perm_code)
+            return frozenset(roles), frozenset(permissions)
+
+        access = self._permission_dao.safe_execute("loading user access", op, default_return=None)
+        if access is None:
+            # Do not cache a failed lookup; deny for this call only
+            return frozenset(), frozenset()
+        if self._is_current_user(user_id):
+            session.set_access(user_id, *access)
+        return access
+
+    def get_access(self, user_id):
+        """
+        Return (role names, permission codes) for a user, from the session
+        cache when possible.
+        
+        Args:
+            user_id: ID of user
             
-        return self._permission_dao.safe_execute("checking user permission", op, default_return=False)
+        Returns:
+            tuple: (frozenset of role names, frozenset of permission codes)
+        """
+        access = session.get_access(user_id)
+        if access is None:
+            access = self.load_access(user_id)
+        return access
 
     def permission_required(self, perm_code):
         """
@@ -20,6 +20,9 @@ def ensure_auth_ready(ctx, smgr, *args, **kwargs):
     else:
         logger.info(f"Auth bootstrap: admin role already exists with ID {admin_role.id}")
 
+    auth_service = AuthService()
+    auth_service.ensure_hash_calibration()
+
     logger.info("Auth bootstrap: checking user count")
     dao = UserDAO(logger)
     total = dao.safe_execute("count users", lambda: dao.model_class.select().count(), default_return=0)
@@ -38,7 +41,9 @@ def ensure_auth_ready(ctx, smgr, *args, **kwargs):
             return False
         logger.info("Auth bootstrap: admin user created successfully")
 
-    auth_service = AuthService()
+    logger.info("Auth bootstrap: applying audit log retention")
+    auth_service.purge_audit_log()
+
     user = auth_service.try_auto_login()
     if user:
         logger.info(f"Auth bootstrap: auto-login succeeded for {user.username} (ID: {user.id})")
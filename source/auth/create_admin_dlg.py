@@ -19,6 +19,8 @@ class CreateAdminDialog(DialogBase):
         self.password_edit = None
         self.confirm_edit = None
         self.show_password_btn = None
+        self.ok_btn = None
+        self.busy = False
         self.password_visible = False
         self.save_successful = False
         super().__init__(ctx, smgr, **props)
@@ -92,19 +94,19 @@ class CreateAdminDialog(DialogBase):
         buttons_total_width = (button_width * 2) + button_spacing
         button_start_x = (self.POS_SIZE[2] - buttons_total_width) // 2
         
-        ok_btn = self.add_button("BtnOK", button_start_x, y, button_width, 24,
-                               DefaultButton=True,
-                               Label="OK",
-                               PushButtonType=0,
-                               BackgroundColor=0x3498DB,
-                               FontWeight=150,
-                               TextColor=0xFFFFFF)
+        self.ok_btn = self.add_button("BtnOK", button_start_x, y, button_width, 24,
+                                    DefaultButton=True,
+                                    Label="OK",
+                                    PushButtonType=0,
+                                    BackgroundColor=0x3498DB,
+                                    FontWeight=150,
+                                    TextColor=0xFFFFFF)
         cancel_btn = self.add_cancel("BtnCancel", button_start_x + button_width + button_spacing, y, button_width, 24,
                                    BackgroundColor=0x95A5A6,
                                    FontWeight=150,
                                    TextColor=0xFFFFFF)
         
-        self.add_action_listener(ok_btn, self._handle_ok)
+        self.add_action_listener(self.ok_btn, self._handle_ok)
         self.add_action_listener(self.show_password_btn, self._toggle_password_visibility)
 
     def _prepare(self):
@@ -165,6 +167,8 @@ class CreateAdminDialog(DialogBase):
             pass
 
     def _handle_ok(self, event):
+        if self.busy:
+            return
         username = self.username_edit.Text.strip()
         pwd = self.password_edit.Text
         confirm = self.confirm_edit.Text
@@ -177,19 +181,31 @@ class CreateAdminDialog(DialogBase):
         if pwd != confirm:
             msgbox("Passwords do not match", "Validation Error")
             return
-        try:
-            user = self.auth_service.register(username, pwd, roles=["admin"])
-            if not user:
-                msgbox("Failed to create admin user", "Error")
-                return
-            
-            from librepy.auth.session import login
-            login(user)
-            self.logger.info(f"Admin user {username} created successfully")
-            
-            msgbox("Admin account created. Please log in to continue.", "Success")
-            self.save_successful = True
-            self.end_execute(1)
-        except Exception as e:
-            self.logger.error(str(e))
-            msgbox(str(e), "Error") 
\ No newline at end of file
+        # Password hashing takes a noticeable fraction of a second; run it
+        # on a worker thread and finish in _on_registered.
+        self._set_busy(True)
+        self.auth_service.register_async(self.ctx, self.smgr, username, pwd,
+                                         self._on_registered, roles=["admin"])
+
+    def _set_busy(self, busy):
+        self.busy = busy
+        self.ok_btn.Model.Enabled = not busy
+        self.ok_btn.Model.Label = "Creating..." if busy else "OK"
+
+    def _on_registered(self, user, error):
+        self._set_busy(False)
+        if error is not None:
+            self.logger.error(str(error))
+            msgbox(str(error), "Error")
+            return
+        if not user:
+            msgbox("Failed to create admin user", "Error")
+            return
+
+        from librepy.auth.session import login
+        login(user)
+        self.logger.info(f"Admin user {user.username} created successfully")
+
+        msgbox("Admin account created. Please log in to continue.", "Success")
+        self.save_successful = True
+        self.end_execute(1)
@@ -1,9 +1,18 @@
+import time
+
 current_user = None
 
+# Effective roles/permissions of current_user, resolved once at login and
+# reused by the role/permission decorators until ACCESS_TTL expires or an
+# assignment changes.
+ACCESS_TTL = 300
+_access = None
+
 
 def login(user):
     global current_user
     current_user = user
+    invalidate_access()
     print(f"SESSION: User logged in - {user.username} (ID: {user.id})")
 
 
@@ -14,6 +23,30 @@ def logout():
     else:
         print("SESSION: Logout called but no user was logged in")
     current_user = None
+    invalidate_access()
+
+
+def set_access(user_id, roles, permissions):
+    """Cache the effective role names and permission codes for user_id."""
+    global _access
+    _access = (user_id, frozenset(roles), frozenset(permissions), time.monotonic())
+
+
+def get_access(user_id):
+    """Return (roles, permissions) cached for user_id, or None if missing or stale."""
+    access = _access
+    if access is None:
+        return None
+    cached_user_id, roles, permissions, loaded_at = access
+    if cached_user_id != user_id or time.monotonic() - loaded_at > ACCESS_TTL:
+        return None
+    return roles, permissions
+
+
+def invalidate_access():
+    """Drop the cached roles/permissions so the next check reloads them."""
+    global _access
+    _access = None
 
 
 def login_required(func):
@@ -23,4 +56,4 @@ def login_required(func):
             raise PermissionError("login required")
         print(f"SESSION: login_required decorator - User authenticated: {current_user.username}")
         return func(*args, **kwargs)
-    return wrapper 
\ No newline at end of file
+    return wrapper
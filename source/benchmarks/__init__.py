@@ -0,0 +1,13 @@
+'''
+Benchmarks for the database and data-access layers.
+
+Each bench_*.py module has a main() and can be run as a script with
+LibreOffice's bundled python (pyuno is required for SDBC):
+
+    <office>/program/python source/benchmarks/bench_row_decoder.py
+    <office>/program/python source/benchmarks/bench_query_templates.py --database dev
+
+Database benchmarks create their tables in a throwaway schema (see
+bench_common.BENCH_SCHEMA) and drop it when they finish; point them at a
+development database, not production.
+'''
@@ -0,0 +1,21 @@
+'''
+Make the source tree importable as the "librepy" package when a benchmark is
+run as a script (LibrePy provides that package inside the office).
+'''
+import builtins
+import os
+import sys
+import types
+
+
+def bootstrap():
+    if 'librepy' not in sys.modules:
+        try:
+            import librepy  # noqa: F401  (running inside LibrePy)
+        except ImportError:
+            package = types.ModuleType('librepy')
+            package.__path__ = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+            sys.modules['librepy'] = package
+    if not hasattr(builtins, 'MsgBox'):
+        # LibrePy injects MsgBox; print the message outside the office
+        builtins.MsgBox = lambda message, *args: print(message)
@@ -0,0 +1,145 @@
+'''
+Calendar range queries before and after migration 002 (date range indexes).
+
+Seeds TrainingSession, ServiceAppointment and EmployeeContract rows (1M each
+by default) in a scratch schema, drops the indexes migration 002 creates and
+times the DAO month-window lookups used by the calendars:
+
+    TrainingSessionDAO.get_sessions_between
+    ServiceAppointmentDAO.get_appointments_between
+    EmployeeContractDAO.get_contracts_between
+
+then applies migration 002 and times them again.
+
+    <office>/program/python source/benchmarks/bench_calendar_ranges.py --database dev --rows 1000000
+'''
+if __name__ == '__main__':
+    import _bootstrap
+    _bootstrap.bootstrap()
+
+import datetime
+import logging
+
+from librepy.app.data.dao.employee_contract_dao import EmployeeContractDAO
+from librepy.app.data.dao.service_appointment_dao import ServiceAppointmentDAO
+from librepy.app.data.dao.training_session_dao import TrainingSessionDAO
+from librepy.app.data.model import (
+    Employee, EmployeeContract, ServiceAppointment, Teacher, TrainingSession,
+)
+from librepy.benchmarks.bench_common import (
+    analyze, connect, ms, parse_args, print_table, scratch_schema, timed, uses_index,
+)
+from librepy.peewee.db_migrations.migrations import date_range_indexes_002
+from librepy.peewee.sdbc_peewee import compile_query_template
+
+logger = logging.getLogger(__name__)
+
+MODELS = [Teacher, TrainingSession, ServiceAppointment, Employee, EmployeeContract]
+FIRST_DAY = datetime.date(2015, 1, 1)
+DAYS = 7300                       # Rows are spread over ~20 years
+WINDOW = (datetime.date(2026, 2, 1), datetime.date(2026, 3, 14))   # One month grid
+
+# (label, DAO class, prepared query name, DAO method name)
+CASES = [
+    ('sessions', TrainingSessionDAO, 'sessions_between', 'get_sessions_between'),
+    ('appointments', ServiceAppointmentDAO, 'appointments_between', 'get_appointments_between'),
+    ('contracts', EmployeeContractDAO, 'contracts_between', 'get_contracts_between'),
+]
+
+
+def seed(database, schema, rows):
+    """Insert the rows server side with generate_series."""
+    first = FIRST_DAY.isoformat()
+    statements = [
+        f"""INSERT INTO "{schema}".teacher (first_name, last_name, email)
+            SELECT 'First' || g, 'Last' || g, NULL FROM generate_series(1, 100) g""",
+        f"""INSERT INTO "{schema}".employee (first_name, last_name, email)
+            SELECT 'First' || g, 'Last' || g, NULL FROM generate_series(1, 1000) g""",
+        f"""INSERT INTO "{schema}".trainingsession (name, session_date, session_time, price, teacher_id)
+            SELECT 'Session ' || g, DATE '{first}' + (g % {DAYS}),
+                   TIME '08:00' + (g % 10) * INTERVAL '1 hour', 50, 1 + g % 100
+            FROM generate_series(1, {rows}) g""",
+        f"""INSERT INTO "{schema}".serviceappointment
+                (name, phone_number, email, appointment_date, appointment_time, notes)
+            SELECT 'Customer ' || g, '555-0100', 'c' || g || '@example.com',
+                   DATE '{first}' + (g % {DAYS}), TIME '08:00' + (g % 10) * INTERVAL '1 hour', ''
+            FROM generate_series(1, {rows}) g""",
+        f"""INSERT INTO "{schema}".employeecontract
+                (employee_id, start_date, end_date, time_in, time_out, working_days)
+            SELECT 1 + g % 1000, DATE '{first}' + (g % {DAYS}), DATE '{first}' + (g % {DAYS}) + (g % 180),
+                   TIME '08:00', TIME '16:00', 31
+            FROM generate_series(1, {rows}) g""",
+    ]
+    with database.atomic():
+        for sql in statements:
+            database.execute_sql(sql)
+
+
+def drop_migration_indexes(database, schema):
+    for index_name, _, _ in date_range_indexes_002.INDEXES:
+        database.execute_sql(f'DROP INDEX IF EXISTS "{schema}"."{index_name}"')
+
+
+def apply_migration(database, schema):
+    saved = date_range_indexes_002.APPLICATION_SCHEMA
+    date_range_indexes_002.APPLICATION_SCHEMA = schema
+    try:
+        if not date_range_indexes_002.run_migration(database, logger):
+            raise RuntimeError("migration 002 failed")
+    finally:
+        date_range_indexes_002.APPLICATION_SCHEMA = saved
+
+
+def measure(database, repeat):
+    start, end = WINDOW
+    results = {}
+    for label, dao_class, query_name, method_name in CASES:
+        dao = dao_class(logger)
+        template = compile_query_template(database, dao.prepared_query(query_name))
+        indexed = uses_index(database, template.sql, template.bind({'start_date': start, 'end_date': end}))
+        method = getattr(dao, method_name)
+
+        def run():
+            rows = method(start, end, none_on_error=True)
+            if rows is None:
+                raise RuntimeError(f"{method_name} failed, see the log")
+            return rows
+
+        run()                                               # warm the page cache
+        seconds, rows = timed(run, repeat)
+        results[label] = (seconds, len(rows), indexed)
+    return results
+
+
+def main(args):
+    database = connect(args)
+    try:
+        with scratch_schema(database, MODELS, keep=args.keep) as schema:
+            seed(database, schema, args.rows)
+            drop_migration_indexes(database, schema)
+            analyze(database, schema, ['trainingsession', 'serviceappointment', 'employeecontract'])
+            before = measure(database, args.repeat)
+
+            apply_migration(database, schema)
+            analyze(database, schema, ['trainingsession', 'serviceappointment', 'employeecontract'])
+            after = measure(database, args.repeat)
+    finally:
+        database.close()
+
+    print_table(
+        f"Month window {WINDOW[0]}..{WINDOW[1]} over {args.rows:,} rows per table (median of {args.repeat})",
+        ['query', 'rows', 'before 002', 'index', 'after 002', 'index', 'speedup'],
+        [[label, after[label][1],
+          ms(before[label][0]), before[label][2],
+          ms(after[label][0]), after[label][2],
+          f"{before[label][0] / after[label][0]:.1f}x"]
+         for label, _, _, _ in CASES],
+    )
+    return before, after
+
+
+if __name__ == '__main__':
+    main(parse_args(
+        __doc__.strip().splitlines()[0],
+        add_arguments=lambda parser: parser.add_argument('--rows', type=int, default=1000000),
+    ))
@@ -0,0 +1,127 @@
+'''
+Shared helpers for the benchmark scripts: command line, scratch schema,
+timing and result tables.
+'''
+import argparse
+import os
+import statistics
+import time
+from contextlib import contextmanager
+
+BENCH_SCHEMA = 'bench_scratch'
+
+
+def parse_args(description, repeat=5, add_arguments=None):
+    """Parse the connection options shared by the database benchmarks.
+
+    Defaults come from the PG* environment variables.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--database', default=os.environ.get('PGDATABASE', 'postgres'))
+    parser.add_argument('--host', default=os.environ.get('PGHOST', 'localhost'))
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PGPORT', 5432)))
+    parser.add_argument('--user', default=os.environ.get('PGUSER'))
+    parser.add_argument('--password', default=os.environ.get('PGPASSWORD'))
+    parser.add_argument('--repeat', type=int, default=repeat, help='timed runs per case (median is reported)')
+    parser.add_argument('--keep', action='store_true', help=f'keep the {BENCH_SCHEMA} schema afterwards')
+    if add_arguments is not None:
+        add_arguments(parser)
+    return parser.parse_args()
+
+
+def connect(args):
+    """Open an SDBCPostgresqlDatabase for the parsed arguments."""
+    from librepy.peewee.sdbc_peewee import SDBCPostgresqlDatabase
+    database = SDBCPostgresqlDatabase(
+        args.database,
+        user=args.user,
+        password=args.password,
+        host=args.host,
+        port=args.port,
+        autoconnect=False,
+    )
+    database.connect()
+    return database
+
+
+@contextmanager
+def scratch_schema(database, models, keep=False, schema=BENCH_SCHEMA):
+    """Bind models to database in a fresh schema and create their tables.
+
+    The models' schema/database are restored and the schema is dropped
+    (unless keep) on exit.
+    """
+    saved = [(model, model._meta.schema, model._meta.database) for model in models]
+    database.execute_sql(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
+    database.execute_sql(f'CREATE SCHEMA "{schema}"')
+    try:
+        for model in models:
+            model._meta.schema = schema
+            model._meta.database = database
+        database.create_tables(models)
+        yield schema
+    finally:
+        for model, model_schema, model_database in saved:
+            model._meta.schema = model_schema
+            model._meta.database = model_database
+        if not keep:
+            database.execute_sql(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
+
+
+def timed(func, repeat):
+    """Run func repeat times; return (median seconds, last result)."""
+    timings = []
+    result = None
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+@contextmanager
+def count_statements(database):
+    """Count execute_sql calls on database; yields a one-item list holding the count."""
+    counter = [0]
+    patched = 'execute_sql' in vars(database)
+    execute_sql = database.execute_sql
+
+    def counting(*args, **kwargs):
+        counter[0] += 1
+        return execute_sql(*args, **kwargs)
+
+    database.execute_sql = counting
+    try:
+        yield counter
+    finally:
+        if patched:
+            database.execute_sql = execute_sql
+        else:
+            del database.execute_sql
+
+
+def analyze(database, schema, tables):
+    for table in tables:
+        database.execute_sql(f'ANALYZE "{schema}"."{table}"')
+
+
+def uses_index(database, sql, params=()):
+    """Return True if the plan for sql reads any index."""
+    cursor = database.execute_sql('EXPLAIN ' + sql, params)
+    return any('Index' in row[0] for row in cursor.fetchall())
+
+
+def print_table(title, header, rows):
+    """Print rows as an aligned text table."""
+    rows = [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(str(h)), *(len(r[i]) for r in rows)) if rows else len(str(h)) for i, h in enumerate(header)]
+    print()
+    print(title)
+    print('  '.join(str(h).ljust(w) for h, w in zip(header, widths)).rstrip())
+    print('  '.join('-' * w for w in widths))
+    for row in rows:
+        print('  '.join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+
+
+def ms(seconds):
+    return f"{seconds * 1000:.2f} ms"
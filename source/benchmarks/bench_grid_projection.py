@@ -0,0 +1,121 @@
+'''
+Session grid rows/sec: model instances vs projected tuples.
+
+Seeds TrainingSession rows (50k by default) and their teachers in a scratch
+schema and scrolls the session grid source used by TrainingSessionList from
+top to bottom, one grid page at a time, two ways:
+
+    models      the previous search_source(): select(TrainingSession, Teacher)
+                model instances, one dict per row via getattr
+    projection  TrainingSessionDAO.search_source() today: a .tuples() query
+                projected with the grid column formatters
+
+    <office>/program/python source/benchmarks/bench_grid_projection.py --database dev --rows 50000
+'''
+if __name__ == '__main__':
+    import _bootstrap
+    _bootstrap.bootstrap()
+
+import datetime
+import logging
+
+from librepy.app.data.dao.training_session_dao import TrainingSessionDAO
+from librepy.app.data.model import Teacher, TrainingSession
+from librepy.benchmarks.bench_common import (
+    analyze, connect, ms, parse_args, print_table, scratch_schema, timed,
+)
+
+logger = logging.getLogger(__name__)
+
+MODELS = [Teacher, TrainingSession]
+TEACHERS = 200
+FIRST_DAY = datetime.date(2020, 1, 1)
+PAGE_SIZE = 100                 # TrainingSessionList.GRID_PAGE_SIZE
+
+
+def seed(database, schema, rows):
+    with database.atomic():
+        database.execute_sql(
+            f"""INSERT INTO "{schema}".teacher (first_name, last_name, email)
+                SELECT 'First' || g, 'Last' || g, 'teacher' || g || '@example.com'
+                FROM generate_series(1, {TEACHERS}) g""")
+        database.execute_sql(
+            f"""INSERT INTO "{schema}".trainingsession (name, session_date, session_time, price, teacher_id)
+                SELECT 'Session ' || g, DATE '{FIRST_DAY.isoformat()}' + (g % 2500),
+                       TIME '08:00' + (g % 10) * INTERVAL '1 hour', 12.50 + g % 100, 1 + g % {TEACHERS}
+                FROM generate_series(1, {rows}) g""")
+
+
+def model_row(ts):
+    """Grid dict the way search_source() built it before the tuple projection."""
+    teacher = getattr(ts, 'teacher', None)
+    t_first = getattr(teacher, 'first_name', '') or ''
+    t_last = getattr(teacher, 'last_name', '') or ''
+    session_date = getattr(ts, 'session_date', None)
+    session_time = getattr(ts, 'session_time', None)
+    price = getattr(ts, 'price', None)
+    return {
+        'id': getattr(ts, 'session_id', None),
+        'name': getattr(ts, 'name', ''),
+        'teacher_name': f"{t_first} {t_last}".strip(),
+        'session_date': session_date.strftime('%Y-%m-%d') if session_date is not None else '',
+        'session_time': session_time.strftime('%H:%M') if session_time is not None else '',
+        'price': float(price) if price is not None else None,
+    }
+
+
+def model_source(dao):
+    """The previous search_source(''): model rows mapped by model_row."""
+    return dao.page_source(
+        query_factory=lambda: TrainingSession.select(TrainingSession, Teacher).join(Teacher),
+        row_mapper=model_row,
+        sort_fields=dao.search_source().sort_fields,
+        default_sort='session_date',
+    )
+
+
+def scroll(make_source):
+    """Fetch every row of a fresh source in grid pages, as scrolling the grid does."""
+    source = make_source()
+    total = source.count()
+    rows = []
+    for offset in range(0, total, PAGE_SIZE):
+        rows.extend(source.fetch(offset, PAGE_SIZE))
+    return rows
+
+
+def main(args):
+    database = connect(args)
+    dao = TrainingSessionDAO(logger)
+    try:
+        with scratch_schema(database, MODELS, keep=args.keep) as schema:
+            seed(database, schema, args.rows)
+            analyze(database, schema, ['teacher', 'trainingsession'])
+
+            # also warms the page cache
+            if scroll(lambda: model_source(dao)) != scroll(dao.search_source):
+                raise AssertionError("model and projection sources return different rows")
+
+            models, rows = timed(lambda: scroll(lambda: model_source(dao)), args.repeat)
+            projection, _ = timed(lambda: scroll(dao.search_source), args.repeat)
+    finally:
+        database.close()
+
+    count = len(rows)
+    print_table(
+        f"Session grid source, {count:,} rows in pages of {PAGE_SIZE} (median of {args.repeat})",
+        ['path', 'time', 'rows/sec'],
+        [
+            ['models + getattr', ms(models), f"{count / models:,.0f}"],
+            ['tuple projection', ms(projection), f"{count / projection:,.0f}"],
+        ],
+    )
+    print(f"speedup: {models / projection:.2f}x")
+    return {'models': models, 'projection': projection}
+
+
+if __name__ == '__main__':
+    main(parse_args(
+        __doc__.strip().splitlines()[0],
+        add_arguments=lambda parser: parser.add_argument('--rows', type=int, default=50000),
+    ))
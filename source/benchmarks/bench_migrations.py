@@ -0,0 +1,89 @@
+'''
+Migration pass cost: first run, current-schema fast path and one new migration.
+
+Replaces MIGRATION_ORDER with stub migrations (200 by default) whose
+run_migration() does nothing, points the tracking tables at a scratch schema
+and runs run_all_migrations() three times:
+
+    first pass     every stub is pending
+    current        the stored fingerprint matches, the pass is skipped
+    one new        a stub is appended, only it is applied
+
+For each pass it reports the wall time and the number of execute_sql calls.
+
+    <office>/program/python source/benchmarks/bench_migrations.py --database dev --migrations 200
+'''
+if __name__ == '__main__':
+    import _bootstrap
+    _bootstrap.bootstrap()
+
+import functools
+import logging
+import time
+
+from librepy.benchmarks.bench_common import (
+    connect, count_statements, ms, parse_args, print_table, scratch_schema,
+)
+from librepy.peewee.db_migrations import migration_manager
+
+logger = logging.getLogger(__name__)
+
+
+class StubMigration:
+    """Stands in for a migration module; applies nothing."""
+
+    def __init__(self, name):
+        self.MIGRATION_NAME = name
+
+    def run_migration(self, database, logger):
+        return True
+
+
+def stub_order(count):
+    return [(f'{i:03d}_bench_stub', StubMigration(f'{i:03d}_bench_stub')) for i in range(1, count + 1)]
+
+
+def run_pass(database):
+    with count_statements(database) as counter:
+        start = time.perf_counter()
+        ok = migration_manager.run_all_migrations(logger, database)
+        seconds = time.perf_counter() - start
+    if not ok:
+        raise RuntimeError("run_all_migrations failed, see the log")
+    return seconds, counter[0]
+
+
+def main(args):
+    database = connect(args)
+    # run_all_migrations() opens the connection itself; keep the benchmark's
+    # open connection so connect time is not part of the measurement
+    database.connect = functools.partial(type(database).connect, database, reuse_if_open=True)
+    saved = migration_manager.MIGRATION_ORDER, migration_manager.APPLICATION_SCHEMA
+    try:
+        with scratch_schema(database, [], keep=args.keep) as schema:
+            migration_manager.APPLICATION_SCHEMA = schema
+            migration_manager.MIGRATION_ORDER = stub_order(args.migrations)
+            results = [
+                ('first pass', args.migrations) + run_pass(database),
+                ('current', 0) + run_pass(database),
+            ]
+            migration_manager.MIGRATION_ORDER = stub_order(args.migrations + 1)
+            results.append(('one new', 1) + run_pass(database))
+    finally:
+        migration_manager.MIGRATION_ORDER, migration_manager.APPLICATION_SCHEMA = saved
+        del database.connect
+        database.close()
+
+    print_table(
+        f"run_all_migrations with {args.migrations} stub migrations",
+        ['pass', 'applied', 'time', 'statements'],
+        [[name, applied, ms(seconds), statements] for name, applied, seconds, statements in results],
+    )
+    return results
+
+
+if __name__ == '__main__':
+    main(parse_args(
+        __doc__.strip().splitlines()[0],
+        add_arguments=lambda parser: parser.add_argument('--migrations', type=int, default=200),
+    ))
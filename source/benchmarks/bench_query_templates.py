@@ -0,0 +1,79 @@
+'''
+Per-call SQL cost: building and compiling a query vs binding a cached template.
+
+Before the query template cache every DAO call rebuilt its peewee query and
+compiled it with get_sql_context().sql(query).query(). execute_prepared()
+now looks up the QueryTemplate compiled once per (DAO, name) and only binds
+the new values. This times both paths for the TrainingSessionDAO prepared
+queries, without executing anything, so no server is needed.
+
+    <office>/program/python source/benchmarks/bench_query_templates.py --calls 20000
+'''
+if __name__ == '__main__':
+    import _bootstrap
+    _bootstrap.bootstrap()
+
+import argparse
+import datetime
+from types import SimpleNamespace
+
+from librepy.app.data.dao.training_session_dao import TrainingSessionDAO
+from librepy.benchmarks.bench_common import print_table, timed
+from librepy.peewee.sdbc_peewee import SDBCPostgresqlDatabase
+
+# (prepared query name, values bound per call)
+CASES = [
+    ('sessions_between', {'start_date': datetime.date(2026, 2, 1), 'end_date': datetime.date(2026, 3, 14)}),
+    ('session_by_id', {'session_id': 4242}),
+]
+
+
+def build_and_compile(database, name, values, calls):
+    """The old path: a fresh query with the values inlined, compiled every call."""
+    declare = TrainingSessionDAO.PREPARED_QUERIES[name]
+    for _ in range(calls):
+        query = declare(SimpleNamespace(**values))
+        database.get_sql_context().sql(query).query()
+
+
+def bind_template(database, dao, name, values, calls):
+    """What execute_prepared() does before executing: cache lookups and bind."""
+    key = (TrainingSessionDAO, name)
+    for _ in range(calls):
+        database.query_template(key, dao.prepared_query(name)).bind(values)
+
+
+def main(calls=20000, repeat=5):
+    # Compiling needs the dialect only; the database is never connected
+    database = SDBCPostgresqlDatabase('bench', autoconnect=False)
+    dao = TrainingSessionDAO(None)
+    rows = []
+    results = {}
+    for name, values in CASES:
+        template = database.query_template((TrainingSessionDAO, name), dao.prepared_query(name))
+        expected = database.get_sql_context().sql(
+            TrainingSessionDAO.PREPARED_QUERIES[name](SimpleNamespace(**values))).query()
+        if (template.sql, template.bind(values)) != expected:
+            raise AssertionError(f"template for {name} does not match the compiled query")
+
+        compiled, _ = timed(lambda: build_and_compile(database, name, values, calls), repeat)
+        bound, _ = timed(lambda: bind_template(database, dao, name, values, calls), repeat)
+        results[name] = (compiled / calls, bound / calls)
+        rows.append([name, f"{compiled / calls * 1e6:.1f} us", f"{bound / calls * 1e6:.1f} us",
+                     f"{(compiled - bound) / calls * 1e6:.1f} us", f"{compiled / bound:.1f}x"])
+
+    print_table(
+        f"TrainingSessionDAO prepared queries, {calls} calls (median of {repeat})",
+        ['query', 'build + compile', 'template bind', 'saved per call', 'speedup'],
+        rows,
+    )
+    print(f"template cache: {database.query_template_hits} hits, {database.query_template_misses} misses")
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    options = parser.parse_args()
+    main(options.calls, options.repeat)
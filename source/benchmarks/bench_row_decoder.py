@@ -0,0 +1,129 @@
+'''
+Row decoding throughput: compiled column readers vs per-cell dispatch.
+
+Cursor._get_row() applies the readers compiled once per result set in
+_update_description(); Cursor._get_row_generic() is the original per-cell
+type dispatch (kept as the fallback path). Both read the same in-memory
+XResultSet stand-in, so the numbers isolate the Python decoding cost from
+the driver.
+
+    <office>/program/python source/benchmarks/bench_row_decoder.py --rows 200000
+'''
+if __name__ == '__main__':
+    import _bootstrap
+    _bootstrap.bootstrap()
+
+import argparse
+from types import SimpleNamespace
+
+from librepy.benchmarks.bench_common import print_table, timed
+from librepy.peewee.sdbc_dbapi import Cursor, DataType
+
+# (name, SDBC type, value) for each column of the fake result set
+COLUMNS = [
+    ('id', DataType.INTEGER, 42),
+    ('name', DataType.VARCHAR, 'Introduction to welding'),
+    ('session_date', DataType.DATE, SimpleNamespace(Year=2026, Month=3, Day=14)),
+    ('session_time', DataType.TIME, SimpleNamespace(Hours=9, Minutes=30, Seconds=0)),
+    ('price', DataType.NUMERIC, '125.50'),
+    ('created_at', DataType.TIMESTAMP,
+     SimpleNamespace(Year=2026, Month=3, Day=1, Hours=8, Minutes=15, Seconds=2)),
+    ('paid', DataType.BOOLEAN, True),
+    ('notes', DataType.VARCHAR, None),
+]
+
+
+class FakeMetaData:
+    def __init__(self, columns):
+        self.columns = columns
+
+    def getColumnCount(self):
+        return len(self.columns)
+
+    def getColumnName(self, index):
+        return self.columns[index - 1][0]
+
+    def getColumnType(self, index):
+        return self.columns[index - 1][1]
+
+    def getPrecision(self, index):
+        return 0
+
+    def getScale(self, index):
+        return 0
+
+    def getColumnDisplaySize(self, index):
+        return 0
+
+    def isNullable(self, index):
+        return 1
+
+
+class FakeResultSet:
+    """Endless XResultSet stand-in returning the same row; next() is always True."""
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.values = [value for _, _, value in columns]
+        self.last_null = False
+
+    def next(self):
+        return True
+
+    def getMetaData(self):
+        return FakeMetaData(self.columns)
+
+    def _get(self, index):
+        value = self.values[index - 1]
+        self.last_null = value is None
+        return value
+
+    getString = getInt = getDouble = getBoolean = getDate = getTime = getTimestamp = getBytes = _get
+
+    def wasNull(self):
+        return self.last_null
+
+    def close(self):
+        pass
+
+
+def _cursor():
+    cursor = Cursor(None)
+    cursor._resultset = FakeResultSet(COLUMNS)
+    cursor._update_description()
+    return cursor
+
+
+def _decode(read_row, resultset, rows):
+    next_row = resultset.next
+    for _ in range(rows):
+        next_row()
+        read_row()
+
+
+def main(rows=200000, repeat=5):
+    cursor = _cursor()
+    resultset = cursor._resultset
+    if cursor._get_row() != cursor._get_row_generic():
+        raise AssertionError("compiled and generic decoders disagree")
+
+    generic, _ = timed(lambda: _decode(cursor._get_row_generic, resultset, rows), repeat)
+    compiled, _ = timed(lambda: _decode(cursor._get_row, resultset, rows), repeat)
+    print_table(
+        f"Row decoding, {len(COLUMNS)} columns x {rows} rows (median of {repeat})",
+        ['path', 'seconds', 'rows/sec'],
+        [
+            ['per-cell dispatch (_get_row_generic)', f"{generic:.3f}", f"{rows / generic:,.0f}"],
+            ['compiled readers (_get_row)', f"{compiled:.3f}", f"{rows / compiled:,.0f}"],
+        ],
+    )
+    print(f"speedup: {generic / compiled:.2f}x")
+    return {'generic': generic, 'compiled': compiled}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=5)
+    options = parser.parse_args()
+    main(options.rows, options.repeat)
@@ -0,0 +1,127 @@
+'''
+Training session search with and without the pg_trgm GIN indexes of migration 003.
+
+Seeds TrainingSession rows (100k by default) and their teachers in a scratch
+schema and times what TrainingSessionList.load_data triggers for a few search
+texts: TrainingSessionDAO.search_source(), its count() and the first grid page
+fetch(). Runs first without the trigram indexes and then after applying
+migration 003. Needs the pg_trgm extension (or the right to create it).
+
+    <office>/program/python source/benchmarks/bench_session_search.py --database dev --rows 100000
+'''
+if __name__ == '__main__':
+    import _bootstrap
+    _bootstrap.bootstrap()
+
+import datetime
+import logging
+
+from librepy.app.data.dao.training_session_dao import TrainingSessionDAO
+from librepy.app.data.model import Teacher, TrainingSession
+from librepy.benchmarks.bench_common import (
+    analyze, connect, ms, parse_args, print_table, scratch_schema, timed, uses_index,
+)
+from librepy.peewee.db_migrations.index_helpers import index_exists
+from librepy.peewee.db_migrations.migrations import trigram_search_indexes_003
+
+logger = logging.getLogger(__name__)
+
+MODELS = [Teacher, TrainingSession]
+TEACHERS = 500
+FIRST_DAY = datetime.date(2020, 1, 1)
+PER_PAGE = 100                  # TrainingSessionList.GRID_PAGE_SIZE
+
+# Search texts as typed into the session grid's search box
+SEARCHES = [
+    'welding 4242',     # session name substring
+    'Hoover',           # teacher last name
+    'Ann10',            # teacher first name
+    'no such thing',    # no match, scans the whole candidate set
+]
+
+COURSES = ['Welding', 'Forklift', 'First aid', 'Crane', 'Electrical safety', 'Scaffolding']
+LAST_NAMES = ['Hoover', 'Miller', 'Yoder', 'Stoltzfus', 'King', 'Fisher', 'Beiler', 'Zook']
+
+
+def seed(database, schema, rows):
+    courses = ', '.join(f"'{c}'" for c in COURSES)
+    last_names = ', '.join(f"'{n}'" for n in LAST_NAMES)
+    with database.atomic():
+        database.execute_sql(
+            f"""INSERT INTO "{schema}".teacher (first_name, last_name, email)
+                SELECT (ARRAY['Ann', 'Ben', 'Cal', 'Dee', 'Eli'])[1 + g % 5] || g,
+                       (ARRAY[{last_names}])[1 + g % {len(LAST_NAMES)}],
+                       'teacher' || g || '@example.com'
+                FROM generate_series(1, {TEACHERS}) g""")
+        database.execute_sql(
+            f"""INSERT INTO "{schema}".trainingsession (name, session_date, session_time, price, teacher_id)
+                SELECT (ARRAY[{courses}])[1 + g % {len(COURSES)}] || ' ' || g,
+                       DATE '{FIRST_DAY.isoformat()}' + (g % 2500),
+                       TIME '08:00' + (g % 10) * INTERVAL '1 hour', 50, 1 + g % {TEACHERS}
+                FROM generate_series(1, {rows}) g""")
+
+
+def apply_migration(database, schema):
+    saved = trigram_search_indexes_003.APPLICATION_SCHEMA
+    trigram_search_indexes_003.APPLICATION_SCHEMA = schema
+    try:
+        if not trigram_search_indexes_003.run_migration(database, logger):
+            raise RuntimeError("migration 003 failed")
+        return [name for name, _, _ in trigram_search_indexes_003.INDEXES
+                if index_exists(database, schema, name)]
+    finally:
+        trigram_search_indexes_003.APPLICATION_SCHEMA = saved
+
+
+def first_screen(dao, text):
+    """A fresh search source, its row count and the first grid page."""
+    source = dao.search_source(text)
+    total = source.count()
+    return total, source.fetch(0, PER_PAGE)
+
+
+def measure(database, repeat):
+    dao = TrainingSessionDAO(logger)
+    results = {}
+    for text in SEARCHES:
+        sql, params = dao.search_source(text).query_factory().sql()
+        indexed = uses_index(database, sql, params)
+        first_screen(dao, text)                                 # warm the page cache
+        seconds, (total, rows) = timed(lambda: first_screen(dao, text), repeat)
+        results[text] = (seconds, total, indexed)
+    return results
+
+
+def main(args):
+    database = connect(args)
+    try:
+        with scratch_schema(database, MODELS, keep=args.keep) as schema:
+            seed(database, schema, args.rows)
+            analyze(database, schema, ['teacher', 'trainingsession'])
+            before = measure(database, args.repeat)
+
+            created = apply_migration(database, schema)
+            if not created:
+                print("pg_trgm is not available; migration 003 created no indexes")
+            analyze(database, schema, ['teacher', 'trainingsession'])
+            after = measure(database, args.repeat)
+    finally:
+        database.close()
+
+    print_table(
+        f"search_source count + first page ({PER_PAGE} rows) over {args.rows:,} sessions (median of {args.repeat})",
+        ['search', 'matches', 'without 003', 'index', 'with 003', 'index', 'speedup'],
+        [[repr(text), after[text][1],
+          ms(before[text][0]), before[text][2],
+          ms(after[text][0]), after[text][2],
+          f"{before[text][0] / after[text][0]:.1f}x"]
+         for text in SEARCHES],
+    )
+    return before, after
+
+
+if __name__ == '__main__':
+    main(parse_args(
+        __doc__.strip().splitlines()[0],
+        add_arguments=lambda parser: parser.add_argument('--rows', type=int, default=100000),
+    ))
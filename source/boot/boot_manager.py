@@ -4,10 +4,15 @@ BootManager - Synchronous application initialization manager.
 Handles the complete startup sequence without threading or polling loops.
 """
 
+import json
+import os
+import time
 import traceback
+from contextlib import contextmanager
+from datetime import datetime
 from librepy.pybrex.values import pybrex_logger
 from librepy.pybrex.msgbox import msgbox
-from librepy.boot.bootstrap import ensure_database_ready
+from librepy.boot.bootstrap import ensure_database_ready, release_boot_connection
 #from librepy.auth.bootstrap import ensure_auth_ready
 
 logger = pybrex_logger(__name__)
@@ -20,6 +25,72 @@ class BootError(Exception):
         self.original_exception = original_exception
         super().__init__(f"Boot failed at {stage}: {message}")
 
+class BootProfiler:
+    """
+    Records wall time per boot stage and writes it to the log and a JSON file.
+    
+    Stages may nest (COMPONENT_LOAD runs inside APP_INIT); each is reported
+    with its own elapsed time. The JSON file keeps the last MAX_RUNS boots so
+    startup regressions can be compared across runs.
+    """
+    FILE_NAME = "boot_profile.json"
+    MAX_RUNS = 50
+
+    def __init__(self, logger):
+        self.logger = logger
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self._start = time.perf_counter()
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block as stage name (recorded even if it raises)."""
+        # Appended on entry so nested stages are listed after their parent
+        entry = {"stage": name, "ms": None, "ok": False}
+        self.stages.append(entry)
+        start = time.perf_counter()
+        try:
+            yield
+            entry["ok"] = True
+        finally:
+            entry["ms"] = round((time.perf_counter() - start) * 1000.0, 1)
+
+    def report(self, outcome):
+        """Log the stage timings and append this run to the JSON profile file."""
+        total_ms = round((time.perf_counter() - self._start) * 1000.0, 1)
+        summary = ", ".join(f"{s['stage']}={s['ms']:.0f}ms" for s in self.stages)
+        self.logger.info(f"BootManager: Boot {outcome} in {total_ms:.0f}ms ({summary})")
+        run = {
+            "started_at": self.started_at,
+            "outcome": outcome,
+            "total_ms": total_ms,
+            "stages": self.stages,
+        }
+        try:
+            self._append_run(run)
+        except Exception as e:
+            self.logger.warning(f"BootManager: Could not write boot profile: {e}")
+        return run
+
+    def _profile_path(self):
+        from librepy.utils.config_manager import ConfigManager
+        cfg = ConfigManager(self.FILE_NAME)
+        cfg.ensure_config_dir()
+        return cfg.config_path
+
+    def _append_run(self, run):
+        path = self._profile_path()
+        runs = []
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    runs = json.load(f).get("runs", [])
+            except (ValueError, AttributeError):
+                runs = []
+        runs = (runs + [run])[-self.MAX_RUNS:]
+        with open(path, "w") as f:
+            json.dump({"runs": runs}, f, indent=2)
+
 class BootManager:
     """
     Manages the complete application boot sequence synchronously.
@@ -29,6 +100,10 @@ class BootManager:
     2. Auth bootstrap   (Skipped unless needed)
     3. App creation
     4. Return initialized application
+    
+    The database connection validated in stage 1 stays open through App
+    creation and is returned to the pool afterwards. Stage timings are
+    recorded by a BootProfiler and reported when the boot ends.
     """
     
     def __init__(self, ctx, smgr):
@@ -36,6 +111,7 @@ class BootManager:
         self.smgr = smgr
         self.logger = logger
         self.current_stage = "STARTING"
+        self.profiler = BootProfiler(logger)
         
     def boot_application(self):
         """
@@ -47,13 +123,16 @@ class BootManager:
         Raises:
             BootError: If any stage fails critically
         """
+        outcome = "failed"
         try:
             self.logger.info("BootManager: Starting application boot sequence")
             
             # Stage 1: Database bootstrap
             self.current_stage = "DATABASE_BOOTSTRAP"
             self.logger.info("BootManager: Running database bootstrap")
-            if not ensure_database_ready(self.logger):
+            with self.profiler.stage("DATABASE_BOOTSTRAP"):
+                ready = ensure_database_ready(self.logger, self.profiler)
+            if not ready:
                 raise BootError("DATABASE_BOOTSTRAP", "Database configuration or connection failed")
 
             # Stage 2: Pre-copy Jasper report templates
@@ -64,8 +143,9 @@ class BootManager:
             # Stage 3: App creation
             self.current_stage = "APP_INIT"
             self.logger.info("BootManager: Creating App")
-            from librepy.app.core.main import App
-            app = App(self.ctx, self.smgr)
+            with self.profiler.stage("APP_INIT"):
+                from librepy.app.core.main import App
+                app = App(self.ctx, self.smgr, profiler=self.profiler)
             
             # Stage 4: Verify initialization completed
             self.current_stage = "VERIFICATION"
@@ -73,6 +153,7 @@ class BootManager:
                 raise BootError("VERIFICATION", "App initialization did not complete properly")
             
             self.current_stage = "COMPLETED"
+            outcome = "completed"
             self.logger.info("BootManager: Application boot completed successfully")
             return app
             
@@ -84,6 +165,9 @@ class BootManager:
             self.logger.error(f"BootManager: Unexpected error in {self.current_stage}: {str(e)}")
             self.logger.error(traceback.format_exc())
             raise BootError(self.current_stage, f"Unexpected error: {str(e)}", e)
+        finally:
+            release_boot_connection(self.logger)
+            self.profiler.report(outcome)
     
     def handle_boot_failure(self, boot_error):
         """
@@ -1,18 +1,54 @@
 """
 Bootstrap utilities to guarantee a working database connection before the UI loads.
+
+The connection opened to validate the configuration is the same pooled
+connection the migrations run on and the one App initialization reuses, so
+startup pays for a single SDBC handshake.
 """
 
 import os
+from contextlib import nullcontext
 from librepy.utils.db_config_manager import DatabaseConfigManager
 from librepy.peewee.connection import test_connection
-from librepy.peewee.connection.db_connection import reinitialize_database_connection, get_database_connection
+from librepy.peewee.connection.db_connection import reinitialize_database_connection, close_database_pool
 from librepy.pybrex.msgbox import msgbox
 
 MAX_RETRIES = 3
 
 
-def ensure_database_ready(logger):
-    """Return True when the database is reachable and migrations are up-to-date."""
+def _open_validated_connection(params, logger):
+    """Build the app database and open its connection on this thread.
+
+    Returns:
+        tuple: (database, None) on success, (None, user-facing message) on failure
+    """
+    if not params.get("database"):
+        return None, "Please select a database before testing the connection."
+    db = reinitialize_database_connection()
+    try:
+        db.connect()
+        db.execute_sql("SELECT 1")
+        return db, None
+    except Exception as e:
+        logger.debug(f"Database validation failed: {e}")
+        close_database_pool()
+        return None, test_connection.describe_error(
+            e, params.get("host"), params.get("port"), params.get("database")
+        )
+
+
+def ensure_database_ready(logger, profiler=None):
+    """Return True when the database is reachable and migrations are up-to-date.
+
+    On success the validated connection is left open on the calling thread so
+    App initialization reuses it; call release_boot_connection() afterwards to
+    hand it back to the pool.
+
+    Args:
+        logger: Logger for progress messages
+        profiler: Optional BootProfiler; connection and migration times are
+            recorded as DB_CONNECT and MIGRATIONS
+    """
     logger.info("Starting database readiness check")
     cfg_mgr = DatabaseConfigManager()
     retries = 0
@@ -25,15 +61,15 @@ def ensure_database_ready(logger):
                 msgbox("Database configuration is required to run the application.", "Database Setup")
                 return False
             continue
-        logger.info("Testing database connection")
-        ok, message = test_connection.main(**params)
-        if ok:
-            logger.info("Database connection successful, reinitializing connection")
-            reinitialize_database_connection()
-            db = get_database_connection()
+        logger.info("Opening database connection")
+        with profiler.stage("DB_CONNECT") if profiler else nullcontext():
+            db, message = _open_validated_connection(params, logger)
+        if db is not None:
+            logger.info(f"Database connection successful (PostgreSQL {'.'.join(map(str, db.server_version or ()))})")
             logger.info("Applying database migrations")
             from librepy.peewee.db_migrations.migration_manager import run_all_migrations
-            run_all_migrations(logger, db)
+            with profiler.stage("MIGRATIONS") if profiler else nullcontext():
+                run_all_migrations(logger, db)
             logger.info("Database is ready and up-to-date")
             return True
         logger.warning(f"Database connection failed: {message}")
@@ -44,4 +80,18 @@ def ensure_database_ready(logger):
         retries += 1
     logger.error("Unable to establish database connection after multiple attempts")
     msgbox("Unable to establish a database connection after multiple attempts.", "Database Error")
-    return False 
\ No newline at end of file
+    return False
+
+
+def release_boot_connection(logger):
+    """Return the boot thread's connection to the pool, keeping it warm for DAOs."""
+    from librepy.peewee.db_model.base_model import database_proxy
+    db = database_proxy.obj
+    if db is None:
+        return
+    try:
+        if not db.is_closed():
+            db.close()
+            logger.debug("Boot connection returned to the pool")
+    except Exception as e:
+        logger.warning(f"Could not release boot connection: {e}")
@@ -17,6 +17,8 @@ from librepy import config
 
 import traceback
 import os
+import threading
+from collections import OrderedDict
 from librepy.utils.log_config_manager import LoggingConfigManager
 from librepy.utils.db_config_manager import DatabaseConfigManager
 from datetime import datetime, date
@@ -180,54 +182,139 @@ def set_report_parameter(report, param_name, param_value, param_type):
         logger.error(traceback.format_exc())
         raise Exception(f"Error setting parameter {param_name}: {str(e)}")
 
-def main(report_path, report_params=None, *args):
-    try:
-        logger.info(f"Starting report generation with params: {report_params}")
-        
-        manager = createUnoService("org.libretools.JasperReportManager")
-        
-        log_config_manager = LoggingConfigManager()
-        log_dir = os.path.dirname(log_config_manager.get_log_path())
-        jasper_log_file = os.path.join(log_dir, "jasper_reports.log")
-        manager.setLogFile(jasper_log_file)
-        
-        # Get database configuration from DatabaseConfigManager
-        db_config_manager = DatabaseConfigManager()
-        db_config = db_config_manager.get_connection_params()
-        
+def _apply_report_params(report, report_params):
+    """Set every parameter in report_params ({name: {'value', 'type'}}) on report."""
+    logger.info("Processing report parameters")
+    for param_name, param_info in report_params.items():
+        try:
+            logger.info(f"Processing parameter: {param_name}")
+            logger.info(f"Parameter info: {param_info}")
+            param_value = param_info.get('value')
+            param_type = param_info.get('type', 'string')  # Default to string if type not specified
+            logger.info(f"Extracted value: {param_value}, type: {param_type}")
+            set_report_parameter(report, param_name, param_value, param_type)
+        except Exception as e:
+            logger.error(f"Error processing parameter {param_name}: {str(e)}")
+            logger.error(traceback.format_exc())
+            raise Exception(f"Failed to set parameter {param_name}: {str(e)}")
+
+
+class ReportSession:
+    """
+    Long-lived JasperReportManager session.
+
+    The org.libretools.JasperReportManager service, its log file and its JDBC
+    connection are set up once and reused for every print. Reports returned by
+    addReport (which compiles the .jrxml) are cached by (template path, mtime),
+    so printing the same report again skips both compile and connect; editing
+    a template changes its mtime and forces a recompile.
+
+    A cached report keeps the parameters of its previous run, and the manager
+    has no call to clear them. A cached report is therefore reused only when
+    the new run sets every parameter the previous run set; otherwise it is
+    compiled again.
+    """
+
+    MAX_REPORTS = 16
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._manager = None
+        self._connection_url = None
+        self._reports = OrderedDict()    # (path, mtime) -> (report, frozenset of param names)
+
+    def _jdbc_url(self):
+        db_config = DatabaseConfigManager().get_connection_params()
         if not db_config:
             raise Exception("Database configuration not found or invalid")
-        
         # Build JDBC URL with credentials embedded
-        url = f"jdbc:postgresql://{db_config['host']}:{db_config['port']}/{db_config['database']}?user={db_config['user']}&password={db_config['password']}"
-        
-        # Add connection using the URL directly
-        manager.addConnection(url)
-        
-        report_path = _ensure_template_path(report_path)
+        return (f"jdbc:postgresql://{db_config['host']}:{db_config['port']}/{db_config['database']}"
+                f"?user={db_config['user']}&password={db_config['password']}")
+
+    def _get_manager(self):
+        if self._manager is None:
+            logger.info("Creating JasperReportManager session")
+            manager = createUnoService("org.libretools.JasperReportManager")
+            log_dir = os.path.dirname(LoggingConfigManager().get_log_path())
+            manager.setLogFile(os.path.join(log_dir, "jasper_reports.log"))
+            self._manager = manager
+            self._connection_url = None
+            self._reports.clear()
+
+        url = self._jdbc_url()
+        if url != self._connection_url:
+            # First use, or the database settings changed: compiled reports
+            # are bound to the old connection
+            self._manager.addConnection(url)
+            self._connection_url = url
+            self._reports.clear()
+        return self._manager
+
+    def _get_report(self, report_path, param_names):
+        manager = self._get_manager()
+        try:
+            mtime = os.path.getmtime(report_path)
+        except OSError:
+            mtime = None
+        key = (report_path, mtime)
+        cached = self._reports.get(key)
+        if cached is not None and cached[1] <= param_names:
+            self._reports.move_to_end(key)
+            logger.debug(f"Reusing compiled report {os.path.basename(report_path)}")
+            return cached[0]
+
+        logger.info(f"Compiling report {os.path.basename(report_path)}")
         report = manager.addReport(report_path)
-         
-        # Set report parameters if provided
-        if report_params:
-            logger.info("Processing report parameters")
-            for param_name, param_info in report_params.items():
+        for stale in [k for k in self._reports if k[0] == report_path]:
+            del self._reports[stale]
+        self._reports[key] = (report, param_names)
+        while len(self._reports) > self.MAX_REPORTS:
+            self._reports.popitem(last=False)
+        return report
+
+    def run(self, report_path, report_params=None):
+        """Fill and execute a report; retries once on a fresh session if a cached one fails."""
+        report_params = report_params or {}
+        param_names = frozenset(name for name, info in report_params.items()
+                                if info.get('value') is not None)
+        report_path = _ensure_template_path(report_path)
+        with self._lock:
+            for attempt in (1, 2):
+                reused = self._manager is not None
                 try:
-                    logger.info(f"Processing parameter: {param_name}")
-                    logger.info(f"Parameter info: {param_info}")
-                    param_value = param_info.get('value')
-                    param_type = param_info.get('type', 'string')  # Default to string if type not specified
-                    logger.info(f"Extracted value: {param_value}, type: {param_type}")
-                    set_report_parameter(report, param_name, param_value, param_type)
+                    report = self._get_report(report_path, param_names)
+                    if report_params:
+                        _apply_report_params(report, report_params)
+                    report.setPromptForParameters(False)
+                    report.execute()
+                    return
                 except Exception as e:
-                    logger.error(f"Error processing parameter {param_name}: {str(e)}")
-                    logger.error(traceback.format_exc())
-                    raise Exception(f"Failed to set parameter {param_name}: {str(e)}")
-                
-        report.setPromptForParameters(False)
-        
-        report.execute()
-        
+                    if attempt == 2 or not reused:
+                        raise
+                    logger.warning(f"Report session failed ({e}); retrying with a new session")
+                    self.reset()
+
+    def reset(self):
+        """Drop the manager, connection and compiled reports (e.g. after a DB config change)."""
+        with self._lock:
+            self._manager = None
+            self._connection_url = None
+            self._reports.clear()
+
+
+_report_session = ReportSession()
+
+
+def get_report_session():
+    """Return the process-wide report session."""
+    return _report_session
+
+
+def main(report_path, report_params=None, *args):
+    try:
+        logger.info(f"Starting report generation with params: {report_params}")
+        get_report_session().run(report_path, report_params)
     except Exception as e:
         logger.error(f"Error encountered: {str(e)}")
         logger.error(traceback.format_exc())
-        MsgBox("Error encountered!\n%s" % e)
\ No newline at end of file
+        MsgBox("Error encountered!\n%s" % e)
@@ -1,4 +1,4 @@
-from librepy.jasper_report import jasper_report_manager
+from librepy.jasper_report import report_queue
 from librepy.pybrex.values import pybrex_logger, DOCUMENT_REPORT_PATH
 
 import os
@@ -40,14 +40,17 @@ def _generate_calendar_report(start_date, end_date, print_action, query_text):
         "query_text":   {"value": query_text, "type": "string"},
     }
 
-    jasper_report_manager.main(REPORT_PATH, report_params, print_action)
-    logger.info("Calendar report generation request completed")
+    job = report_queue.submit(REPORT_PATH, report_params, label=title)
+    logger.info(f"Calendar report queued as job {job.id}")
+    return job
 
 
 def save_calendar_range_as_pdf(start_date, end_date, query_text: str):
     """
     Export the calendar report as PDF for the given date range using the
     provided SQL text (query_text).
+
+    The export runs on the background report queue; the returned ReportJob
+    tracks its progress.
     """
-    _generate_calendar_report(start_date, end_date, PRINT_ACTION_PDF, query_text)
-    logger.info("Calendar saved as PDF successfully")
+    return _generate_calendar_report(start_date, end_date, PRINT_ACTION_PDF, query_text)
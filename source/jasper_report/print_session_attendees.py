@@ -1,4 +1,4 @@
-from librepy.jasper_report import jasper_report_manager
+from librepy.jasper_report import report_queue
 from librepy.pybrex.values import pybrex_logger, JASPER_REPORTS_DIR
 
 import os
@@ -65,4 +65,4 @@ def print_session_attendees(session_id: int, session_date=None, session_time=Non
     }
 
     logger.info(f"Printing session attendees report for session_id={session_id}")
-    jasper_report_manager.main(report_path, report_params)
+    return report_queue.submit(report_path, report_params, label=report_params['title']['value'])
@@ -1,4 +1,4 @@
-from librepy.jasper_report import jasper_report_manager
+from librepy.jasper_report import report_queue
 from librepy.pybrex.values import pybrex_logger, JASPER_REPORTS_DIR
 
 import os
@@ -22,7 +22,8 @@ def print_training_sessions_list(start_date, end_date):
       - start_date (java.util.Date)
       - end_date   (java.util.Date)
       - title      (string)
-    The SQL is embedded in the JRXML template.
+    The SQL is embedded in the JRXML template. The report runs on the
+    background report queue; the returned ReportJob tracks its progress.
     """
     if not start_date or not end_date:
         raise ValueError("start_date and end_date are required")
@@ -40,4 +41,4 @@ def print_training_sessions_list(start_date, end_date):
     }
 
     logger.info(f"Printing Training Sessions list for range {s} .. {e}")
-    jasper_report_manager.main(report_path, report_params)
+    return report_queue.submit(report_path, report_params, label=title)
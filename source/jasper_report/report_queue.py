@@ -0,0 +1,233 @@
+"""
+Background report generation queue.
+
+Print buttons submit report jobs here instead of running Jasper on the office
+main thread. A single worker thread executes the jobs in order through the
+shared ReportSession, so the frame stays responsive while a multi-month
+export renders; the manager presents the result (PDF viewer or print dialog)
+when the job's execute() returns.
+
+Identical requests (same template and parameters) that are still queued or
+running are coalesced into the existing job. Job status changes are delivered
+to listeners on the office main thread.
+"""
+
+import itertools
+import threading
+import time
+import traceback
+from collections import deque
+
+import uno
+
+from librepy.jasper_report.jasper_report_manager import get_report_session
+from librepy.pybrex.background import post_to_main_thread
+from librepy.pybrex.values import pybrex_logger
+
+logger = pybrex_logger(__name__)
+
+# Job states
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+MAX_FINISHED_JOBS = 50           # Finished jobs kept for status queries
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class ReportJob:
+    """A queued report request and its progress.
+
+    progress is coarse because Jasper reports no fill progress:
+    0.0 queued, 0.1 started, 1.0 finished.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, report_path, report_params, label=None):
+        self.id = next(self._ids)
+        self.report_path = report_path
+        self.report_params = report_params or {}
+        self.label = label or report_path
+        self.key = (report_path, _freeze(self.report_params))
+        self.status = QUEUED
+        self.progress = 0.0
+        self.error = None
+        self.cancel_requested = False
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._callbacks = []
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATES
+
+    def __repr__(self):
+        return f"<ReportJob {self.id} {self.label!r} {self.status}>"
+
+
+class ReportQueue:
+    """FIFO of report jobs executed by one daemon worker thread."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending = deque()
+        self._jobs = {}                  # id -> ReportJob (pending, running and recent)
+        self._running = None
+        self._worker = None
+        self._listeners = []
+
+    def submit(self, report_path, report_params=None, label=None, on_done=None):
+        """Queue a report; returns the new job, or the identical job already queued/running.
+
+        on_done(job) is called on the main thread when the job finishes.
+        """
+        job = ReportJob(report_path, report_params, label)
+        with self._cond:
+            for existing in self._active_jobs():
+                if existing.key == job.key and not existing.cancel_requested:
+                    logger.info(f"Report request coalesced into job {existing.id}: {existing.label}")
+                    if on_done is not None:
+                        existing._callbacks.append(on_done)
+                    return existing
+            if on_done is not None:
+                job._callbacks.append(on_done)
+            self._pending.append(job)
+            self._jobs[job.id] = job
+            self._ensure_worker()
+            self._cond.notify()
+        logger.info(f"Report job {job.id} queued: {job.label}")
+        self._notify(job)
+        return job
+
+    def cancel(self, job_id):
+        """Cancel a job. Queued jobs are dropped; a running job's result is discarded.
+
+        Returns:
+            bool: True if the job was still cancellable
+        """
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return False
+            job.cancel_requested = True
+            if job.status == QUEUED:
+                self._pending.remove(job)
+                self._finish(job, CANCELLED)
+            else:
+                # Jasper cannot be interrupted; suppress the result when it returns
+                logger.info(f"Report job {job.id} will be discarded when Jasper returns")
+                return True
+        self._notify(job)
+        return True
+
+    def status(self, job_id):
+        """Return the job with job_id, or None if unknown or pruned."""
+        with self._cond:
+            return self._jobs.get(job_id)
+
+    def jobs(self):
+        """Return known jobs, oldest first."""
+        with self._cond:
+            return sorted(self._jobs.values(), key=lambda j: j.id)
+
+    def add_listener(self, callback):
+        """Call callback(job) on the main thread whenever a job changes state."""
+        with self._cond:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        with self._cond:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def _active_jobs(self):
+        if self._running is not None:
+            yield self._running
+        yield from self._pending
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="report-queue", daemon=True)
+            self._worker.start()
+
+    def _finish(self, job, status, error=None):
+        job.status = status
+        job.error = error
+        job.progress = 1.0
+        job.finished_at = time.time()
+        finished = [j for j in sorted(self._jobs.values(), key=lambda j: j.id) if j.finished]
+        for old in finished[:-MAX_FINISHED_JOBS]:
+            del self._jobs[old.id]
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                job = self._pending.popleft()
+                self._running = job
+                job.status = RUNNING
+                job.progress = 0.1
+                job.started_at = time.time()
+            self._notify(job)
+
+            status, error = DONE, None
+            try:
+                logger.info(f"Report job {job.id} started: {job.label}")
+                get_report_session().run(job.report_path, job.report_params)
+            except Exception as e:
+                status, error = FAILED, e
+                logger.error(f"Report job {job.id} failed: {e}")
+                logger.error(traceback.format_exc())
+
+            with self._cond:
+                self._running = None
+                if job.cancel_requested:
+                    status = CANCELLED
+                self._finish(job, status, error)
+            logger.info(f"Report job {job.id} {status} in {job.finished_at - job.started_at:.1f}s")
+            self._notify(job)
+
+    def _notify(self, job):
+        with self._cond:
+            callbacks = list(self._listeners)
+            if job.finished:
+                callbacks += job._callbacks
+                job._callbacks = []
+        if not callbacks:
+            return
+        ctx = uno.getComponentContext()
+        for callback in callbacks:
+            post_to_main_thread(ctx, ctx.ServiceManager, callback, job)
+
+
+def _report_failure(job):
+    if job.status == FAILED:
+        from librepy.pybrex.msgbox import msgbox
+        msgbox(f"Report '{job.label}' failed:\n{job.error}", "Report Error")
+
+
+_report_queue = ReportQueue()
+_report_queue.add_listener(_report_failure)
+
+
+def get_report_queue():
+    """Return the process-wide report queue."""
+    return _report_queue
+
+
+def submit(report_path, report_params=None, label=None, on_done=None):
+    """Queue a report on the shared queue; see ReportQueue.submit."""
+    return _report_queue.submit(report_path, report_params, label, on_done)
@@ -3,7 +3,7 @@ Database connection module to prevent circular imports.
 This module establishes the database connection and makes it available to other modules.
 '''
 
-from librepy.peewee.sdbc_peewee import SDBCPostgresqlDatabase
+from librepy.peewee.sdbc_peewee import PooledSDBCPostgresqlDatabase
 from librepy.utils.db_config_manager import DatabaseConfigManager
 from librepy.peewee.db_model.base_model import database_proxy
 from librepy.pybrex.values import pybrex_logger
@@ -11,6 +11,9 @@ from librepy.pybrex.values import pybrex_logger
 logger = pybrex_logger(__name__)
 db_config_manager = DatabaseConfigManager()
 
+POOL_MAX_CONNECTIONS = 4
+POOL_STALE_TIMEOUT = 300  # seconds an idle connection is kept warm
+
 
 def _create_database_instance():
     logger.debug("Creating new database instance")
@@ -24,17 +27,22 @@ def _create_database_instance():
         if not connection_params or not connection_params.get("database"):
             raise Exception("Database configuration failed - no valid connection parameters available.")
     logger.debug(f"Creating database connection to {connection_params['database']} at {connection_params['host']}:{connection_params['port']}")
-    return SDBCPostgresqlDatabase(
+    # Pooled so that DAO connection_context() open/close cycles reuse warm connections
+    return PooledSDBCPostgresqlDatabase(
         connection_params["database"],
         user=connection_params.get("user"),
         password=connection_params.get("password"),
         host=connection_params.get("host"),
         port=connection_params.get("port"),
         autoconnect=False,
+        max_connections=POOL_MAX_CONNECTIONS,
+        stale_timeout=POOL_STALE_TIMEOUT,
     )
 
 
 def get_database_connection(force_reinitialize: bool = False):
+    if database_proxy.obj is not None and force_reinitialize:
+        close_database_pool()
     if database_proxy.obj is None or force_reinitialize:
         logger.debug("Initializing database connection and binding models")
         db_instance = _create_database_instance()
@@ -68,9 +76,19 @@ def _bind_models_to_db(db):
     logger.info(f"Successfully bound {len(models)} models to database")
 
 
+def close_database_pool():
+    """Close every pooled connection held by the current database instance."""
+    db = database_proxy.obj
+    if db is None or not hasattr(db, "close_all"):
+        return
+    logger.debug(f"Closing database pool: {db.pool_stats()}")
+    try:
+        db.close_all()
+    except Exception as e:
+        logger.warning(f"Error closing database pool: {e}")
+
+
 def reinitialize_database_connection():
     # Force reload configuration from disk to pick up any changes
     db_config_manager.reload_config()
-    db = get_database_connection(force_reinitialize=True)
-    _bind_models_to_db(db)
-    return db
+    return get_database_connection(force_reinitialize=True)
@@ -41,12 +41,17 @@ def main(host, port, user, password, database, *args):
             conn.close()
             
     except Exception as e:
-        error_msg = str(e)
-        if "password authentication failed" in error_msg.lower():
-            return False, "Authentication failed. Please check your username and password."
-        elif "connection refused" in error_msg.lower():
-            return False, f"Connection refused. Please verify:\n- Host: {host}\n- Port: {port}\n- Server is running"
-        elif "database" in error_msg.lower() and "does not exist" in error_msg.lower():
-            return False, f"Database '{database}' does not exist."
-        else:
-            return False, f"Connection failed: {error_msg}"
\ No newline at end of file
+        return False, describe_error(e, host, port, database)
+
+
+def describe_error(error, host, port, database):
+    """Turn a connection exception into a user-facing message."""
+    error_msg = str(error)
+    if "password authentication failed" in error_msg.lower():
+        return "Authentication failed. Please check your username and password."
+    elif "connection refused" in error_msg.lower():
+        return f"Connection refused. Please verify:\n- Host: {host}\n- Port: {port}\n- Server is running"
+    elif "database" in error_msg.lower() and "does not exist" in error_msg.lower():
+        return f"Database '{database}' does not exist."
+    else:
+        return f"Connection failed: {error_msg}"
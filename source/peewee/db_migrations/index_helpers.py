@@ -0,0 +1,56 @@
+"""
+Shared helpers for migrations that add indexes.
+
+An index migration declares INDEXES as (index name, table, definition)
+tuples, where definition is everything after ON "<schema>"."<table>"
+(e.g. '(session_date)' or 'USING gin (name gin_trgm_ops)'), and calls
+ensure_indexes() inside its transaction.
+"""
+
+
+def index_exists(database, schema, index_name):
+    """Return True if schema already has an index called index_name."""
+    cursor = database.execute_sql(
+        'SELECT 1 FROM pg_indexes WHERE schemaname = ? AND indexname = ? LIMIT 1',
+        (schema, index_name),
+    )
+    return cursor.fetchone() is not None
+
+
+def table_exists(database, schema, table):
+    """Return True if schema has a table called table."""
+    cursor = database.execute_sql(
+        'SELECT 1 FROM pg_tables WHERE schemaname = ? AND tablename = ? LIMIT 1',
+        (schema, table),
+    )
+    return cursor.fetchone() is not None
+
+
+def ensure_indexes(database, logger, indexes, schema, skip_missing_tables=False):
+    """Create every (index name, table, definition) of indexes in schema that is missing.
+
+    Uses CREATE INDEX IF NOT EXISTS where the database supports it, otherwise
+    checks pg_indexes first. With skip_missing_tables, indexes on tables that
+    do not exist (optional modules) are skipped instead of failing.
+
+    Returns:
+        list: Names of the indexes that exist afterwards.
+    """
+    ensured = []
+    for index_name, table, definition in indexes:
+        if skip_missing_tables and not table_exists(database, schema, table):
+            logger.info(f"Table {table} does not exist, skipping index {index_name}")
+            continue
+        if getattr(database, 'safe_create_index', False):
+            database.execute_sql(
+                f'CREATE INDEX IF NOT EXISTS "{index_name}" '
+                f'ON "{schema}"."{table}" {definition}'
+            )
+        elif not index_exists(database, schema, index_name):
+            database.execute_sql(
+                f'CREATE INDEX "{index_name}" '
+                f'ON "{schema}"."{table}" {definition}'
+            )
+        logger.info(f"Ensured index {index_name} on {table}")
+        ensured.append(index_name)
+    return ensured
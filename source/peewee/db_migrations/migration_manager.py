@@ -7,11 +7,19 @@ Key responsibilities:
 2. Determine which migrations have not yet run.
 3. Execute migrations atomically in the order defined by MIGRATION_ORDER.
 4. Record successful migrations so they are not re-applied.
+5. Store a fingerprint of MIGRATION_ORDER so an up-to-date database is
+   recognised with a single query and the pass is skipped.
 
 All migrations and tracking metadata are constrained to the application schema.
 """
 
+import hashlib
+
 from librepy.peewee.db_migrations.migrations import initial_001
+from librepy.peewee.db_migrations.migrations import date_range_indexes_002
+from librepy.peewee.db_migrations.migrations import trigram_search_indexes_003
+from librepy.peewee.db_migrations.migrations import audit_log_indexes_004
+from librepy.peewee.db_migrations.migrations import teacher_schedule_index_005
 from librepy.pybrex.values import APP_NAME
 # Add the rest of the migration imports here
 
@@ -23,6 +31,10 @@ APPLICATION_SCHEMA = APP_NAME
 
 MIGRATION_ORDER = [
     ('001_initial', initial_001),
+    ('002_date_range_indexes', date_range_indexes_002),
+    ('003_trigram_search_indexes', trigram_search_indexes_003),
+    ('004_audit_log_indexes', audit_log_indexes_004),
+    ('005_teacher_schedule_index', teacher_schedule_index_005),
 ]
 
 
@@ -63,7 +75,18 @@ def _ensure_schema_migrations_table(database, logger):
                 )
                 logger.info(f'Created "{APPLICATION_SCHEMA}".schema_migrations table')
             else:
-                logger.info(f'"{APPLICATION_SCHEMA}".schema_migrations table already exists')
+                logger.debug(f'"{APPLICATION_SCHEMA}".schema_migrations table already exists')
+
+            # Single-row table holding the fingerprint of the last fully applied MIGRATION_ORDER
+            database.execute_sql(
+                f'''
+                CREATE TABLE IF NOT EXISTS "{APPLICATION_SCHEMA}".schema_migrations_fingerprint (
+                    id          INTEGER PRIMARY KEY CHECK (id = 1),
+                    fingerprint TEXT NOT NULL,
+                    updated_at  TIMESTAMP DEFAULT NOW()
+                );
+                '''
+            )
 
         return True
     except Exception as e:
@@ -71,18 +94,54 @@ def _ensure_schema_migrations_table(database, logger):
         return False
 
 
-def _is_migration_applied(database, migration_name):
-    """Check if a migration has already been applied (in the app schema)."""
+def schema_fingerprint(migration_order=None):
+    """Return a stable hash of the migration names in MIGRATION_ORDER."""
+    names = [name for name, _ in (MIGRATION_ORDER if migration_order is None else migration_order)]
+    return hashlib.sha256("\n".join(names).encode("utf-8")).hexdigest()
+
+
+def _stored_fingerprint(database):
+    """Return the stored fingerprint, or None if none is recorded (or the table is missing)."""
     try:
         cursor = database.execute_sql(
-            f'SELECT 1 FROM "{APPLICATION_SCHEMA}".schema_migrations WHERE name = ? LIMIT 1',
-            (migration_name,),
+            f'SELECT fingerprint FROM "{APPLICATION_SCHEMA}".schema_migrations_fingerprint WHERE id = 1'
         )
-        return cursor.fetchone() is not None
+        row = cursor.fetchone()
+        return row[0] if row else None
     except Exception:
+        return None
+
+
+def _record_fingerprint(database, fingerprint, logger):
+    """Store the fingerprint of the migration list that is now fully applied."""
+    try:
+        with database.atomic():
+            table = f'"{APPLICATION_SCHEMA}".schema_migrations_fingerprint'
+            if getattr(database, 'supports_upsert', False):
+                database.execute_sql(
+                    f'INSERT INTO {table} (id, fingerprint) VALUES (1, ?) '
+                    f'ON CONFLICT (id) DO UPDATE SET fingerprint = EXCLUDED.fingerprint, updated_at = CURRENT_TIMESTAMP',
+                    (fingerprint,),
+                )
+            else:
+                cursor = database.execute_sql(
+                    f'UPDATE {table} SET fingerprint = ?, updated_at = CURRENT_TIMESTAMP WHERE id = 1',
+                    (fingerprint,),
+                )
+                if not cursor.rowcount:
+                    database.execute_sql(f'INSERT INTO {table} (id, fingerprint) VALUES (1, ?)', (fingerprint,))
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to record schema fingerprint: {str(e)}")
         return False
 
 
+def _applied_migrations(database):
+    """Return the set of migration names already recorded (in the app schema)."""
+    cursor = database.execute_sql(f'SELECT name FROM "{APPLICATION_SCHEMA}".schema_migrations')
+    return {row[0] for row in cursor.fetchall()}
+
+
 def _record_migration(database, migration_name, logger):
     """
     Record that a migration has been applied, scoped to the app schema.
@@ -91,9 +150,10 @@ def _record_migration(database, migration_name, logger):
     """
     try:
         # Prefer an upsert if available; otherwise fall back to a plain INSERT.
-        # Postgres: ON CONFLICT DO NOTHING (safe for concurrency).
+        # Postgres: ON CONFLICT DO NOTHING (safe for concurrency, 9.5+).
+        on_conflict = ' ON CONFLICT (name) DO NOTHING' if getattr(database, 'supports_upsert', False) else ''
         database.execute_sql(
-            f'INSERT INTO "{APPLICATION_SCHEMA}".schema_migrations (name) VALUES (?)',
+            f'INSERT INTO "{APPLICATION_SCHEMA}".schema_migrations (name) VALUES (?){on_conflict}',
             (migration_name,),
         )
         logger.info(f"Recorded migration: {migration_name}")
@@ -130,13 +190,17 @@ def run_all_migrations(logger, database=None):
             MsgBox("Database migration failed: Could not connect to database", 16, "Migration Error")
             return False
 
-        logger.info(f"Database instance created: {type(database).__name__}")
-        logger.info(f"Database connection state before connect(): {database.is_connection_usable()}")
+        logger.debug(f"Database instance created: {type(database).__name__}")
 
         database.connect()
 
-        logger.info(f"Database connection state after connect(): {database.is_connection_usable()}")
-        logger.info("Database connection established successfully")
+        # Fast path: the stored fingerprint matches MIGRATION_ORDER, nothing is pending
+        fingerprint = schema_fingerprint()
+        if _stored_fingerprint(database) == fingerprint:
+            logger.info(f"Schema is current ({len(MIGRATION_ORDER)} migrations), skipping migration pass")
+            if close_db:
+                database.close()
+            return True
 
         # Ensure models are properly bound to this database instance
         logger.info("Ensuring models are bound to database connection")
@@ -151,11 +215,12 @@ def run_all_migrations(logger, database=None):
 
         migrations_run = 0
         migrations_skipped = 0
+        applied = _applied_migrations(database)
 
         for migration_name, migration_module in MIGRATION_ORDER:
             try:
-                if _is_migration_applied(database, migration_name):
-                    logger.info(f"Skipping already applied migration: {migration_name}")
+                if migration_name in applied:
+                    logger.debug(f"Skipping already applied migration: {migration_name}")
                     migrations_skipped += 1
                     continue
 
@@ -185,6 +250,8 @@ def run_all_migrations(logger, database=None):
                 MsgBox(f"Database migration failed: {migration_name} - {str(e)}", 16, "Migration Error")
                 return False
 
+        _record_fingerprint(database, fingerprint, logger)
+
         if close_db:
             database.close()
 
@@ -0,0 +1,27 @@
+# MIGRATION_NAME = "004_audit_log_indexes"
+
+from librepy.peewee.db_migrations.index_helpers import ensure_indexes
+from librepy.pybrex.values import APP_NAME
+
+MIGRATION_NAME = "004_audit_log_indexes"
+APPLICATION_SCHEMA = APP_NAME
+
+# (username, timestamp) serves the failed-login COUNT behind the lockout check;
+# the BRIN index on the append-only timestamp column keeps retention purges
+# cheap without the write cost of a second b-tree.
+INDEXES = [
+    ('audit_logs_username_timestamp', 'audit_logs', '(username, timestamp)'),
+    ('audit_logs_timestamp_brin', 'audit_logs', 'USING brin (timestamp)'),
+]
+
+
+def run_migration(database, logger):
+    try:
+        logger.info(f"Running migration: {MIGRATION_NAME}")
+        with database.atomic():
+            ensure_indexes(database, logger, INDEXES, APPLICATION_SCHEMA, skip_missing_tables=True)
+        logger.info("Migration completed successfully")
+        return True
+    except Exception as exc:
+        logger.error(f"Migration failed: {exc}")
+        return False
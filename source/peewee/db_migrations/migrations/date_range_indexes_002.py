@@ -0,0 +1,61 @@
+# MIGRATION_NAME = "002_date_range_indexes"
+
+from librepy.peewee.db_migrations.index_helpers import ensure_indexes
+from librepy.pybrex.values import APP_NAME
+
+MIGRATION_NAME = "002_date_range_indexes"
+APPLICATION_SCHEMA = APP_NAME
+
+# (index name, table, index definition). Btree names match the ones peewee
+# generates from the model declarations, so fresh databases are not indexed twice.
+INDEXES = [
+    ('trainingsession_session_date', 'trainingsession', '(session_date)'),
+    ('serviceappointment_appointment_date', 'serviceappointment', '(appointment_date)'),
+    ('employeecontract_start_date_end_date', 'employeecontract', '(start_date, end_date)'),
+    # Range overlap (&&) lookups used by the employee calendar
+    ('employeecontract_period_gist', 'employeecontract',
+     "USING gist (daterange(start_date, end_date, '[]'))"),
+]
+
+# daterange() raises for a contract that ends before it starts, which would fail
+# the GiST build above and every contracts_between query; existing rows are
+# repaired (dates swapped) before the constraint is added.
+PERIOD_CHECK = 'employeecontract_period_check'
+
+
+def _constraint_exists(database, name):
+    cursor = database.execute_sql(
+        'SELECT 1 FROM pg_constraint c JOIN pg_namespace n ON n.oid = c.connamespace '
+        'WHERE n.nspname = ? AND c.conname = ? LIMIT 1',
+        (APPLICATION_SCHEMA, name),
+    )
+    return cursor.fetchone() is not None
+
+
+def _ensure_period_check(database, logger):
+    if _constraint_exists(database, PERIOD_CHECK):
+        return
+    cursor = database.execute_sql(
+        f'UPDATE "{APPLICATION_SCHEMA}"."employeecontract" '
+        f'SET start_date = end_date, end_date = start_date WHERE end_date < start_date'
+    )
+    if cursor.rowcount:
+        logger.warning(f"Swapped start/end dates of {cursor.rowcount} contract(s) ending before they start")
+    database.execute_sql(
+        f'ALTER TABLE "{APPLICATION_SCHEMA}"."employeecontract" '
+        f'ADD CONSTRAINT "{PERIOD_CHECK}" CHECK (end_date >= start_date)'
+    )
+    logger.info(f"Added constraint {PERIOD_CHECK} on employeecontract")
+
+
+def run_migration(database, logger):
+    try:
+        logger.info(f"Running migration: {MIGRATION_NAME}")
+        with database.atomic():
+            _ensure_period_check(database, logger)
+            ensure_indexes(database, logger, INDEXES, APPLICATION_SCHEMA)
+        logger.info("Migration completed successfully")
+        return True
+    except Exception as exc:
+        logger.error(f"Migration failed: {exc}")
+        return False
@@ -0,0 +1,25 @@
+# MIGRATION_NAME = "005_teacher_schedule_index"
+
+from librepy.peewee.db_migrations.index_helpers import ensure_indexes
+from librepy.pybrex.values import APP_NAME
+
+MIGRATION_NAME = "005_teacher_schedule_index"
+APPLICATION_SCHEMA = APP_NAME
+
+# Double-booking checks read one teacher's sessions over a few days; the
+# name matches the index peewee generates from TrainingSession.Meta.indexes.
+INDEXES = [
+    ('trainingsession_teacher_id_session_date', 'trainingsession', '(teacher_id, session_date)'),
+]
+
+
+def run_migration(database, logger):
+    try:
+        logger.info(f"Running migration: {MIGRATION_NAME}")
+        with database.atomic():
+            ensure_indexes(database, logger, INDEXES, APPLICATION_SCHEMA)
+        logger.info("Migration completed successfully")
+        return True
+    except Exception as exc:
+        logger.error(f"Migration failed: {exc}")
+        return False
@@ -0,0 +1,45 @@
+# MIGRATION_NAME = "003_trigram_search_indexes"
+
+from librepy.peewee.db_migrations.index_helpers import ensure_indexes
+from librepy.pybrex.values import APP_NAME
+
+MIGRATION_NAME = "003_trigram_search_indexes"
+APPLICATION_SCHEMA = APP_NAME
+
+# Trigram GIN indexes backing the ILIKE '%text%' filters of the training
+# session search (session name and teacher names).
+INDEXES = [
+    ('trainingsession_name_trgm', 'trainingsession', 'USING gin (name gin_trgm_ops)'),
+    ('teacher_first_name_trgm', 'teacher', 'USING gin (first_name gin_trgm_ops)'),
+    ('teacher_last_name_trgm', 'teacher', 'USING gin (last_name gin_trgm_ops)'),
+]
+
+
+def _ensure_pg_trgm(database, logger):
+    """Make sure the pg_trgm extension is installed; return False if it cannot be."""
+    cursor = database.execute_sql("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    if cursor.fetchone() is not None:
+        return True
+    try:
+        with database.atomic():
+            database.execute_sql('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        return True
+    except Exception as exc:
+        logger.warning(f"pg_trgm extension is not available, search will run without trigram indexes: {exc}")
+        return False
+
+
+def run_migration(database, logger):
+    try:
+        logger.info(f"Running migration: {MIGRATION_NAME}")
+        with database.atomic():
+            if not _ensure_pg_trgm(database, logger):
+                # ILIKE search still works, just without index support
+                logger.info("Migration completed without trigram indexes")
+                return True
+            ensure_indexes(database, logger, INDEXES, APPLICATION_SCHEMA)
+        logger.info("Migration completed successfully")
+        return True
+    except Exception as exc:
+        logger.error(f"Migration failed: {exc}")
+        return False
@@ -15,13 +15,20 @@ Features:
   - Type information caching
   - Row prefetching with configurable batch sizes
   - Fast direct type conversion paths
+  - Per-result-set row decoder compiled once from column metadata
+  - Named (server-side) cursors that stream query results in bounded chunks
+  - Per-connection LRU cache of prepared statements keyed by SQL text
 
 Performance Optimization:
 - For large result sets, increase cursor.arraysize (default: 1000)
 - Use cursor.set_prefetch_size(n) to control memory/performance tradeoff
+- Use connect(statement_cache_size=n) to size the prepared statement cache
+  (0 disables it); inspect hits/misses with connection.statement_cache_info()
 - Consider fetching results in batches with fetchmany() rather than fetchall()
-- When processing millions of rows, consider using executemany() with reasonable
-  batch sizes to reduce round trips
+- For result sets too large for memory, use connection.cursor(name=...) to get a
+  NamedCursor that keeps the rows on the server and FETCHes itersize at a time
+- executemany() prepares once and sends rows with addBatch()/executeBatch();
+  tune the chunk size with cursor.set_batch_size(n) (default: 1000)
 
 Usage Notes:
 - For type-safe NULL binding, you can provide parameter_types to execute/executemany
@@ -39,7 +46,10 @@ from com.sun.star.sdbc import XPreparedStatement
 from com.sun.star.sdbc import XResultSet
 from com.sun.star.sdbc import XResultSetMetaData
 from com.sun.star.sdbc import DataType
+import re
 import warnings
+import itertools
+from collections import OrderedDict
 from decimal import Decimal, InvalidOperation
 import datetime
 
@@ -57,6 +67,16 @@ TRANSACTION_STATUS_IDLE = 0
 TRANSACTION_STATUS_ACTIVE = 1
 TRANSACTION_STATUS_INTRANS = 2
 TRANSACTION_STATUS_INERROR = 3
+TRANSACTION_STATUS_UNKNOWN = 4
+
+# Number of prepared statements kept open per connection (extension)
+DEFAULT_STATEMENT_CACHE_SIZE = 64
+
+# Number of parameter sets sent per executeBatch() call in executemany (extension)
+DEFAULT_BATCH_SIZE = 1000
+
+# Number of rows a NamedCursor FETCHes per round-trip (extension)
+DEFAULT_STREAM_CHUNK_SIZE = 2000
 
 # Use underscore-prefixed imports to avoid shadowing constructor names
 from decimal import Decimal as _Decimal
@@ -322,8 +342,163 @@ def Binary(string):
     """Construct an object capable of holding a binary (long) string value."""
     return bytes(string)
 
+# Statement classification
+_ROW_RETURNING_PREFIXES = ("SELECT", "WITH", "VALUES", "SHOW", "TABLE")
+_RETURNING_RE = re.compile(r'\bRETURNING\b', re.IGNORECASE)
+
+def _returns_rows(sql):
+    """
+    Best-effort check whether a statement produces a result set.
+    
+    Queries (SELECT, WITH, VALUES, ...) and DML with a RETURNING clause are
+    run with executeQuery(); everything else goes through executeUpdate().
+    """
+    head = sql.lstrip(' \t\r\n(')[:6].upper()
+    if head.startswith(_ROW_RETURNING_PREFIXES):
+        return True
+    if head.startswith(("INSERT", "UPDATE", "DELETE")):
+        return _RETURNING_RE.search(sql) is not None
+    return False
+
+# Server version parsing
+_SERVER_VERSION_RE = re.compile(r'(\d+)(?:\.(\d+))?(?:\.(\d+))?')
+
+def _parse_server_version(version_string):
+    """
+    Convert a version string such as '16.2 (Debian 16.2-1)' or '9.6.24' to the
+    psycopg2-style integer, or return None if it cannot be parsed.
+    """
+    match = _SERVER_VERSION_RE.search(version_string or '')
+    if match is None:
+        return None
+    major = int(match.group(1))
+    minor = int(match.group(2) or 0)
+    patch = int(match.group(3) or 0)
+    if major >= 10:
+        return major * 10000 + minor
+    return major * 10000 + minor * 100 + patch
+
+# Row decoding
+def _parse_timestamp_string(timestamp_str):
+    """Parse a 'YYYY-MM-DD HH:MM:SS[.fff]' string into a datetime (or return it as-is)."""
+    if ' ' in timestamp_str and ':' in timestamp_str:
+        date_part, time_part = timestamp_str.split(' ', 1)
+        year, month, day = map(int, date_part.split('-'))
+        time_parts = time_part.split(':')
+        hour = int(time_parts[0])
+        minute = int(time_parts[1])
+        second = int(float(time_parts[2])) if len(time_parts) > 2 else 0
+        return Timestamp(year, month, day, hour, minute, second)
+    return timestamp_str
+
+def _make_column_reader(resultset, index, sdbc_type):
+    """
+    Build a zero-argument callable that reads one column of the current row.
+    
+    The type dispatch and the UNO method lookups happen here, once per result
+    set column, so reading a row is a plain loop over prebuilt callables.
+    Each reader calls wasNull() exactly once and returns None for SQL NULL.
+    
+    Args:
+        resultset: The SDBC result set the reader is bound to
+        index (int): Column index (1-based)
+        sdbc_type (int): SDBC DataType constant of the column
+        
+    Returns:
+        callable: Reader returning the converted Python value
+        
+    Notes:
+        - Conversions match Cursor._get_value_by_index_and_type
+        - UnoExceptions propagate; the cursor then retries the row on the generic path
+    """
+    was_null = resultset.wasNull
+    
+    if sdbc_type in (DataType.VARCHAR, DataType.CHAR, DataType.LONGVARCHAR):
+        get = resultset.getString
+        def read():
+            value = get(index)
+            return None if was_null() else value
+    elif sdbc_type in (DataType.INTEGER, DataType.SMALLINT, DataType.TINYINT):
+        get = resultset.getInt
+        def read():
+            value = get(index)
+            return None if was_null() else value
+    elif sdbc_type == DataType.BIGINT:
+        # For very large integers, getString avoids overflow
+        get = resultset.getString
+        def read():
+            value = get(index)
+            if was_null():
+                return None
+            return int(value) if value else 0
+    elif sdbc_type in (DataType.DOUBLE, DataType.FLOAT, DataType.REAL):
+        get = resultset.getDouble
+        def read():
+            value = get(index)
+            return None if was_null() else value
+    elif sdbc_type == DataType.BOOLEAN:
+        get = resultset.getBoolean
+        def read():
+            value = get(index)
+            return None if was_null() else value
+    elif sdbc_type == DataType.DATE:
+        get = resultset.getDate
+        def read():
+            value = get(index)
+            if was_null():
+                return None
+            return _datetime.date(value.Year, value.Month, value.Day)
+    elif sdbc_type == DataType.TIME:
+        get = resultset.getTime
+        def read():
+            value = get(index)
+            if was_null():
+                return None
+            return _datetime.time(value.Hours, value.Minutes, value.Seconds)
+    elif sdbc_type == DataType.TIMESTAMP:
+        get = resultset.getTimestamp
+        get_string = resultset.getString
+        def read():
+            try:
+                value = get(index)
+            except Exception:
+                # Fall back to string parsing
+                value = get_string(index)
+                if not value or was_null():
+                    return None
+                return _parse_timestamp_string(value)
+            if was_null():
+                return None
+            return _datetime.datetime(value.Year, value.Month, value.Day,
+                                      value.Hours, value.Minutes, value.Seconds)
+    elif sdbc_type in (DataType.NUMERIC, DataType.DECIMAL):
+        # Read as string and convert to maintain precision
+        get = resultset.getString
+        def read():
+            value = get(index)
+            if was_null():
+                return None
+            try:
+                return Decimal(value)
+            except (ValueError, InvalidOperation):
+                return float(value) if value else 0.0
+    elif sdbc_type in (DataType.BINARY, DataType.VARBINARY, DataType.LONGVARBINARY, DataType.BLOB):
+        get = resultset.getBytes
+        def read():
+            value = get(index)
+            return None if was_null() else bytes(value)
+    else:
+        # Fall back to string for types we don't handle specifically
+        get = resultset.getString
+        def read():
+            value = get(index)
+            return None if was_null() else value
+    
+    return read
+
 # Connection function
-def connect(dsn=None, user=None, password=None, host=None, database=None, port=5432, connect_timeout=5):
+def connect(dsn=None, user=None, password=None, host=None, database=None, port=5432, connect_timeout=5,
+            statement_cache_size=DEFAULT_STATEMENT_CACHE_SIZE):
     """
     Connect to a PostgreSQL database using LibreOffice's SDBC driver.
     
@@ -338,6 +513,8 @@ def connect(dsn=None, user=None, password=None, host=None, database=None, port=5
         database (str, optional): Database name to connect to
         port (int, optional): Port number (default: 5432)
         connect_timeout (int, optional): Connection timeout in seconds (default: 5)
+        statement_cache_size (int, optional): Maximum number of prepared statements
+            cached on the connection (default: 64, 0 disables caching)
         
     Returns:
         Connection: A DB-API 2.0 compliant Connection object
@@ -383,7 +560,7 @@ def connect(dsn=None, user=None, password=None, host=None, database=None, port=5
         # Establish the connection
         sdbc_connection = driver_manager.getConnectionWithInfo(connection_url, tuple(props))
         
-        conn = Connection(sdbc_connection)
+        conn = Connection(sdbc_connection, statement_cache_size=statement_cache_size)
         logger.debug(f"Connection object created with ID: {id(conn)}")
         return conn
     
@@ -398,12 +575,14 @@ class Connection:
     DB-API 2.0 compliant database connection wrapper for SDBC.
     """
     
-    def __init__(self, sdbc_connection):
+    def __init__(self, sdbc_connection, statement_cache_size=DEFAULT_STATEMENT_CACHE_SIZE):
         """
         Initialize a Connection object.
         
         Args:
             sdbc_connection: The underlying SDBC connection object
+            statement_cache_size (int, optional): Maximum number of idle prepared
+                statements kept for reuse (0 disables caching)
         """
         self._conn = sdbc_connection
         self.closed = False
@@ -412,6 +591,18 @@ class Connection:
         self.Error = Error
         self.Warning = Warning
         
+        # LRU cache of idle prepared statements: {sql: XPreparedStatement}
+        self._statement_cache = OrderedDict()
+        self._statement_cache_size = max(int(statement_cache_size or 0), 0)
+        # Bumped on invalidation so statements checked out before it are not re-cached
+        self._statement_cache_generation = 0
+        self.statement_cache_hits = 0
+        self.statement_cache_misses = 0
+        # Lazily detected driver support for addBatch()/executeBatch()
+        self._supports_batch = None
+        # Lazily detected server version (psycopg2-style integer, e.g. 160002)
+        self._server_version = None
+        
     def close(self):
         """Close the connection and release resources."""
         if self.closed:
@@ -419,6 +610,9 @@ class Connection:
             return
         
         try:
+            # Prepared statements must be released before the connection goes away
+            self.clear_statement_cache()
+            
             # First try standard SDBC close
             self._conn.close()
             
@@ -452,6 +646,8 @@ class Connection:
         """Roll back pending transactions."""
         if self.closed:
             raise InterfaceError("Connection is closed")
+        # Statements prepared inside the aborted transaction are not reused
+        self.clear_statement_cache()
         try:
             # First try standard SDBC rollback
             current_autocommit = self._conn.getAutoCommit()
@@ -543,28 +739,227 @@ class Connection:
         except UnoException as e:
             raise _map_sdbc_error(e)
             
-    def cursor(self):
-        """Create a new cursor object."""
+    def cursor(self, name=None, chunk_size=None):
+        """
+        Create a new cursor object.
+        
+        Args:
+            name (str, optional): When given, return a NamedCursor that streams
+                query results through a server-side cursor of that name
+            chunk_size (int, optional): Rows fetched per round-trip by a named
+                cursor (default: DEFAULT_STREAM_CHUNK_SIZE)
+                
+        Returns:
+            Cursor: A regular cursor, or a NamedCursor when name is given
+        """
         if self.closed:
             raise InterfaceError("Connection is closed")
+        if name is not None:
+            return NamedCursor(self, name, chunk_size)
         return Cursor(self)
 
+    def _checkout_statement(self, sql):
+        """
+        Get a prepared statement for the given SQL, reusing a cached one if possible.
+        
+        A cached statement is removed from the cache while it is checked out, so
+        two cursors never share the same statement (and result set) at once.
+        
+        Args:
+            sql (str): SQL text with qmark placeholders
+            
+        Returns:
+            tuple: (statement, generation) - pass both back to _release_statement
+            
+        Raises:
+            OperationalError: If the statement cannot be prepared
+        """
+        statement = self._statement_cache.pop(sql, None)
+        if statement is not None:
+            try:
+                # Leftover bindings from the previous execution must not leak
+                statement.clearParameters()
+                self.statement_cache_hits += 1
+                return statement, self._statement_cache_generation
+            except UnoException as e:
+                logger.debug(f"Discarding cached statement that failed to reset: {e}")
+                self._dispose_statement(statement)
+        
+        self.statement_cache_misses += 1
+        try:
+            statement = self._conn.prepareStatement(sql)
+        except UnoException as e:
+            raise _map_sdbc_error(e)
+        return statement, self._statement_cache_generation
+
+    def _release_statement(self, sql, statement, generation):
+        """
+        Return a checked-out prepared statement to the cache or dispose of it.
+        
+        Args:
+            sql (str): SQL text the statement was prepared with
+            statement: The SDBC prepared statement
+            generation (int): Cache generation returned by _checkout_statement
+        """
+        if (self.closed or self._statement_cache_size == 0
+                or generation != self._statement_cache_generation
+                or sql in self._statement_cache):
+            self._dispose_statement(statement)
+            return
+        
+        self._statement_cache[sql] = statement
+        while len(self._statement_cache) > self._statement_cache_size:
+            _, evicted = self._statement_cache.popitem(last=False)
+            self._dispose_statement(evicted)
+
+    def _dispose_statement(self, statement):
+        """Close and dispose of an SDBC statement, ignoring driver errors."""
+        try:
+            statement.close()
+            statement.dispose()
+        except Exception as e:
+            logger.warning(f"Error closing cached statement: {e}")
+
+    def clear_statement_cache(self):
+        """
+        Close all cached prepared statements.
+        
+        Statements currently checked out by cursors are disposed when released
+        instead of being returned to the cache.
+        
+        Note: This is an extension to the DB-API 2.0 specification.
+        """
+        self._statement_cache_generation += 1
+        while self._statement_cache:
+            _, statement = self._statement_cache.popitem(last=False)
+            self._dispose_statement(statement)
+
+    def set_statement_cache_size(self, size):
+        """
+        Set the maximum number of cached prepared statements.
+        
+        Args:
+            size (int): New cache size; 0 disables caching
+            
+        Note: This is an extension to the DB-API 2.0 specification.
+        """
+        if size < 0:
+            raise ValueError("Statement cache size cannot be negative")
+        self._statement_cache_size = size
+        while len(self._statement_cache) > size:
+            _, evicted = self._statement_cache.popitem(last=False)
+            self._dispose_statement(evicted)
+
+    def statement_cache_info(self):
+        """
+        Return prepared statement cache statistics.
+        
+        Returns:
+            dict: hits, misses, size (statements currently cached) and maxsize
+            
+        Note: This is an extension to the DB-API 2.0 specification.
+        """
+        return {
+            'hits': self.statement_cache_hits,
+            'misses': self.statement_cache_misses,
+            'size': len(self._statement_cache),
+            'maxsize': self._statement_cache_size,
+        }
+
+    def supports_batch_updates(self):
+        """
+        Check whether the SDBC driver supports batched prepared statements.
+        
+        The answer is read from the driver metadata once and cached.
+        
+        Returns:
+            bool: True if addBatch()/executeBatch() can be used
+            
+        Note: This is an extension to the DB-API 2.0 specification.
+        """
+        if self._supports_batch is None:
+            try:
+                self._supports_batch = bool(self._conn.getMetaData().supportsBatchUpdates())
+            except Exception as e:
+                logger.debug(f"Could not determine batch update support: {e}")
+                self._supports_batch = False
+        return self._supports_batch
+
+    @property
+    def server_version(self):
+        """
+        The PostgreSQL server version as an integer, like psycopg2's attribute.
+        
+        Versions are encoded as major * 10000 + minor (10 and later) or
+        major * 10000 + minor * 100 + patch (9.x and earlier), so 16.2 is
+        160002 and 9.6.24 is 90624. Detected once and cached per connection.
+        
+        Raises:
+            OperationalError: If the version cannot be determined
+            
+        Note: This is an extension to the DB-API 2.0 specification.
+        """
+        if self._server_version is None:
+            self._server_version = self._detect_server_version()
+        return self._server_version
+
+    def _detect_server_version(self):
+        """
+        Read the server version from driver metadata, or ask the server.
+        
+        The driver metadata normally reports the server_version parameter sent at
+        connection startup, so no query is needed; SHOW server_version_num is
+        only used when that string cannot be parsed.
+        """
+        if self.closed:
+            raise InterfaceError("Connection is closed")
+        try:
+            product_version = self._conn.getMetaData().getDatabaseProductVersion()
+            version = _parse_server_version(product_version)
+            if version is not None:
+                return version
+            logger.debug(f"Unrecognized server version string: {product_version!r}")
+        except UnoException as e:
+            logger.debug(f"Could not read server version from metadata: {e}")
+        
+        statement = None
+        try:
+            statement = self._conn.createStatement()
+            resultset = statement.executeQuery("SHOW server_version_num")
+            if resultset.next():
+                return int(resultset.getString(1))
+        except (UnoException, ValueError) as e:
+            raise OperationalError(f"Could not determine server version: {e}")
+        finally:
+            if statement is not None:
+                try:
+                    statement.close()
+                except UnoException:
+                    pass
+        raise OperationalError("Could not determine server version")
+
     def get_transaction_status(self):
         """
         Get the current transaction status.
         This is a partial implementation for Peewee compatibility, as the SDBC
         API does not provide a direct way to inspect transaction status.
         Returns:
-            int: TRANSACTION_STATUS_IDLE or TRANSACTION_STATUS_INTRANS.
+            int: TRANSACTION_STATUS_IDLE or TRANSACTION_STATUS_INTRANS, or
+            TRANSACTION_STATUS_UNKNOWN when the connection is closed or broken
+            (as psycopg2 does), which makes this usable as a liveness check.
         """
+        if self.closed or self._conn is None:
+            return TRANSACTION_STATUS_UNKNOWN
         try:
+            if self._conn.isClosed():
+                return TRANSACTION_STATUS_UNKNOWN
             if self._conn.getAutoCommit():
                 return TRANSACTION_STATUS_IDLE
             else:
                 return TRANSACTION_STATUS_INTRANS
         except UnoException:
-            # If connection is dead, assume idle state or handle error
-            return TRANSACTION_STATUS_IDLE
+            # The connection is dead or unusable
+            return TRANSACTION_STATUS_UNKNOWN
 
     def __enter__(self):
         """
@@ -610,6 +1005,9 @@ class Cursor:
     DB-API 2.0 compliant cursor wrapper for SDBC.
     """
     
+    # Prepare parameterized statements through the connection's statement cache
+    _cache_statements = True
+    
     def __init__(self, connection):
         """
         Initialize a Cursor object.
@@ -619,11 +1017,15 @@ class Cursor:
         """
         self.connection = connection
         self._statement = None
+        # (sql, generation) when _statement was checked out from the connection cache
+        self._statement_key = None
         self._resultset = None
         self.description = None
         self._cached_meta = None  # Cache for column metadata to avoid repeated lookups
+        self._row_decoder = None  # Tuple of per-column readers built in _update_description
         self.rowcount = -1
         self.arraysize = 1000  # Default to a larger batch size for better performance
+        self._batch_size = DEFAULT_BATCH_SIZE  # Parameter sets per executeBatch() call
         self._row_cache = []   # Cache for fetched rows
         self._cache_position = 0  # Position in the row cache
         self._cache_size = 5000  # Number of rows to prefetch
@@ -648,16 +1050,17 @@ class Cursor:
                 
             if self._statement is not None:
                 try:
-                    self._statement.close()
-                    self._statement.dispose()
+                    self._release_statement(dispose=True)
                 except Exception as e:
                     logger.warning(f"Error closing statement: {e}")
                 finally:
                     self._statement = None
+                    self._statement_key = None
             
             # Reset cursor state to initial values
             self.description = None
             self._cached_meta = None
+            self._row_decoder = None
             self.rowcount = -1
             
             # Clear the row cache to release memory
@@ -710,6 +1113,7 @@ class Cursor:
             - For precise Decimal handling, consider binding as string instead
             - Large integers may overflow if they exceed database limits
             - After execution, cursor.description is populated for SELECT queries
+              and for INSERT/UPDATE/DELETE ... RETURNING statements
             - For non-SELECT operations, rowcount contains affected row count
             - The underlying connection must be open and valid
             
@@ -749,8 +1153,7 @@ class Cursor:
                 self._resultset.close()
                 self._resultset = None
             if self._statement is not None:
-                self._statement.close()
-                self._statement = None
+                self._release_statement()
             
             # Set initial rowcount
             self.rowcount = -1
@@ -768,9 +1171,8 @@ class Cursor:
                     except UnoException as e:
                         raise _map_sdbc_error(e)
                     
-                    # Try to determine if this is a SELECT query by looking at the SQL
-                    operation_upper = sql.strip().upper()
-                    is_select = operation_upper.startswith("SELECT")
+                    # Determine whether the statement produces a result set
+                    is_select = _returns_rows(sql)
                     
                     try:
                         if is_select:
@@ -787,11 +1189,15 @@ class Cursor:
                     if not sql or not sql.strip(): # Only check if SQL is genuinely empty or just whitespace
                         raise ProgrammingError("Invalid SQL statement: SQL string is empty")
                     
-                    # Create and prepare the statement
-                    try:
-                        self._statement = self.connection._conn.prepareStatement(sql)
-                    except UnoException as e:
-                        raise _map_sdbc_error(e)
+                    # Reuse a cached prepared statement or prepare a new one
+                    if self._cache_statements:
+                        self._statement, generation = self.connection._checkout_statement(sql)
+                        self._statement_key = (sql, generation)
+                    else:
+                        try:
+                            self._statement = self.connection._conn.prepareStatement(sql)
+                        except UnoException as e:
+                            raise _map_sdbc_error(e)
                     
                     # Bind each parameter
                     for i, param in enumerate(params):
@@ -802,8 +1208,8 @@ class Cursor:
                         
                         self._bind_parameter(i + 1, param, type_hint)
                     
-                    # Try to determine if this is a SELECT query by looking at the SQL
-                    is_select = sql.strip().upper().startswith("SELECT")
+                    # Determine whether the statement produces a result set
+                    is_select = _returns_rows(sql)
                     
                     try:
                         if is_select:
@@ -821,10 +1227,9 @@ class Cursor:
                 except UnoException as e:
                     raise _map_sdbc_error(e)
                 
-                # Try to determine if this is a SELECT query by looking at the SQL
+                # Determine whether the statement produces a result set
                 # This is a best-effort check - not foolproof for all SQL dialects
-                operation_upper = operation.strip().upper()
-                is_select = operation_upper.startswith("SELECT")
+                is_select = _returns_rows(operation)
                 
                 try:
                     if is_select:
@@ -839,18 +1244,61 @@ class Cursor:
             # Update description if we have a result set
             if self._resultset is not None:
                 self._update_description()
+            elif self._statement is not None:
+                # Nothing left to read; hand the statement back right away
+                self._release_statement()
                 
             return self
         except UnoException as e:
             # Generic catch-all for any other SDBC exceptions
             raise _map_sdbc_error(e)
             
+    def _next_row(self):
+        """
+        Read the next row from the result set.
+        
+        Returns None once the result set is exhausted; the result set is then
+        closed and its statement released, so a cached prepared statement is
+        back in the connection cache as soon as its rows have been read.
+        """
+        if self._resultset is None:
+            return None
+        if self._resultset.next():
+            return self._get_row()
+        resultset, self._resultset = self._resultset, None
+        try:
+            resultset.close()
+        except UnoException as e:
+            logger.warning(f"Error closing resultset: {e}")
+        if self._statement is not None:
+            self._release_statement()
+        return None
+
+    def _release_statement(self, dispose=False):
+        """
+        Release the current statement.
+        
+        Prepared statements checked out from the connection cache are handed
+        back for reuse; plain statements are closed (and disposed if requested).
+        """
+        statement, self._statement = self._statement, None
+        key, self._statement_key = self._statement_key, None
+        if key is not None:
+            sql, generation = key
+            self.connection._release_statement(sql, statement, generation)
+        else:
+            statement.close()
+            if dispose:
+                statement.dispose()
+
     def executemany(self, operation, seq_of_parameters, parameter_types=None):
         """
         Execute multiple operations efficiently.
         
-        This method executes the operation against each parameter set in sequence.
-        It's optimized for INSERT, UPDATE, and DELETE operations with many parameter sets.
+        The statement is prepared once, each parameter set is bound and queued with
+        addBatch(), and the queue is flushed with executeBatch() every batch_size rows.
+        When the driver does not support batch updates (or the operation is a query),
+        the operation is executed once per parameter set instead.
         
         Args:
             operation (str): SQL statement with parameter placeholders
@@ -867,13 +1315,15 @@ class Cursor:
         Performance Notes:
             - For optimal performance, consider:
               1. Disabling autocommit before calling executemany
-              2. Using reasonable batch sizes (1000-5000 rows)
+              2. Using reasonable batch sizes (1000-5000 rows, see set_batch_size())
               3. Explicitly committing after executemany completes
-            - Each parameter set is executed individually, not as a true batch operation
+            - One round-trip per executeBatch() call instead of one per parameter set
             - Total rowcount is the sum of affected rows from all operations
+            - Rows reported by the driver as SUCCESS_NO_INFO are not counted
             
         Error Handling:
-            - If an error occurs during execution, the operation stops at that point
+            - If an error occurs during execution, the operation stops at that point;
+              with batching, the whole failing chunk is affected
             - No automatic rollback is performed if an error occurs
             - Previously successful operations in the batch remain committed 
               (unless autocommit is disabled)
@@ -917,18 +1367,9 @@ class Cursor:
             raise InterfaceError("Cursor is closed")
             
         try:
-            total_rowcount = 0
-            for parameters in seq_of_parameters:
-                self.execute(operation, parameters, parameter_types)
-                # If this was an INSERT/UPDATE/DELETE, accumulate the rowcount
-                if self.rowcount != -1:
-                    total_rowcount += self.rowcount
-            
-            # Set the total rowcount if we accumulated any
-            if total_rowcount > 0:
-                self.rowcount = total_rowcount
-                
-            return self
+            if self._can_batch(operation):
+                return self._executemany_batched(operation, seq_of_parameters, parameter_types)
+            return self._executemany_rows(operation, seq_of_parameters, parameter_types)
         except UnoException as e:
             raise _map_sdbc_error(e)
         except Exception as e:
@@ -938,6 +1379,126 @@ class Cursor:
             else:
                 # Wrap other exceptions
                 raise ProgrammingError(f"Error in executemany: {str(e)}")
+
+    def _executemany_rows(self, operation, seq_of_parameters, parameter_types=None):
+        """Execute operation once per parameter set (fallback without batching)."""
+        total_rowcount = 0
+        for parameters in seq_of_parameters:
+            self.execute(operation, parameters, parameter_types)
+            # If this was an INSERT/UPDATE/DELETE, accumulate the rowcount
+            if self.rowcount != -1:
+                total_rowcount += self.rowcount
+        
+        # Set the total rowcount if we accumulated any
+        if total_rowcount > 0:
+            self.rowcount = total_rowcount
+            
+        return self
+
+    def _can_batch(self, operation):
+        """
+        Check whether executemany can use the addBatch()/executeBatch() path.
+        
+        Queries and statements without placeholders are executed per row, as is
+        everything when the driver does not report batch update support.
+        """
+        if '?' not in operation or _returns_rows(operation):
+            return False
+        return self.connection.supports_batch_updates()
+
+    def _executemany_batched(self, operation, seq_of_parameters, parameter_types=None):
+        """
+        Execute operation for every parameter set using SDBC statement batching.
+        
+        Args:
+            operation (str): SQL statement with parameter placeholders
+            seq_of_parameters (iterable): Parameter sets; consumed lazily
+            parameter_types (list, optional): Type hints applied to every set
+            
+        Returns:
+            Cursor: Self reference for method chaining
+        """
+        if self._resultset is not None:
+            self._resultset.close()
+            self._resultset = None
+        if self._statement is not None:
+            self._release_statement()
+        self.rowcount = -1
+        
+        self._statement, generation = self.connection._checkout_statement(operation)
+        self._statement_key = (operation, generation)
+        
+        rows = iter(seq_of_parameters)
+        total_rowcount = 0
+        pending = 0
+        first = True
+        try:
+            for parameters in rows:
+                _, params = self._convert_parameters(operation, parameters)
+                for i, param in enumerate(params):
+                    type_hint = None
+                    if parameter_types and i < len(parameter_types):
+                        type_hint = parameter_types[i]
+                    self._bind_parameter(i + 1, param, type_hint)
+                
+                if first:
+                    first = False
+                    try:
+                        self._statement.addBatch()
+                    except Exception as e:
+                        # Driver advertises batching but does not implement it
+                        logger.debug(f"addBatch() failed, falling back to per-row execution: {e}")
+                        self.connection._supports_batch = False
+                        return self._executemany_rows(
+                            operation, itertools.chain([parameters], rows), parameter_types)
+                else:
+                    self._statement.addBatch()
+                pending += 1
+                
+                if pending >= self._batch_size:
+                    total_rowcount += self._flush_batch()
+                    pending = 0
+            
+            if pending:
+                total_rowcount += self._flush_batch()
+        except Exception:
+            # Do not leave queued parameter sets behind on a statement that may be reused
+            try:
+                self._statement.clearBatch()
+            except Exception:
+                pass
+            raise
+        
+        self.rowcount = total_rowcount
+        self._release_statement()
+        return self
+
+    def _flush_batch(self):
+        """
+        Send the queued parameter sets with executeBatch().
+        
+        Returns:
+            int: Number of affected rows reported by the driver
+        """
+        counts = self._statement.executeBatch()
+        # Negative counts are SUCCESS_NO_INFO / EXECUTE_FAILED markers
+        return sum(count for count in counts if count > 0)
+
+    def set_batch_size(self, size):
+        """
+        Set how many parameter sets executemany sends per executeBatch() call.
+        
+        Args:
+            size (int): Number of parameter sets per batch
+            
+        Returns:
+            None
+            
+        Note: This is an extension to the DB-API 2.0 specification.
+        """
+        if size < 1:
+            raise ValueError("Batch size must be at least 1")
+        self._batch_size = size
             
     def set_prefetch_size(self, size):
         """
@@ -970,9 +1531,10 @@ class Cursor:
         count = 0
         try:
             while count < self._cache_size:
-                if not self._resultset.next():
+                row = self._next_row()
+                if row is None:
                     break
-                self._row_cache.append(self._get_row())
+                self._row_cache.append(row)
                 count += 1
         except UnoException as e:
             raise _map_sdbc_error(e)
@@ -1008,9 +1570,6 @@ class Cursor:
         if self.closed:
             raise ProgrammingError("Cursor is closed")
         
-        if self._resultset is None:
-            return None
-            
         try:
             # Check if we have cached rows
             if self._row_cache and self._cache_position < len(self._row_cache):
@@ -1019,27 +1578,23 @@ class Cursor:
                 return row
                 
             # If we've exhausted the cache or have no cache, try to get the next row directly
-            if self._resultset.next():
-                row = self._get_row()
+            row = self._next_row()
+            if row is not None:
+                # Add this row to a new cache and prefetch more
+                self._row_cache = [row]
+                self._cache_position = 1
                 
-                # If this is the first row after exhausting the cache, prefetch more rows
-                if self._cache_position >= len(self._row_cache):
-                    # Add this row to a new cache and prefetch more
-                    self._row_cache = [row]
-                    self._cache_position = 1
-                    
-                    # Prefetch more rows (one less since we already fetched one)
-                    count = 1
-                    while count < self._cache_size:
-                        if not self._resultset.next():
-                            break
-                        self._row_cache.append(self._get_row())
-                        count += 1
-                    
-                    # Return the first row we already fetched
-                    return row
-                else:
-                    return row
+                # Prefetch more rows (one less since we already fetched one)
+                count = 1
+                while count < self._cache_size:
+                    extra = self._next_row()
+                    if extra is None:
+                        break
+                    self._row_cache.append(extra)
+                    count += 1
+                
+                # Return the first row we already fetched
+                return row
             
             return None
         except UnoException as e:
@@ -1097,9 +1652,10 @@ class Cursor:
             try:
                 # Use a smaller loop that doesn't create a new cache for each row
                 for _ in range(remaining):
-                    if not self._resultset.next():
+                    row = self._next_row()
+                    if row is None:
                         break
-                    result.append(self._get_row())
+                    result.append(row)
                     
                 # After this direct fetch, if we've fetched some rows and our cache is depleted,
                 # it's a good time to refresh the cache for future fetches
@@ -1143,9 +1699,6 @@ class Cursor:
         if self.closed:
             raise ProgrammingError("Cursor is closed")
         
-        if self._resultset is None:
-            return []
-            
         # Start with any rows from the existing cache
         result = []
         if self._row_cache and self._cache_position < len(self._row_cache):
@@ -1153,8 +1706,11 @@ class Cursor:
         
         # Then fetch all remaining rows
         try:
-            while self._resultset.next():
-                result.append(self._get_row())
+            while True:
+                row = self._next_row()
+                if row is None:
+                    break
+                result.append(row)
         except UnoException as e:
             raise _map_sdbc_error(e)
             
@@ -1453,6 +2009,12 @@ class Cursor:
                     # Use the mapped DB-API type, not the raw SDBC type code
                     self.description.append((name, dbapi_type, display_size, 
                                            internal_size, precision, scale, null_ok))
+                
+                # Compile the per-column readers once for this result set
+                resultset = self._resultset
+                self._row_decoder = tuple(
+                    _make_column_reader(resultset, i + 1, sdbc_type)
+                    for i, sdbc_type in enumerate(self._cached_meta['types']))
             except UnoException as e:
                 raise _map_sdbc_error(e)
                 
@@ -1460,27 +2022,41 @@ class Cursor:
         """
         Convert the current row to a tuple of Python values.
         
+        Uses the column readers compiled in _update_description, so no per-cell
+        type dispatch happens. If a reader fails, the row is decoded again with
+        the generic path, which falls back to getString per column.
+        
         Returns:
             tuple: Current row as a tuple of values
         """
         if self._resultset is None:
             return None
             
-        try:
-            row = []
-            column_count = len(self.description)
+        decoder = self._row_decoder
+        if decoder is None:
+            # Force update of metadata cache and decoder
+            self._update_description()
+            decoder = self._row_decoder
             
-            # Use cached type information for faster lookups
-            cached_types = self._cached_meta['types'] if self._cached_meta else None
+        try:
+            return tuple([read() for read in decoder])
+        except UnoException:
+            return self._get_row_generic()
             
-            # If _cached_meta isn't populated, we need to ensure it's created
-            if not cached_types:
-                # Force update of metadata cache
-                self._update_description()
-                cached_types = self._cached_meta['types']
+    def _get_row_generic(self):
+        """
+        Convert the current row using per-cell type dispatch.
+        
+        This is the slow path used when a compiled column reader fails.
+        
+        Returns:
+            tuple: Current row as a tuple of values
+        """
+        try:
+            row = []
+            cached_types = self._cached_meta['types']
                 
-            for i in range(1, column_count + 1):
-                # Always use the optimized method with direct SDBC type information
+            for i in range(1, len(cached_types) + 1):
                 sdbc_type = cached_types[i-1]
                 value = self._get_value_by_index_and_type(i, sdbc_type)
                     
@@ -1581,15 +2157,7 @@ class Cursor:
                     if not timestamp_str or self._resultset.wasNull():
                         return None
                     # Simple parsing for common timestamp format
-                    if ' ' in timestamp_str and ':' in timestamp_str:
-                        date_part, time_part = timestamp_str.split(' ', 1)
-                        year, month, day = map(int, date_part.split('-'))
-                        time_parts = time_part.split(':')
-                        hour = int(time_parts[0])
-                        minute = int(time_parts[1])
-                        second = int(float(time_parts[2])) if len(time_parts) > 2 else 0
-                        return Timestamp(year, month, day, hour, minute, second)
-                    return timestamp_str
+                    return _parse_timestamp_string(timestamp_str)
             elif sdbc_type == DataType.NUMERIC or sdbc_type == DataType.DECIMAL:
                 # Get numeric/decimal as string and convert to maintain precision
                 val_str = self._resultset.getString(index)
@@ -1808,3 +2376,192 @@ class Cursor:
         self.close()
         # Return False to propagate exceptions
         return False
+
+
+class NamedCursor(Cursor):
+    """
+    Cursor that streams a query through a PostgreSQL server-side cursor.
+    
+    execute() wraps the query in DECLARE ... CURSOR and rows are then pulled
+    with FETCH FORWARD itersize, so at most one chunk of rows is held on the
+    client at a time regardless of the result set size.
+    
+    Notes:
+        - Only queries (SELECT / WITH / VALUES) can be executed
+        - With autocommit enabled the cursor is declared WITH HOLD so it
+          survives the implicit commit; inside a transaction it is WITHOUT HOLD
+        - The server-side cursor is closed when the result set is exhausted,
+          on re-execute and on close()
+        - This is an extension to the DB-API 2.0 specification (similar to
+          psycopg2 named cursors)
+    """
+    
+    # DECLARE embeds the cursor name, so its statement would never be reused
+    _cache_statements = False
+    
+    def __init__(self, connection, name, chunk_size=None):
+        """
+        Initialize a NamedCursor object.
+        
+        Args:
+            connection: The parent Connection object
+            name (str): Server-side cursor name, unique per connection
+            chunk_size (int, optional): Rows fetched per FETCH round-trip
+        """
+        super().__init__(connection)
+        if not name:
+            raise ProgrammingError("Named cursor requires a non-empty name")
+        self.name = name
+        self._quoted_name = '"%s"' % name.replace('"', '""')
+        self.itersize = chunk_size or DEFAULT_STREAM_CHUNK_SIZE
+        if self.itersize < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self._control_statement = None  # Plain statement used for FETCH / CLOSE
+        self._declared = False
+        self._chunk_rows = 0
+        
+    def execute(self, operation, parameters=None, parameter_types=None):
+        """
+        Declare a server-side cursor for the query and fetch the first chunk.
+        
+        Args:
+            operation (str): SELECT statement
+            parameters (tuple/list, optional): Parameters for the operation
+            parameter_types (list, optional): Type hints for parameters
+            
+        Returns:
+            NamedCursor: Self reference for method chaining
+            
+        Raises:
+            ProgrammingError: If cursor is closed or the operation is not a query
+        """
+        if self.closed:
+            raise ProgrammingError("Cursor is closed")
+        if not operation.lstrip().upper().startswith(("SELECT", "WITH", "VALUES")):
+            raise ProgrammingError("Named cursors can only execute queries")
+        
+        self._close_server_cursor()
+        
+        try:
+            hold = "WITH HOLD" if self.connection._conn.getAutoCommit() else "WITHOUT HOLD"
+        except UnoException as e:
+            raise _map_sdbc_error(e)
+        declare = f"DECLARE {self._quoted_name} NO SCROLL CURSOR {hold} FOR {operation}"
+        super().execute(declare, parameters, parameter_types)
+        self._declared = True
+        self.rowcount = -1
+        
+        self._fetch_chunk()
+        return self
+        
+    def executemany(self, operation, seq_of_parameters, parameter_types=None):
+        """Named cursors stream a single query; executemany is not supported."""
+        raise NotSupportedError("executemany() is not supported on named cursors")
+        
+    def _get_control_statement(self):
+        """Return the plain statement used for FETCH and CLOSE, creating it once."""
+        if self._control_statement is None:
+            try:
+                self._control_statement = self.connection._conn.createStatement()
+            except UnoException as e:
+                raise _map_sdbc_error(e)
+        return self._control_statement
+        
+    def _fetch_chunk(self):
+        """Replace the current result set with the next FETCH FORWARD chunk."""
+        try:
+            if self._resultset is not None:
+                self._resultset.close()
+                self._resultset = None
+            statement = self._get_control_statement()
+            self._resultset = statement.executeQuery(
+                f"FETCH FORWARD {int(self.itersize)} FROM {self._quoted_name}")
+            self._chunk_rows = 0
+        except UnoException as e:
+            raise _map_sdbc_error(e)
+        self._update_description()
+        
+    def _close_server_cursor(self):
+        """Close the current result set and the server-side cursor, if declared."""
+        if self._resultset is not None:
+            try:
+                self._resultset.close()
+            except UnoException as e:
+                logger.warning(f"Error closing resultset: {e}")
+            self._resultset = None
+        
+        if self._declared and self.connection is not None and not self.connection.closed:
+            try:
+                self._get_control_statement().executeUpdate(f"CLOSE {self._quoted_name}")
+            except Exception as e:
+                # The cursor is already gone if its transaction ended
+                logger.debug(f"Could not close server-side cursor {self.name}: {e}")
+        self._declared = False
+        
+    def fetchone(self):
+        """
+        Fetch the next row, pulling the next chunk from the server when needed.
+        
+        Returns:
+            tuple: The next row, or None when the result set is exhausted
+        """
+        if self.closed:
+            raise ProgrammingError("Cursor is closed")
+        
+        try:
+            while self._resultset is not None:
+                if self._resultset.next():
+                    self._chunk_rows += 1
+                    return self._get_row()
+                if self._chunk_rows < self.itersize:
+                    # A short chunk means the server cursor is exhausted
+                    self._close_server_cursor()
+                    return None
+                self._fetch_chunk()
+            return None
+        except UnoException as e:
+            raise _map_sdbc_error(e)
+            
+    def fetchmany(self, size=None):
+        """
+        Fetch up to size rows (default: arraysize).
+        
+        Returns:
+            list: A list of rows, each row as a tuple of values
+        """
+        if size is None:
+            size = self.arraysize
+        result = []
+        while len(result) < size:
+            row = self.fetchone()
+            if row is None:
+                break
+            result.append(row)
+        return result
+        
+    def fetchall(self):
+        """
+        Fetch all remaining rows.
+        
+        This materializes the rest of the result set; iterate over the cursor
+        instead to keep memory bounded.
+        
+        Returns:
+            list: A list of all remaining rows
+        """
+        return list(iter(self.fetchone, None))
+        
+    def close(self):
+        """Close the server-side cursor and release resources."""
+        if self.closed:
+            return
+        self._close_server_cursor()
+        if self._control_statement is not None:
+            try:
+                self._control_statement.close()
+                self._control_statement.dispose()
+            except Exception as e:
+                logger.warning(f"Error closing statement: {e}")
+            finally:
+                self._control_statement = None
+        super().close()
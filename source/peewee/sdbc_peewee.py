@@ -1,5 +1,9 @@
+import itertools
 import re
+import threading
+import time
 import warnings
+from collections import OrderedDict
 from librepy.pybrex.values import pybrex_logger
 
 try:
@@ -13,17 +17,147 @@ from librepy.peewee.peewee import (
     ImproperlyConfigured,
     OperationalError,
     InterfaceError,
+    NotSupportedError,
+    Node,
+    __exception_wrapper__,
 )
 
 logger = pybrex_logger(__name__)
 
+# PostgreSQL's protocol limit on bind parameters in a single statement
+MAX_BIND_PARAMETERS = 65535
+# Compiled query templates kept per database instance
+QUERY_TEMPLATE_CACHE_SIZE = 256
+
+
+class QueryParam(Node):
+    """
+    Named bind slot in a query template.
+
+    Use it wherever a value would go (``Model.field == QueryParam('start')``).
+    When compiled it emits a placeholder and remembers the converter peewee
+    would have applied to a literal value (e.g. the field's db_value), so
+    bound values are converted the same way. Slots hold scalar values.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __sql__(self, ctx):
+        return ctx.value(_ParamSlot(self.name, ctx.state.converter), converter=False)
+
+
+class _ParamSlot(object):
+    __slots__ = ('name', 'converter')
+
+    def __init__(self, name, converter):
+        self.name = name
+        self.converter = converter
+
+
+class QueryParams(object):
+    """Factory passed to template builders: ``P.start`` is ``QueryParam('start')``."""
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return QueryParam(name)
+
+
+class QueryTemplate(object):
+    """A query compiled once to SQL plus the positions of its named slots."""
+
+    def __init__(self, sql, params):
+        self.sql = sql
+        self.params = list(params)
+        self.slots = [(i, p.name, p.converter) for i, p in enumerate(self.params)
+                      if isinstance(p, _ParamSlot)]
+        self.names = frozenset(name for _, name, _ in self.slots)
+
+    def bind(self, values):
+        """Return the parameter list with every slot replaced by its value."""
+        missing = self.names.difference(values)
+        if missing:
+            raise KeyError(f"Missing query template parameter(s): {', '.join(sorted(missing))}")
+        params = list(self.params)
+        for index, name, converter in self.slots:
+            value = values[name]
+            params[index] = converter(value) if converter and value is not None else value
+        return params
+
+
+def compile_query_template(database, query):
+    """Compile a query containing QueryParam slots into a QueryTemplate."""
+    sql, params = database.get_sql_context().sql(query).query()
+    return QueryTemplate(sql, params)
+
+
+class InsertTemplate(object):
+    """
+    A one-row INSERT with QueryParam values, widened to any number of rows.
+
+    Peewee renders every value of a multi-row insert_many() through its SQL
+    context, which dominates bulk loads. Here the statement (columns, model
+    defaults, ON CONFLICT and RETURNING clauses) is compiled once; the VALUES
+    group is repeated per row and rows are bound with the field converters.
+    Callable model defaults are evaluated once, when the template is built.
+
+    Example:
+        query = Teacher.insert_many([{'first_name': QueryParam('first_name'), ...}])
+        template = InsertTemplate(db, query, {'first_name': Teacher.first_name.db_value, ...})
+        db.execute_sql(template.sql(len(rows)), template.bind_rows(rows))
+    """
+
+    def __init__(self, database, query, converters=None):
+        template = compile_query_template(database, query)
+        head, sep, rest = template.sql.partition(' VALUES ')
+        group = '(%s)' % ', '.join([database.param] * len(template.params))
+        if not sep or not rest.startswith(group):
+            raise ValueError('Not a single-row INSERT: %s' % template.sql)
+        converters = converters or {}
+        self.row_params = len(template.params)
+        self._head = head + sep
+        self._group = group
+        self._tail = rest[len(group):]
+        self._params = template.params
+        self._slots = [(index, name, converters.get(name)) for index, name, _ in template.slots]
+        self._sql = {}
+
+    def sql(self, row_count):
+        """Return the INSERT statement for row_count rows."""
+        sql = self._sql.get(row_count)
+        if sql is None:
+            sql = self._sql[row_count] = (
+                self._head + ', '.join([self._group] * row_count) + self._tail)
+        return sql
+
+    def bind_rows(self, rows):
+        """Return the flat parameter list for rows (dicts keyed by slot name)."""
+        params = []
+        for row in rows:
+            values = list(self._params)
+            for index, name, converter in self._slots:
+                value = row[name]
+                values[index] = converter(value) if converter and value is not None else value
+            params.extend(values)
+        return params
+
+
 class SDBCPostgresqlDatabase(PostgresqlDatabase):
     """
     Peewee Database subclass using the sdbc_dbapi DB-API 2.0 wrapper
     for PostgreSQL connections within LibreOffice.
+
+    Not thread-safe: one connection and transaction stack is shared by every
+    thread, so only the office main thread may use it. Code that queries
+    from worker threads needs PooledSDBCPostgresqlDatabase.
     """
 
     param = '?'  # Explicitly use qmark style for SDBC
+    supports_upsert = True
+    supports_multirow_insert = True
+    # Per-thread connection state (peewee's thread_safe); see the class docstring
+    per_thread_state = False
 
     def __init__(self, database, **kwargs):
         """
@@ -40,8 +174,10 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
             )
 
         self._sdbc_connect_kwargs = kwargs.copy()
+        self._stream_counter = itertools.count(1)
 
-        sdbc_params = ['user', 'password', 'host', 'port', 'dsn', 'connect_timeout']
+        sdbc_params = ['user', 'password', 'host', 'port', 'dsn', 'connect_timeout',
+                       'statement_cache_size']
         peewee_params = ['thread_safe', 'autorollback', 'field_types',
                          'operations', 'autocommit', 'autoconnect', 'sequences']
         parent_kwargs = {}
@@ -51,7 +187,7 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
             elif key in peewee_params:
                 parent_kwargs[key] = self._sdbc_connect_kwargs.pop(key)
 
-        parent_kwargs['thread_safe'] = False
+        parent_kwargs['thread_safe'] = self.per_thread_state
         Database.__init__(self, database, **parent_kwargs)
         self.init(database, **self._sdbc_connect_kwargs)
 
@@ -89,7 +225,9 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
         self.returning_clause = getattr(self, 'returning_clause', True)
         self.for_update = getattr(self, 'for_update', True)
 
-        self.returning_clause = False
+        # Feature flags are (re)detected from the server on the next connection
+        self.server_version = None
+        self.clear_query_templates()
 
     def _connect(self):
         """Establish the database connection using sdbc_dbapi.connect."""
@@ -125,16 +263,58 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
 
     def _set_server_version(self, conn):
         """
-        Hardcoded PostgreSQL server version to 9.3 to avoid connection issues
-        during version detection.
+        Detect the PostgreSQL server version and enable the features it supports.
+
+        Peewee calls this once, on the first connection; the sdbc_dbapi connection
+        caches the detected value. If detection fails, fall back to a conservative
+        9.3 feature set instead of failing the connection.
         """
-        self.server_version = (9, 3, 0)
-        
-        # This logic is kept to ensure peewee features are set correctly based on the hardcoded version.
-        if self.server_version >= (9, 6, 0):
-             self.safe_create_index = True
+        try:
+            version_num = conn.server_version
+        except sdbc_dbapi.Error as e:
+            logger.warning(f"Could not detect server version, assuming 9.3: {e}")
+            version_num = 90300
+
+        if version_num >= 100000:
+            self.server_version = (version_num // 10000, version_num % 10000, 0)
         else:
-             self.safe_create_index = False
+            self.server_version = (version_num // 10000, (version_num // 100) % 100, version_num % 100)
+        logger.info(f"PostgreSQL server version {'.'.join(map(str, self.server_version))}")
+
+        # CREATE INDEX IF NOT EXISTS is available from PostgreSQL 9.5
+        self.safe_create_index = self.server_version >= (9, 5, 0)
+        # INSERT ... ON CONFLICT (upsert) is available from PostgreSQL 9.5
+        self.supports_upsert = self.server_version >= (9, 5, 0)
+        # INSERT ... RETURNING is available from PostgreSQL 8.2
+        self.returning_clause = self.server_version >= (8, 2, 0)
+        # Multi-row INSERT ... VALUES (...), (...) is available from PostgreSQL 8.2
+        self.supports_multirow_insert = self.server_version >= (8, 2, 0)
+        # Templates compiled before detection may have assumed other features
+        self.clear_query_templates()
+
+    def conflict_update(self, oc, query):
+        """Build ON CONFLICT clauses, refusing them on servers older than 9.5."""
+        if not self.supports_upsert:
+            raise NotSupportedError(
+                'ON CONFLICT requires PostgreSQL 9.5 or newer (server is %s).' %
+                '.'.join(map(str, self.server_version or ())))
+        return super(SDBCPostgresqlDatabase, self).conflict_update(oc, query)
+
+    def insert_batch_size(self, field_count, max_rows=1000):
+        """
+        Return how many rows to send per INSERT statement for a bulk write.
+
+        Multi-row VALUES inserts are capped by PostgreSQL's limit of 65535 bind
+        parameters per statement; without multi-row support every row is sent
+        on its own.
+
+        Args:
+            field_count: Number of columns inserted per row.
+            max_rows: Upper bound on rows per statement.
+        """
+        if not self.supports_multirow_insert:
+            return 1
+        return max(1, min(max_rows, MAX_BIND_PARAMETERS // max(int(field_count), 1)))
 
     def is_connection_usable(self):
         """
@@ -158,6 +338,42 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
         else:
             return status == sdbc_dbapi.TRANSACTION_STATUS_IDLE
 
+    def query_template(self, key, query):
+        """
+        Return the QueryTemplate cached under key, compiling query on a miss.
+
+        key must identify the query's shape (e.g. (dao class, name)); the
+        query is only compiled the first time the key is seen.
+        """
+        with self._query_templates_lock:
+            template = self._query_templates.get(key)
+            if template is not None:
+                self._query_templates.move_to_end(key)
+                self.query_template_hits += 1
+                return template
+        template = compile_query_template(self, query)
+        with self._query_templates_lock:
+            self.query_template_misses += 1
+            self._query_templates[key] = template
+            while len(self._query_templates) > QUERY_TEMPLATE_CACHE_SIZE:
+                self._query_templates.popitem(last=False)
+        return template
+
+    def execute_template(self, key, query, values):
+        """Execute the cached template for key with values bound to its slots."""
+        template = self.query_template(key, query)
+        return self.execute_sql(template.sql, template.bind(values))
+
+    def clear_query_templates(self):
+        """Drop every compiled query template (SQL may depend on server features)."""
+        lock = getattr(self, '_query_templates_lock', None)
+        if lock is None:
+            self._query_templates_lock = lock = threading.Lock()
+        with lock:
+            self._query_templates = OrderedDict()
+            self.query_template_hits = 0
+            self.query_template_misses = 0
+
     def get_binary_type(self):
         """
         Return the appropriate binary type constructor for SDBC.
@@ -166,11 +382,16 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
         # sdbc_dbapi defines Binary = bytes
         return sdbc_dbapi.Binary
 
-    def last_insert_id(self, cursor, model):
+    def last_insert_id(self, cursor, query_type=None):
         """
-        Retrieve the last inserted ID using SELECT lastval()
-        since RETURNING is disabled for SDBC.
+        Retrieve the last inserted ID.
+
+        With RETURNING enabled peewee hands us the rows of INSERT ... RETURNING
+        (one pk for a single insert, all pks for insert_many); otherwise fall
+        back to a separate SELECT lastval() round-trip.
         """
+        if self.returning_clause:
+            return super(SDBCPostgresqlDatabase, self).last_insert_id(cursor, query_type)
         try:
             cursor.execute("SELECT lastval()")
             result = cursor.fetchone()
@@ -180,6 +401,59 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
             warnings.warn(f"Could not retrieve lastval(): {e}")
             return None
 
+    def cursor(self, commit=None, named_cursor=None, chunk_size=None):
+        """
+        Return a cursor on the current connection.
+
+        When named_cursor is truthy a server-side (streaming) cursor is returned;
+        pass a string to choose its name, otherwise a unique one is generated.
+        """
+        if not named_cursor:
+            return super(SDBCPostgresqlDatabase, self).cursor(commit=commit)
+        if self.is_closed():
+            if self.autoconnect:
+                self.connect()
+            else:
+                raise InterfaceError('Error, database connection not opened.')
+        if not isinstance(named_cursor, str):
+            named_cursor = 'sdbc_stream_%d' % next(self._stream_counter)
+        return self._state.conn.cursor(name=named_cursor, chunk_size=chunk_size)
+
+    def execute_sql(self, sql, params=None, commit=None, stream=False, chunk_size=None):
+        """
+        Execute SQL and return the cursor.
+
+        With stream=True the query runs through a server-side cursor and rows are
+        fetched chunk_size at a time, so iterating the result keeps memory bounded.
+        """
+        if not stream:
+            return super(SDBCPostgresqlDatabase, self).execute_sql(sql, params, commit=commit)
+        logger.debug(f"Streaming query: {(sql, params)}")
+        with __exception_wrapper__:
+            cursor = self.cursor(named_cursor=True, chunk_size=chunk_size)
+            cursor.execute(sql, params or ())
+        return cursor
+
+    def stream(self, query, chunk_size=None):
+        """
+        Iterate over a SELECT query using a server-side cursor.
+
+        Rows are converted by the query's usual cursor wrapper (models, dicts,
+        tuples...) but are never cached, so memory stays bounded by chunk_size.
+
+        Example:
+            for row in db.stream(TrainingSession.select().dicts(), chunk_size=500):
+                ...
+        """
+        ctx = self.get_sql_context()
+        sql, params = ctx.sql(query).query()
+        cursor = self.execute_sql(sql, params, stream=True, chunk_size=chunk_size)
+        try:
+            for row in query._get_cursor_wrapper(cursor).iterator():
+                yield row
+        finally:
+            cursor.close()
+
     # Override metadata methods to use '?' placeholders for SDBC
     def get_tables(self, schema=None):
         query = ('SELECT tablename FROM pg_catalog.pg_tables '
@@ -292,4 +566,217 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
 
     def is_closed(self):
         """Check if the database connection is closed."""
-        return super(SDBCPostgresqlDatabase, self).is_closed()
\ No newline at end of file
+        return super(SDBCPostgresqlDatabase, self).is_closed()
+
+
+class PooledSDBCPostgresqlDatabase(SDBCPostgresqlDatabase):
+    """
+    SDBCPostgresqlDatabase that keeps closed connections warm for reuse.
+
+    Modeled on playhouse's PooledPostgresqlDatabase: close() hands the SDBC
+    connection back to the pool instead of closing it, and the next connect()
+    reuses it, skipping the DriverManager.getConnectionWithInfo handshake.
+
+    Pool parameters:
+        max_connections: Maximum number of open connections (None = unlimited).
+        stale_timeout: Seconds after which an idle connection is discarded.
+        timeout: Seconds connect() waits for a free connection when the pool is
+            exhausted (None = fail immediately, 0 = wait forever).
+
+    Idle connections are checked with get_transaction_status() before reuse;
+    broken ones are dropped and left-over transactions are rolled back. The
+    most recently returned idle connection is reused first (LIFO), so the
+    warmest connection and its statement cache serve most requests.
+
+    Connection state is per thread: each thread that connects checks out its
+    own pooled connection and transaction stack, so worker threads never
+    share a connection with the office main thread.
+    """
+
+    per_thread_state = True
+
+    def __init__(self, database, max_connections=20, stale_timeout=None,
+                 timeout=None, **kwargs):
+        self._max_connections = max_connections
+        self._stale_timeout = stale_timeout
+        if timeout == 0:
+            timeout = float('inf')
+        self._wait_timeout = timeout
+
+        self._pool_lock = threading.RLock()
+        # Idle connections as a stack of (last_used, conn), oldest first
+        self._connections = []
+        # Checked-out connections: {key: (checked_out_at, conn)}
+        self._in_use = {}
+        # Keys of connections that already ran _initialize_connection
+        self._initialized = set()
+
+        self._pool_stats = {
+            'creations': 0,
+            'reuses': 0,
+            'waits': 0,
+            'wait_time': 0.0,
+            'discarded': 0,
+        }
+
+        super(PooledSDBCPostgresqlDatabase, self).__init__(database, **kwargs)
+
+    def _connect(self):
+        """Check out an idle pooled connection, or open a new one."""
+        deadline = None
+        while True:
+            with self._pool_lock:
+                conn = self._checkout_idle()
+                if conn is not None:
+                    self._pool_stats['reuses'] += 1
+                    return conn
+
+                if not self._max_connections or len(self._in_use) < self._max_connections:
+                    conn = super(PooledSDBCPostgresqlDatabase, self)._connect()
+                    self._pool_stats['creations'] += 1
+                    self._in_use[self._key(conn)] = (time.time(), conn)
+                    logger.debug(f"Pool created connection ({len(self._in_use)} in use)")
+                    return conn
+
+            if self._wait_timeout is None:
+                raise OperationalError(
+                    f'Connection pool exhausted: {self._max_connections} connections in use.')
+
+            now = time.time()
+            if deadline is None:
+                deadline = now + self._wait_timeout
+                self._pool_stats['waits'] += 1
+            elif now >= deadline:
+                raise OperationalError(
+                    f'Timed out waiting for a pooled connection after {self._wait_timeout}s.')
+            time.sleep(0.05)
+            self._pool_stats['wait_time'] += 0.05
+
+    def _key(self, conn):
+        return id(conn)
+
+    def _checkout_idle(self):
+        """Pop the most recently returned usable idle connection, discarding bad ones."""
+        # Stale connections collect at the bottom of the stack
+        while self._connections and self._is_stale(self._connections[0][0]):
+            _, conn = self._connections.pop(0)
+            logger.debug("Pool discarding stale connection")
+            self._discard(self._key(conn), conn)
+        while self._connections:
+            _, conn = self._connections.pop()
+            key = self._key(conn)
+            if not self._can_reuse(conn):
+                logger.debug("Pool discarding unusable connection")
+                self._discard(key, conn)
+            else:
+                self._in_use[key] = (time.time(), conn)
+                return conn
+        return None
+
+    def _is_stale(self, timestamp):
+        return bool(self._stale_timeout) and (time.time() - timestamp) > self._stale_timeout
+
+    def _can_reuse(self, conn):
+        """Liveness check via get_transaction_status; resets open transactions."""
+        if conn.closed:
+            return False
+        status = conn.get_transaction_status()
+        if status == sdbc_dbapi.TRANSACTION_STATUS_UNKNOWN:
+            return False
+        if status != sdbc_dbapi.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+                conn.set_autocommit(True)
+            except sdbc_dbapi.Error as e:
+                logger.warning(f"Could not reset pooled connection: {e}")
+                return False
+        return True
+
+    def _discard(self, key, conn):
+        self._pool_stats['discarded'] += 1
+        self._initialized.discard(key)
+        try:
+            conn.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled connection: {e}")
+
+    def _initialize_connection(self, conn):
+        """Run connection setup only the first time a connection is handed out."""
+        key = self._key(conn)
+        if key in self._initialized:
+            return
+        super(PooledSDBCPostgresqlDatabase, self)._initialize_connection(conn)
+        self._initialized.add(key)
+
+    def _close(self, conn, close_conn=False):
+        """Return the connection to the pool (or really close it when asked)."""
+        key = self._key(conn)
+        with self._pool_lock:
+            if close_conn:
+                self._in_use.pop(key, None)
+                self._discard(key, conn)
+            elif key not in self._in_use:
+                logger.warning("Attempting to release a connection not checked out from the pool")
+            else:
+                self._in_use.pop(key)
+                if conn.closed:
+                    self._discard(key, conn)
+                else:
+                    self._connections.append((time.time(), conn))
+
+    def manual_close(self):
+        """Close the current connection instead of returning it to the pool."""
+        if self.is_closed():
+            return False
+        if self.in_transaction():
+            raise OperationalError('Attempting to close database while transaction is open.')
+        conn = self._state.conn
+        try:
+            self._close(conn, close_conn=True)
+        finally:
+            self._state.reset()
+        return True
+
+    def close_idle(self):
+        """Close all idle connections held by the pool."""
+        with self._pool_lock:
+            while self._connections:
+                _, conn = self._connections.pop()
+                self._discard(self._key(conn), conn)
+
+    def close_stale(self, age=600):
+        """Close checked-out connections older than age seconds (leaked connections)."""
+        cutoff = time.time() - age
+        closed = 0
+        with self._pool_lock:
+            for key, (checked_out, conn) in list(self._in_use.items()):
+                if checked_out < cutoff:
+                    self._in_use.pop(key)
+                    self._discard(key, conn)
+                    closed += 1
+        return closed
+
+    def close_all(self):
+        """Close every connection, idle and checked out."""
+        self.close()
+        with self._pool_lock:
+            self.close_idle()
+            for key, (_, conn) in list(self._in_use.items()):
+                self._discard(key, conn)
+            self._in_use.clear()
+
+    def pool_stats(self):
+        """
+        Return pool metrics.
+
+        Returns:
+            dict: in_use, idle, max_connections, creations, reuses, waits,
+            wait_time (seconds spent waiting) and discarded connections.
+        """
+        with self._pool_lock:
+            stats = dict(self._pool_stats)
+            stats['in_use'] = len(self._in_use)
+            stats['idle'] = len(self._connections)
+            stats['max_connections'] = self._max_connections
+        return stats
+
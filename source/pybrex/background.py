@@ -0,0 +1,63 @@
+#coding:utf-8
+# Purpose: Run work off the office main thread and call back on it
+
+
+import threading
+import traceback
+
+import uno
+import unohelper
+
+from com.sun.star.awt import XCallback
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+def post_to_main_thread(ctx, smgr, func, *args):
+    '''Queue func(*args) to run on the office main thread.
+
+    Uses com.sun.star.awt.AsyncCallback, which is served by the main event
+    loop, including the loop of a modal dialog, so func may touch controls.
+    '''
+    try:
+        async_callback = smgr.createInstanceWithContext('com.sun.star.awt.AsyncCallback', ctx)
+        async_callback.addCallback(_MainThreadCall(func, args), None)
+    except Exception:
+        logger.error(traceback.format_exc())
+
+
+def run_in_background(ctx, smgr, func, on_done=None, name=None):
+    '''Run func() on a daemon thread and report back on the main thread.
+
+    on_done(result, error) is posted to the main thread when func finishes;
+    error is the raised exception or None.
+
+    Returns:
+        threading.Thread: The started worker thread
+    '''
+    def worker():
+        result, error = None, None
+        try:
+            result = func()
+        except Exception as e:
+            error = e
+            logger.debug(traceback.format_exc())
+        if on_done is not None:
+            post_to_main_thread(ctx, smgr, on_done, result, error)
+
+    thread = threading.Thread(target=worker, name=name or 'pybrex-background', daemon=True)
+    thread.start()
+    return thread
+
+
+class _MainThreadCall(unohelper.Base, XCallback):
+    def __init__(self, func, args):
+        self.func = func
+        self.args = args
+
+    def notify(self, data):
+        try:
+            self.func(*self.args)
+        except Exception:
+            logger.error(traceback.format_exc())
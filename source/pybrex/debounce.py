@@ -0,0 +1,76 @@
+#coding:utf-8
+# Purpose: Debounced callbacks for control events
+
+
+import threading
+import traceback
+
+from librepy.pybrex.background import post_to_main_thread
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class Debouncer(object):
+    '''Delay a callback until events stop arriving for delay_ms.
+
+    Every trigger() restarts the delay. When it elapses, the callback is
+    handed to com.sun.star.awt.AsyncCallback so it runs on the office main
+    thread, where it is safe to touch controls. Only the latest trigger
+    fires; earlier ones are dropped.
+    '''
+
+    def __init__(self, ctx, smgr, callback, delay_ms=300):
+        self.ctx = ctx
+        self.smgr = smgr
+        self.callback = callback
+        self.delay_ms = delay_ms
+        self._lock = threading.Lock()
+        self._timer = None
+        self._generation = 0
+
+    def trigger(self):
+        '''Restart the delay; the callback fires once it elapses without another trigger.'''
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay_ms / 1000.0, self._post, args=(generation,))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        '''Run a pending callback now (e.g. on Enter) instead of waiting.'''
+        with self._lock:
+            pending = self._timer is not None
+            self._cancel_locked()
+        if pending:
+            self._fire()
+
+    def cancel(self):
+        '''Drop a pending callback.'''
+        with self._lock:
+            self._cancel_locked()
+
+    def _cancel_locked(self):
+        self._generation += 1
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _post(self, generation):
+        post_to_main_thread(self.ctx, self.smgr, self._run_if_current, generation)
+
+    def _run_if_current(self, generation):
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._timer = None
+        self._fire()
+
+    def _fire(self):
+        try:
+            self.callback()
+        except Exception:
+            logger.error(traceback.format_exc())
@@ -5,10 +5,18 @@
 # Copyright (C) 2018, Timothy Hoover
 
 
+from collections import OrderedDict
+
+import uno
+import unohelper
+
 from librepy.pybrex.msgbox import msgbox
 from librepy.pybrex.values import GRID_HEADER_BG_COLOR, GRID_ROW_BG_COLOR1, GRID_ROW_BG_COLOR2
 from com.sun.star.awt.MouseButton import LEFT as MB_LEFT
 from com.sun.star.awt.PosSize import POSSIZE
+from com.sun.star.awt.grid import XMutableGridDataModel, XSortableGridData
+from com.sun.star.lang import IndexOutOfBoundsException
+from com.sun.star.uno import RuntimeException
 
 import logging
 logger = logging.getLogger(__name__)
@@ -34,6 +42,11 @@ class GridBase(object):
             self.color1 = props['color1']
         if 'color2' in props:
             self.color2 = props['color2']
+        self._lazy_model = None
+        self._default_data_model = None
+        # heading -> row values last written by set_data()/sync(), in data
+        # model order; None when the rows are not known (add()/update()/delete())
+        self._synced = None
 
     def _build_default_props(self, name, x, y, width, height, **props):
         d = {
@@ -133,6 +146,8 @@ class GridBase(object):
 
     def set_data(self, data, heading = 'id', clear=True, resort = True):
         'Set data to grid'
+        if self._lazy_model is not None:
+            self._restore_default_model()
         dm = self._data_model
         if resort:
             #Save the current sort
@@ -156,14 +171,59 @@ class GridBase(object):
             headings = tuple(["%s" % i for i in range(len(data))])
         #Add data to grid
         dm.addRows(headings, rows)
+        if heading and (clear or self._synced is not None):
+            if clear:
+                self._synced = OrderedDict()
+            self._synced.update(zip(headings, rows))
+        else:
+            self._synced = None
         
         if resort:
             #Resort columns
             if sort_props.First > 0:
                 dm.sortByColumn(sort_props.First, sort_props.Second)
                 
+    def set_source(self, source, heading = 'id', page_size = 100, max_pages = 20):
+        '''Show a paged source instead of a fully loaded data set.
+
+        source must provide count(), fetch(offset, limit, sort_key, ascending)
+        returning row dicts, and can_sort(sort_key). Rows are fetched a page
+        at a time as the grid paints them; at most max_pages pages are kept.
+        Clicking a column header re-orders the source in SQL rather than
+        sorting rows in memory. The current sort is kept across calls.
+        '''
+        sort = None
+        if self._lazy_model is not None:
+            sort = self._lazy_model.sort
+        elif self._data_model is not None:
+            try:
+                sort_props = self._data_model.getCurrentSortOrder()
+                if sort_props.First >= 0:
+                    sort = (sort_props.First, sort_props.Second)
+            except Exception:
+                sort = None
+        if self._default_data_model is None:
+            self._default_data_model = self._data_model
+        model = LazyGridDataModel(self, source, heading, page_size, max_pages)
+        if sort is not None:
+            model.apply_sort(sort[0], sort[1])
+        self._lazy_model = model
+        self._data_model = model
+        self._model.GridDataModel = model
+        self.current_row = None
+
+    def _restore_default_model(self):
+        self._lazy_model = None
+        if self._default_data_model is not None:
+            self._data_model = self._default_data_model
+            self._model.GridDataModel = self._default_data_model
+        self._default_data_model = None
+
     def clear(self):
+        if self._lazy_model is not None:
+            self._restore_default_model()
         self._data_model.removeAllRows()
+        self._synced = OrderedDict()
         
     def data_value(self, data, title):
         if title[3] == 1:
@@ -191,6 +251,122 @@ class GridBase(object):
             
     def reload(self, data):
         self.set_data(data, heading = 'id', clear = True)
+
+    def sync(self, data, key = 'id'):
+        '''Bring the grid in line with data by applying only the differences.
+
+        Rows are matched on their heading (data_row[key]). Rows no longer in
+        data are removed, rows whose values changed are updated in place and
+        new rows are inserted at their position in data (or appended and left
+        to the active column sort). Unchanged rows are not touched, so the
+        selection and scroll position survive a refresh. Falls back to
+        set_data() when the surviving rows changed order in an unsorted grid.
+
+        The diff is taken against the rows last written by set_data()/sync(),
+        not read back from the data model, so a refresh without changes makes
+        no per-row UNO calls. Row headings are read only when a column-sorted
+        grid has rows to change, since the sort decides their positions.
+
+        Returns (inserted, updated, removed) counts.
+        '''
+        if self._lazy_model is not None:
+            self.set_data(data, heading = key)
+            return len(data), 0, 0
+        dm = self._data_model
+        columns = tuple(range(len(self.titles)))
+        target_keys = []
+        target_values = {}
+        for data_row in data:
+            row_key = data_row[key]
+            target_keys.append(row_key)
+            target_values[row_key] = tuple([self.data_value(data_row, t) for t in self.titles])
+
+        synced = self._synced
+        if synced is None:
+            # Rows written outside set_data()/sync(): read them back once
+            synced = OrderedDict((dm.getRowHeading(i), tuple(dm.getRowData(i))) for i in range(dm.RowCount))
+            self._synced = synced
+        if not synced:
+            # Initial fill: one bulk addRows is cheaper than row-by-row inserts
+            self.set_data(data, heading = key)
+            return len(data), 0, 0
+        sorted_grid = dm.getCurrentSortOrder().First >= 0
+
+        if not sorted_grid:
+            surviving = [k for k in synced if k in target_values]
+            surviving_set = set(surviving)
+            if surviving != [k for k in target_keys if k in surviving_set]:
+                self.set_data(data, heading = key)
+                return len(data), 0, len(synced)
+
+        changed = set(k for k, values in synced.items()
+                      if k not in target_values or target_values[k] != values)
+        if not changed and len(synced) == len(target_values):
+            return 0, 0, 0
+
+        # Row positions: the synced order, unless a column sort orders the rows
+        if sorted_grid:
+            current_keys = [dm.getRowHeading(i) for i in range(dm.RowCount)]
+        else:
+            current_keys = list(synced)
+        selected = set()
+        try:
+            for row in self._ctr.getSelectedRows():
+                if 0 <= row < len(current_keys):
+                    selected.add(current_keys[row])
+        except Exception:
+            pass
+
+        # Deletes, bottom-up so earlier indexes stay valid
+        removed = 0
+        for row in range(len(current_keys) - 1, -1, -1):
+            if current_keys[row] not in target_values:
+                dm.removeRow(row)
+                del current_keys[row]
+                removed += 1
+
+        # Updates
+        updated = 0
+        for row, row_key in enumerate(current_keys):
+            if row_key in changed:
+                dm.updateRowData(columns, row, target_values[row_key])
+                updated += 1
+
+        # Inserts
+        inserted = 0
+        present = set(current_keys)
+        for index, row_key in enumerate(target_keys):
+            if row_key in present:
+                continue
+            if sorted_grid:
+                dm.addRow(row_key, target_values[row_key])
+            else:
+                dm.insertRow(index, row_key, target_values[row_key])
+            present.add(row_key)
+            inserted += 1
+        self._synced = OrderedDict((k, target_values[k]) for k in target_keys)
+
+        if selected and (inserted or removed or sorted_grid):
+            # An unsorted grid now holds the rows in data order
+            self._reselect(selected, None if sorted_grid else target_keys)
+        return inserted, updated, removed
+
+    def _reselect(self, headings, order = None):
+        '''Select the rows whose headings are in headings.
+
+        order is the grid's row headings when already known; otherwise they
+        are read from the data model.
+        '''
+        try:
+            if order is None:
+                dm = self._data_model
+                order = [dm.getRowHeading(row) for row in range(dm.RowCount)]
+            self._ctr.deselectAllRows()
+            for row, row_heading in enumerate(order):
+                if row_heading in headings:
+                    self._ctr.selectRow(row)
+        except Exception:
+            logger.debug('Could not restore grid selection')
             
     def update(self, data):
         if self.current_row is None:
@@ -202,12 +378,14 @@ class GridBase(object):
         values = tuple(values)
         
         self._data_model.updateRowData(columns, self.current_row, values)
+        self._synced = None
         return True
             
     def delete(self):
         if self.current_row is None:
             return False
         self._data_model.removeRow(self.current_row)
+        self._synced = None
         return True
         
     def add(self, data, heading):
@@ -215,6 +393,7 @@ class GridBase(object):
         for t in self.titles:
             values.append(self.data_value(data, t))
         self._data_model.addRow(heading, tuple(values))
+        self._synced = None
         
     def set_last_line_color(self, color):
         colors = []
@@ -253,3 +432,179 @@ class GridBase(object):
         if row == -1:
             return None
         return row
+
+
+class LazyGridDataModel(unohelper.Base, XMutableGridDataModel, XSortableGridData):
+    '''Read-only grid data model that pulls rows from a paged source on demand.
+
+    The grid control asks for cell data only for the rows it paints, so a
+    page is fetched the first time one of its rows becomes visible. Pages are
+    kept in an LRU cache of max_pages entries. Sorting is delegated to the
+    source (ORDER BY) and resets the cache.
+    '''
+
+    def __init__(self, grid_base, source, heading, page_size, max_pages):
+        self.grid_base = grid_base
+        self.source = source
+        self.heading = heading
+        self.page_size = max(int(page_size), 1)
+        self.max_pages = max(int(max_pages), 1)
+        self.sort = None                    # (column index, ascending)
+        self._pages = OrderedDict()         # page index -> [(heading, values), ...]
+        self._data_listeners = []
+        self._event_listeners = []
+        self._row_count = None
+
+    # --- XGridDataModel ---
+
+    @property
+    def RowCount(self):
+        if self._row_count is None:
+            self._row_count = int(self.source.count() or 0)
+        return self._row_count
+
+    @property
+    def ColumnCount(self):
+        return len(self.grid_base.titles)
+
+    def getCellData(self, column, row):
+        return self._row(row)[1][column]
+
+    def getCellToolTip(self, column, row):
+        return None
+
+    def getRowHeading(self, row):
+        return self._row(row)[0]
+
+    def getRowData(self, row):
+        return self._row(row)[1]
+
+    # --- XSortableGridData ---
+
+    def sortByColumn(self, column, ascending):
+        if self.apply_sort(column, ascending):
+            self._notify('dataChanged')
+
+    def removeColumnSort(self):
+        self.sort = None
+        self._pages.clear()
+        self._notify('dataChanged')
+
+    def getCurrentSortOrder(self):
+        column, ascending = self.sort if self.sort is not None else (-1, True)
+        return uno.createUnoStruct('com.sun.star.beans.Pair<long,boolean>', column, ascending)
+
+    def apply_sort(self, column, ascending):
+        '''Set the sort without notifying listeners; False if the column cannot be sorted.'''
+        if not 0 <= column < len(self.grid_base.titles):
+            return False
+        if not self.source.can_sort(self.grid_base.titles[column][1]):
+            return False
+        self.sort = (column, bool(ascending))
+        self._pages.clear()
+        return True
+
+    # --- XMutableGridDataModel (listeners only; rows come from the source) ---
+
+    def addGridDataListener(self, listener):
+        self._data_listeners.append(listener)
+
+    def removeGridDataListener(self, listener):
+        if listener in self._data_listeners:
+            self._data_listeners.remove(listener)
+
+    def _read_only(self, *args):
+        raise RuntimeException('LazyGridDataModel is read-only; update the source and call refresh()', self)
+
+    addRow = addRows = insertRow = insertRows = removeRow = removeAllRows = _read_only
+    updateCellData = updateRowData = updateRowHeading = _read_only
+    updateCellToolTip = updateRowToolTip = _read_only
+
+    # --- XComponent / XCloneable ---
+
+    def dispose(self):
+        for listener in list(self._event_listeners):
+            try:
+                listener.disposing(uno.createUnoStruct('com.sun.star.lang.EventObject', self))
+            except Exception:
+                pass
+        self._event_listeners = []
+        self._data_listeners = []
+        self._pages.clear()
+
+    def addEventListener(self, listener):
+        self._event_listeners.append(listener)
+
+    def removeEventListener(self, listener):
+        if listener in self._event_listeners:
+            self._event_listeners.remove(listener)
+
+    def createClone(self):
+        clone = LazyGridDataModel(self.grid_base, self.source, self.heading, self.page_size, self.max_pages)
+        clone.sort = self.sort
+        return clone
+
+    # --- Paging ---
+
+    def refresh(self):
+        '''Re-read the row count and drop cached pages (after the data changed).'''
+        old_count = self.RowCount
+        refresh = getattr(self.source, 'refresh', None)
+        if refresh is not None:
+            refresh()
+        self._pages.clear()
+        self._row_count = None
+        new_count = self.RowCount
+        if new_count < old_count:
+            self._notify('rowsRemoved', new_count, old_count - 1)
+        elif new_count > old_count:
+            self._notify('rowsInserted', old_count, new_count - 1)
+        self._notify('dataChanged', 0, new_count - 1)
+
+    def _row(self, row):
+        if row < 0 or row >= self.RowCount:
+            raise IndexOutOfBoundsException('row %s out of range' % row, self)
+        page_index, pos = divmod(row, self.page_size)
+        page = self._pages.get(page_index)
+        if page is None:
+            page = self._load_page(page_index)
+        else:
+            self._pages.move_to_end(page_index)
+        if pos < len(page):
+            return page[pos]
+        # The source shrank since it was counted; show an empty row
+        return ('', tuple([None] * len(self.grid_base.titles)))
+
+    def _load_page(self, page_index):
+        sort_key, ascending = None, True
+        if self.sort is not None:
+            sort_key = self.grid_base.titles[self.sort[0]][1]
+            ascending = self.sort[1]
+        data = self.source.fetch(page_index * self.page_size, self.page_size, sort_key, ascending) or []
+        titles = self.grid_base.titles
+        page = []
+        for offset, data_row in enumerate(data):
+            if self.heading:
+                row_heading = data_row[self.heading]
+            else:
+                row_heading = "%s" % (page_index * self.page_size + offset)
+            page.append((row_heading, tuple([self.grid_base.data_value(data_row, t) for t in titles])))
+        self._pages[page_index] = page
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+        return page
+
+    def _notify(self, method, row_first=0, row_last=None):
+        if row_last is None:
+            row_last = self.RowCount - 1
+        event = uno.createUnoStruct('com.sun.star.awt.grid.GridDataEvent')
+        event.Source = self
+        event.ColumnFirst = -1
+        event.ColumnLast = -1
+        event.RowFirst = row_first
+        event.RowLast = row_last
+        for listener in list(self._data_listeners):
+            try:
+                getattr(listener, method)(event)
+            except Exception:
+                logger.error('Grid data listener failed on %s' % method)